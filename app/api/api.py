@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 
-from app.api.endpoints import auth, users, events, venues, reviews, categories
+from app.api.endpoints import auth, users, events, venues, reviews, categories, nearby, batch, exports, admin
 
 api_router = APIRouter()
 
@@ -9,4 +9,8 @@ api_router.include_router(users.router, prefix="/users", tags=["users"])
 api_router.include_router(events.router, prefix="/events", tags=["events"])
 api_router.include_router(venues.router, prefix="/venues", tags=["venues"])
 api_router.include_router(reviews.router, prefix="/reviews", tags=["reviews"])
-api_router.include_router(categories.router, prefix="/categories", tags=["categories"]) 
\ No newline at end of file
+api_router.include_router(categories.router, prefix="/categories", tags=["categories"]) 
+api_router.include_router(nearby.router, prefix="/nearby", tags=["nearby"])
+api_router.include_router(batch.router, prefix="/batch", tags=["batch"])
+api_router.include_router(exports.router, prefix="/exports", tags=["exports"])
+api_router.include_router(admin.router, prefix="/admin", tags=["admin"])
\ No newline at end of file
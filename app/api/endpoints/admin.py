@@ -0,0 +1,85 @@
+from typing import Annotated, Optional
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.core.config import get_settings
+from app.core.deps import get_database, get_current_admin_user
+from app.core.profiler import (
+    create_profile_token,
+    folded_profiles,
+    profile_routes,
+    profiler,
+    set_profiling,
+)
+from app.models.profiling import ProfileToken, ProfilingStatus, ProfilingUpdate
+
+settings = get_settings()
+
+router = APIRouter()
+
+
+async def profiling_status(db: AsyncIOMotorDatabase) -> dict:
+    return {**profiler.stats(), "routes": await profile_routes(db)}
+
+
+@router.get("/profiling", response_model=ProfilingStatus)
+async def read_profiling(
+    current_user: Annotated[dict, Depends(get_current_admin_user)],
+    db: Annotated[AsyncIOMotorDatabase, Depends(get_database)]
+):
+    return await profiling_status(db)
+
+
+@router.put("/profiling", response_model=ProfilingStatus)
+async def enable_profiling(
+    update: Annotated[ProfilingUpdate, Body(...)],
+    current_user: Annotated[dict, Depends(get_current_admin_user)],
+    db: Annotated[AsyncIOMotorDatabase, Depends(get_database)]
+):
+    if not settings.PROFILER_ENABLED:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Profiling is disabled in this deployment"
+        )
+    if update.duration_seconds > settings.PROFILER_MAX_DURATION_SECONDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Profiling can run for at most {settings.PROFILER_MAX_DURATION_SECONDS} seconds"
+        )
+    await set_profiling(db, update.duration_seconds, update.sample_rate)
+    return await profiling_status(db)
+
+
+@router.delete("/profiling", response_model=ProfilingStatus)
+async def disable_profiling(
+    current_user: Annotated[dict, Depends(get_current_admin_user)],
+    db: Annotated[AsyncIOMotorDatabase, Depends(get_database)]
+):
+    await set_profiling(db, 0, 0.0)
+    return await profiling_status(db)
+
+
+@router.post("/profiling/token", response_model=ProfileToken)
+async def issue_profile_token(
+    current_user: Annotated[dict, Depends(get_current_admin_user)]
+):
+    return create_profile_token(settings.PROFILER_TOKEN_TTL_SECONDS)
+
+
+@router.get("/profiling/profiles", response_class=PlainTextResponse)
+async def read_profiles(
+    current_user: Annotated[dict, Depends(get_current_admin_user)],
+    db: Annotated[AsyncIOMotorDatabase, Depends(get_database)],
+    route: Annotated[Optional[str], Query(None, max_length=256)]
+):
+    return PlainTextResponse(await folded_profiles(db, route))
+
+
+@router.delete("/profiling/profiles", status_code=status.HTTP_200_OK)
+async def clear_profiles(
+    current_user: Annotated[dict, Depends(get_current_admin_user)],
+    db: Annotated[AsyncIOMotorDatabase, Depends(get_database)]
+):
+    result = await db.profiles.delete_many({})
+    return {"message": f"Deleted {result.deleted_count} profile stacks"}
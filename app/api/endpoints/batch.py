@@ -0,0 +1,57 @@
+from typing import Annotated, List
+from fastapi import APIRouter, Body, Depends, HTTPException, status
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.core.config import get_settings
+from app.core.deps import get_database, get_current_admin_user, get_current_organizer_or_admin_user
+from app.crud.bulk import bulk_create_events, bulk_create_venues, bulk_register_attendees
+from app.models.batch import AttendeeRegistration, BatchResult
+from app.models.event import EventCreate
+from app.models.venue import VenueCreate
+
+settings = get_settings()
+
+router = APIRouter()
+
+
+def check_batch_size(items: list, max_size: int) -> None:
+    if not items:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Batch must contain at least one item"
+        )
+    if len(items) > max_size:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Batch size exceeds the limit of {max_size} items"
+        )
+
+
+@router.post("/events", response_model=BatchResult)
+async def create_events_batch(
+    events: Annotated[List[EventCreate], Body(...)],
+    current_user: Annotated[dict, Depends(get_current_organizer_or_admin_user)],
+    db: Annotated[AsyncIOMotorDatabase, Depends(get_database)]
+):
+    check_batch_size(events, settings.BATCH_MAX_EVENTS)
+    return await bulk_create_events(db, current_user, events)
+
+
+@router.post("/venues", response_model=BatchResult)
+async def create_venues_batch(
+    venues: Annotated[List[VenueCreate], Body(...)],
+    current_user: Annotated[dict, Depends(get_current_admin_user)],
+    db: Annotated[AsyncIOMotorDatabase, Depends(get_database)]
+):
+    check_batch_size(venues, settings.BATCH_MAX_VENUES)
+    return await bulk_create_venues(db, venues)
+
+
+@router.post("/registrations", response_model=BatchResult)
+async def register_attendees_batch(
+    registrations: Annotated[List[AttendeeRegistration], Body(...)],
+    current_user: Annotated[dict, Depends(get_current_admin_user)],
+    db: Annotated[AsyncIOMotorDatabase, Depends(get_database)]
+):
+    check_batch_size(registrations, settings.BATCH_MAX_REGISTRATIONS)
+    return await bulk_register_attendees(db, registrations)
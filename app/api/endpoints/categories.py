@@ -0,0 +1,76 @@
+from typing import Annotated, List
+from fastapi import APIRouter, Body, Depends, HTTPException, Path, Request, Response, status
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.core.deps import get_database, get_current_admin_user
+from app.core.http_cache import conditional_response, document_etag, list_etag, public_cache
+from app.crud.category import create_category, get_categories, get_category, update_category
+from app.models.event import Category, CategoryCreate, CategoryUpdate
+
+router = APIRouter()
+
+
+@router.get("", response_model=List[Category])
+async def read_categories(
+    request: Request,
+    response: Response,
+    db: Annotated[AsyncIOMotorDatabase, Depends(get_database)]
+):
+    categories = await get_categories(db)
+    return conditional_response(
+        request,
+        response,
+        List[Category],
+        categories,
+        list_etag(categories),
+        cache_control=public_cache()
+    )
+
+
+@router.get("/{category_id}", response_model=Category)
+async def read_category(
+    request: Request,
+    response: Response,
+    category_id: Annotated[str, Path(...)],
+    db: Annotated[AsyncIOMotorDatabase, Depends(get_database)]
+):
+    category = await get_category(db, category_id)
+    if not category:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Category with ID {category_id} not found"
+        )
+    return conditional_response(
+        request,
+        response,
+        Category,
+        category,
+        document_etag(category),
+        category.get("updated_at"),
+        cache_control=public_cache()
+    )
+
+
+@router.post("", response_model=Category, status_code=status.HTTP_201_CREATED)
+async def create_new_category(
+    category_data: Annotated[CategoryCreate, Body(...)],
+    current_user: Annotated[dict, Depends(get_current_admin_user)],
+    db: Annotated[AsyncIOMotorDatabase, Depends(get_database)]
+):
+    return await create_category(db, category_data)
+
+
+@router.put("/{category_id}", response_model=Category)
+async def update_existing_category(
+    category_id: Annotated[str, Path(...)],
+    category_data: Annotated[CategoryUpdate, Body(...)],
+    current_user: Annotated[dict, Depends(get_current_admin_user)],
+    db: Annotated[AsyncIOMotorDatabase, Depends(get_database)]
+):
+    category = await update_category(db, category_id, category_data)
+    if not category:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Category with ID {category_id} not found"
+        )
+    return category
@@ -0,0 +1,205 @@
+from typing import Annotated, List, Optional
+from fastapi import APIRouter, Body, Depends, HTTPException, Path, Request, Response, status
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.core.deps import (
+    get_database,
+    get_current_user,
+    get_current_organizer_or_admin_user,
+    get_user_loader,
+    event_filter_params,
+    pagination_params,
+)
+from app.core.http_cache import conditional_response, document_etag, list_etag, public_cache
+from app.crud.attendee import get_event_attendees_page, register_attendee, unregister_attendee
+from app.crud.event import get_event, get_events_page
+from app.crud.loader import UserLoader
+from app.crud.rating import get_rating_summary
+from app.crud.review import create_review, get_event_reviews_page
+from app.models.event import Event, EventAttendee, EventAttendeeResponse, EventList
+from app.models.user import UserRole
+from app.models.review import EventRatingSummary, Review, ReviewCreate, ReviewList
+
+router = APIRouter()
+
+
+@router.get("", response_model=EventList)
+async def read_events(
+    request: Request,
+    response: Response,
+    db: Annotated[AsyncIOMotorDatabase, Depends(get_database)],
+    pagination: Annotated[dict, Depends(pagination_params)],
+    filters: Annotated[dict, Depends(event_filter_params)]
+):
+    filters["is_private"] = {"$ne": True}
+    page = await get_events_page(
+        db,
+        filters,
+        pagination["limit"],
+        pagination["offset"],
+        pagination["cursor"],
+        total_mode=pagination["total_mode"] or "none"
+    )
+    return conditional_response(
+        request,
+        response,
+        EventList,
+        {"limit": pagination["limit"], "offset": pagination["offset"], **page},
+        list_etag(page["items"], page["next_cursor"], page["total"]),
+        cache_control=public_cache()
+    )
+
+
+@router.get("/{event_id}", response_model=Event)
+async def read_event(
+    request: Request,
+    response: Response,
+    event_id: Annotated[str, Path(...)],
+    db: Annotated[AsyncIOMotorDatabase, Depends(get_database)]
+):
+    event = await get_event(db, event_id)
+    if not event or event.get("is_private"):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Event with ID {event_id} not found"
+        )
+    return conditional_response(
+        request,
+        response,
+        Event,
+        event,
+        document_etag(event),
+        event.get("updated_at"),
+        cache_control=public_cache()
+    )
+
+
+@router.post("/{event_id}/register", response_model=EventAttendee, status_code=status.HTTP_201_CREATED)
+async def register_for_event(
+    event_id: Annotated[str, Path(...)],
+    current_user: Annotated[dict, Depends(get_current_user)],
+    db: Annotated[AsyncIOMotorDatabase, Depends(get_database)]
+):
+    return await register_attendee(db, event_id, current_user["id"])
+
+
+@router.delete("/{event_id}/register", status_code=status.HTTP_204_NO_CONTENT)
+async def unregister_from_event(
+    event_id: Annotated[str, Path(...)],
+    current_user: Annotated[dict, Depends(get_current_user)],
+    db: Annotated[AsyncIOMotorDatabase, Depends(get_database)]
+):
+    if not await unregister_attendee(db, event_id, current_user["id"]):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Not registered for this event"
+        )
+    return None
+
+
+@router.get("/{event_id}/attendees", response_model=List[EventAttendeeResponse])
+async def read_event_attendees(
+    request: Request,
+    response: Response,
+    event_id: Annotated[str, Path(...)],
+    current_user: Annotated[dict, Depends(get_current_organizer_or_admin_user)],
+    db: Annotated[AsyncIOMotorDatabase, Depends(get_database)],
+    loader: Annotated[UserLoader, Depends(get_user_loader)],
+    pagination: Annotated[dict, Depends(pagination_params)]
+):
+    event = await get_event(db, event_id)
+    if not event:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Event with ID {event_id} not found"
+        )
+    if current_user["role"] != UserRole.ADMIN and event.get("organizer_id") != current_user["id"]:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="The user doesn't have enough privileges"
+        )
+
+    page = await get_event_attendees_page(
+        db,
+        event_id,
+        loader,
+        pagination["limit"],
+        pagination["offset"],
+        pagination["cursor"],
+        total_mode=pagination["total_mode"] or "none"
+    )
+    headers = {"X-Next-Cursor": page["next_cursor"]} if page["next_cursor"] else {}
+    if page["total"] is not None:
+        headers["X-Total-Count"] = str(page["total"])
+        headers["X-Total-Is-Estimate"] = str(page["total_is_estimate"]).lower()
+    return conditional_response(
+        request,
+        response,
+        List[EventAttendeeResponse],
+        page["items"],
+        list_etag(
+            page["items"],
+            page["next_cursor"],
+            page["total"],
+            event.get("version", ""),
+            *((attendee["username"], attendee.get("full_name")) for attendee in page["items"])
+        ),
+        headers=headers
+    )
+
+
+@router.post("/{event_id}/reviews", response_model=Review, status_code=status.HTTP_201_CREATED)
+async def create_event_review(
+    event_id: Annotated[str, Path(...)],
+    rating: Annotated[int, Body(..., ge=1, le=5)],
+    current_user: Annotated[dict, Depends(get_current_user)],
+    db: Annotated[AsyncIOMotorDatabase, Depends(get_database)],
+    comment: Annotated[Optional[str], Body(min_length=1, max_length=1000)] = None
+):
+    review = await create_review(db, current_user, ReviewCreate(event_id=event_id, rating=rating, comment=comment))
+    if not review:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Event with ID {event_id} not found"
+        )
+    return review
+
+
+@router.get("/{event_id}/reviews", response_model=ReviewList)
+async def read_event_reviews(
+    request: Request,
+    response: Response,
+    event_id: Annotated[str, Path(...)],
+    db: Annotated[AsyncIOMotorDatabase, Depends(get_database)],
+    pagination: Annotated[dict, Depends(pagination_params)]
+):
+    page = await get_event_reviews_page(
+        db,
+        event_id,
+        pagination["limit"],
+        pagination["offset"],
+        pagination["cursor"],
+        total_mode=pagination["total_mode"] or "none"
+    )
+    return conditional_response(
+        request,
+        response,
+        ReviewList,
+        {"limit": pagination["limit"], "offset": pagination["offset"], **page},
+        list_etag(page["items"], page["next_cursor"], page["total"]),
+        cache_control=public_cache()
+    )
+
+
+@router.get("/{event_id}/rating", response_model=EventRatingSummary)
+async def read_event_rating(
+    event_id: Annotated[str, Path(...)],
+    db: Annotated[AsyncIOMotorDatabase, Depends(get_database)]
+):
+    summary = await get_rating_summary(db, event_id)
+    if summary is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Event with ID {event_id} not found"
+        )
+    return summary
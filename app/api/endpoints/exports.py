@@ -0,0 +1,109 @@
+from typing import Annotated, Optional
+from bson import ObjectId
+from bson.errors import InvalidId
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
+from fastapi.responses import StreamingResponse
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.core.deps import get_database, get_current_user, get_current_organizer_or_admin_user, get_user_loader
+from app.crud.loader import UserLoader
+from app.crud.export import (
+    ATTENDEE_COLUMNS,
+    EVENT_COLUMNS,
+    MEDIA_TYPES,
+    REVIEW_COLUMNS,
+    RowEncoder,
+    export_attendees,
+    export_events,
+    export_reviews,
+    review_row,
+    stream_export,
+    with_id,
+)
+from app.models.user import UserRole
+
+router = APIRouter()
+
+ExportFormat = Annotated[str, Query("ndjson", pattern="^(ndjson|csv)$")]
+ExportCursor = Annotated[Optional[str], Query(None, max_length=512)]
+
+
+def export_response(documents, to_row, columns, export_format: str, filename: str) -> StreamingResponse:
+    encoder = RowEncoder(columns, export_format)
+    return StreamingResponse(
+        stream_export(documents, to_row, encoder),
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{export_format}"'}
+    )
+
+
+async def get_event_or_404(db: AsyncIOMotorDatabase, event_id: str) -> dict:
+    try:
+        event = await db.events.find_one({"_id": ObjectId(event_id)}, {"organizer_id": 1})
+    except InvalidId:
+        event = None
+    if not event:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Event with ID {event_id} not found"
+        )
+    return event
+
+
+@router.get("/events/{event_id}/attendees")
+async def export_event_attendees(
+    event_id: Annotated[str, Path(...)],
+    current_user: Annotated[dict, Depends(get_current_organizer_or_admin_user)],
+    db: Annotated[AsyncIOMotorDatabase, Depends(get_database)],
+    loader: Annotated[UserLoader, Depends(get_user_loader)],
+    format: ExportFormat,
+    cursor: ExportCursor
+):
+    event = await get_event_or_404(db, event_id)
+    if current_user["role"] != UserRole.ADMIN and event.get("organizer_id") != current_user["id"]:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="The user doesn't have enough privileges"
+        )
+
+    return export_response(
+        export_attendees(db, event_id, cursor, loader),
+        dict,
+        ATTENDEE_COLUMNS,
+        format,
+        f"event-{event_id}-attendees"
+    )
+
+
+@router.get("/events/{event_id}/reviews")
+async def export_event_reviews(
+    event_id: Annotated[str, Path(...)],
+    current_user: Annotated[dict, Depends(get_current_user)],
+    db: Annotated[AsyncIOMotorDatabase, Depends(get_database)],
+    format: ExportFormat,
+    cursor: ExportCursor
+):
+    await get_event_or_404(db, event_id)
+    return export_response(
+        export_reviews(db, event_id, cursor),
+        review_row,
+        REVIEW_COLUMNS,
+        format,
+        f"event-{event_id}-reviews"
+    )
+
+
+@router.get("/users/me/events")
+async def export_my_events(
+    current_user: Annotated[dict, Depends(get_current_organizer_or_admin_user)],
+    db: Annotated[AsyncIOMotorDatabase, Depends(get_database)],
+    format: ExportFormat,
+    cursor: ExportCursor
+):
+    return export_response(
+        export_events(db, current_user["id"], cursor),
+        with_id,
+        EVENT_COLUMNS,
+        format,
+        "my-events"
+    )
@@ -0,0 +1,19 @@
+from fastapi import APIRouter, status
+from fastapi.responses import JSONResponse
+
+from app.db.mongodb import get_pool_stats, is_ready, readiness
+
+router = APIRouter()
+
+
+@router.get("/live")
+async def liveness():
+    return {"status": "ok"}
+
+
+@router.get("/ready")
+async def readiness_check():
+    content = {"ready": is_ready(), **readiness, "pool": get_pool_stats()}
+    if not content["ready"]:
+        return JSONResponse(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content=content)
+    return content
@@ -0,0 +1,96 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+
+from app.core import metrics
+from app.core.deps import verify_metrics_access
+from app.core.hashing import hashing_executor
+from app.crud.counts import count_cache
+from app.crud.geo import geo_cache
+from app.crud.reference import get_reference_cache_stats
+from app.crud.user import user_cache
+from app.db.mongodb import get_pool_stats
+
+router = APIRouter(dependencies=[Depends(verify_metrics_access)])
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("", response_class=PlainTextResponse, include_in_schema=False)
+async def read_metrics():
+    writer = metrics.PrometheusWriter()
+
+    writer.gauge("http_requests_in_flight", "Requests currently being served", metrics.in_flight_requests)
+    writer.histogram(
+        "http_request_duration_seconds",
+        "Request latency by route template",
+        ("method", "route"),
+        metrics.request_latency
+    )
+    writer.counter(
+        "http_responses_total",
+        "Responses by route template and status code",
+        ("method", "route", "status"),
+        metrics.request_statuses
+    )
+
+    writer.histogram(
+        "mongodb_command_duration_seconds",
+        "MongoDB command latency by command and collection",
+        ("command", "collection"),
+        metrics.mongo_command_latency
+    )
+    writer.counter(
+        "mongodb_command_failures_total",
+        "Failed MongoDB commands by command and collection",
+        ("command", "collection"),
+        metrics.mongo_command_failures
+    )
+    pool = get_pool_stats()
+    writer.gauge("mongodb_pool_open_connections", "Open pooled connections", pool["open_connections"])
+    writer.gauge("mongodb_pool_checked_out", "Connections checked out of the pool", pool["checked_out"])
+    writer.gauge("mongodb_pool_waiting", "Operations waiting for a pooled connection", pool["waiting"])
+    writer.samples(
+        "mongodb_pool_checkout_failures_total",
+        "counter",
+        "Failed connection checkouts by reason",
+        ("reason",),
+        [((reason,), count) for reason, count in pool["checkout_failures"].items()]
+    )
+
+    writer.histogram(
+        "password_hash_duration_seconds",
+        "bcrypt hashing and verification time",
+        ("operation",),
+        metrics.password_hash_latency
+    )
+    hashing = hashing_executor.stats()
+    writer.gauge("password_hash_queue_depth", "Password hash calls waiting for a worker", hashing["queue_depth"])
+    writer.samples(
+        "password_hash_rejected_total",
+        "counter",
+        "Password hash calls rejected because the queue was full",
+        (),
+        [((), hashing["rejected"])]
+    )
+
+    caches = {
+        "users": user_cache.stats(),
+        "counts": count_cache.stats(),
+        "geo": geo_cache.stats(),
+    }
+    caches.update({f"reference_{name}": stats for name, stats in get_reference_cache_stats().items()})
+    for name, kind, help_text in (
+        ("hits", "counter", "Cache hits"),
+        ("misses", "counter", "Cache misses"),
+        ("hit_rate", "gauge", "Cache hit rate since start"),
+        ("size", "gauge", "Cached entries"),
+    ):
+        writer.samples(
+            f"cache_{name}" + ("_total" if kind == "counter" else ""),
+            kind,
+            help_text,
+            ("cache",),
+            [((cache,), stats[name]) for cache, stats in caches.items()]
+        )
+
+    return PlainTextResponse(writer.render(), media_type=PROMETHEUS_CONTENT_TYPE)
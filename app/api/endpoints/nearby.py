@@ -0,0 +1,79 @@
+from typing import Annotated, Optional
+from fastapi import APIRouter, Depends, Query, Request, Response
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.core.deps import get_database
+from app.core.http_cache import conditional_response, list_etag, public_cache
+from app.crud.geo import find_events_near, find_venues_in_box, find_venues_near
+from app.models.event import EventNearbyList
+from app.models.venue import VenueNearbyList
+
+router = APIRouter()
+
+
+@router.get("/venues", response_model=VenueNearbyList)
+async def read_venues_near(
+    request: Request,
+    response: Response,
+    db: Annotated[AsyncIOMotorDatabase, Depends(get_database)],
+    lng: Annotated[float, Query(..., ge=-180, le=180)],
+    lat: Annotated[float, Query(..., ge=-90, le=90)],
+    radius: Annotated[float, Query(5000, gt=0)],
+    limit: Annotated[int, Query(10, ge=1, le=100)],
+    cursor: Annotated[Optional[str], Query(None, max_length=512)]
+):
+    page = await find_venues_near(db, lng, lat, radius, limit, cursor)
+    return conditional_response(
+        request,
+        response,
+        VenueNearbyList,
+        {"limit": limit, **page},
+        list_etag(page["items"], page["next_cursor"]),
+        cache_control=public_cache()
+    )
+
+
+@router.get("/venues/box", response_model=VenueNearbyList)
+async def read_venues_in_box(
+    request: Request,
+    response: Response,
+    db: Annotated[AsyncIOMotorDatabase, Depends(get_database)],
+    west: Annotated[float, Query(..., ge=-180, le=180)],
+    south: Annotated[float, Query(..., ge=-90, le=90)],
+    east: Annotated[float, Query(..., ge=-180, le=180)],
+    north: Annotated[float, Query(..., ge=-90, le=90)],
+    limit: Annotated[int, Query(10, ge=1, le=100)],
+    cursor: Annotated[Optional[str], Query(None, max_length=512)]
+):
+    page = await find_venues_in_box(db, west, south, east, north, limit, cursor)
+    return conditional_response(
+        request,
+        response,
+        VenueNearbyList,
+        {"limit": limit, **page},
+        list_etag(page["items"], page["next_cursor"]),
+        cache_control=public_cache()
+    )
+
+
+@router.get("/events", response_model=EventNearbyList)
+async def read_events_near(
+    request: Request,
+    response: Response,
+    db: Annotated[AsyncIOMotorDatabase, Depends(get_database)],
+    lng: Annotated[float, Query(..., ge=-180, le=180)],
+    lat: Annotated[float, Query(..., ge=-90, le=90)],
+    radius: Annotated[float, Query(5000, gt=0)],
+    limit: Annotated[int, Query(10, ge=1, le=100)],
+    cursor: Annotated[Optional[str], Query(None, max_length=512)],
+    upcoming_only: bool = True
+):
+    page = await find_events_near(db, lng, lat, radius, limit, cursor, upcoming_only)
+    return conditional_response(
+        request,
+        response,
+        EventNearbyList,
+        {"limit": limit, **page},
+        list_etag(page["items"], page["next_cursor"]),
+        cache_control=public_cache()
+    )
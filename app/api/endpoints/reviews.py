@@ -0,0 +1,82 @@
+from typing import Annotated
+from fastapi import APIRouter, Body, Depends, HTTPException, Path, Request, Response, status
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.core.deps import get_database, get_current_user
+from app.core.http_cache import conditional_response, document_etag, public_cache
+from app.crud.review import delete_review, get_review, update_review
+from app.models.review import Review, ReviewUpdate
+from app.models.user import UserRole
+
+router = APIRouter()
+
+
+async def get_own_review_or_404(db: AsyncIOMotorDatabase, review_id: str, current_user: dict) -> dict:
+    review = await get_review(db, review_id)
+    if not review:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Review with ID {review_id} not found"
+        )
+    if current_user["role"] != UserRole.ADMIN and review["author"]["id"] != current_user["id"]:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="The user doesn't have enough privileges"
+        )
+    return review
+
+
+@router.get("/{review_id}", response_model=Review)
+async def read_review(
+    request: Request,
+    response: Response,
+    review_id: Annotated[str, Path(...)],
+    db: Annotated[AsyncIOMotorDatabase, Depends(get_database)]
+):
+    review = await get_review(db, review_id)
+    if not review:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Review with ID {review_id} not found"
+        )
+    return conditional_response(
+        request,
+        response,
+        Review,
+        review,
+        document_etag(review),
+        review.get("updated_at"),
+        cache_control=public_cache()
+    )
+
+
+@router.put("/{review_id}", response_model=Review)
+async def update_existing_review(
+    review_id: Annotated[str, Path(...)],
+    review_data: Annotated[ReviewUpdate, Body(...)],
+    current_user: Annotated[dict, Depends(get_current_user)],
+    db: Annotated[AsyncIOMotorDatabase, Depends(get_database)]
+):
+    await get_own_review_or_404(db, review_id, current_user)
+    review = await update_review(db, review_id, review_data)
+    if not review:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Review with ID {review_id} not found"
+        )
+    return review
+
+
+@router.delete("/{review_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_existing_review(
+    review_id: Annotated[str, Path(...)],
+    current_user: Annotated[dict, Depends(get_current_user)],
+    db: Annotated[AsyncIOMotorDatabase, Depends(get_database)]
+):
+    await get_own_review_or_404(db, review_id, current_user)
+    if not await delete_review(db, review_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Review with ID {review_id} not found"
+        )
+    return None
@@ -1,10 +1,11 @@
 from typing import Annotated, List
-from fastapi import APIRouter, Depends, HTTPException, Path, status, Body
+from fastapi import APIRouter, Depends, HTTPException, Path, Request, Response, status, Body
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
 from app.core.deps import get_database, get_current_user, get_current_admin_user, pagination_params
-from app.crud.user import get_user_by_id, get_users, update_user, delete_user
-from app.crud.event import get_user_events, get_user_events_count
+from app.core.http_cache import conditional_response, document_etag, list_etag, public_cache
+from app.crud.user import get_user_by_id, get_users_page, update_user, delete_user
+from app.crud.event import get_user_events_page
 from app.models.user import User, UserUpdate, UserPublic
 from app.models.event import EventList
 
@@ -13,9 +14,18 @@ router = APIRouter()
 
 @router.get("/me", response_model=User)
 async def read_users_me(
+    request: Request,
+    response: Response,
     current_user: Annotated[dict, Depends(get_current_user)]
 ):
-    return current_user
+    return conditional_response(
+        request,
+        response,
+        User,
+        current_user,
+        document_etag(current_user),
+        current_user.get("updated_at")
+    )
 
 
 @router.put("/me", response_model=User)
@@ -41,33 +51,35 @@ async def update_user_me(
 
 @router.get("/me/events", response_model=EventList)
 async def read_users_me_events(
+    request: Request,
+    response: Response,
     current_user: Annotated[dict, Depends(get_current_user)],
     db: Annotated[AsyncIOMotorDatabase, Depends(get_database)],
     pagination: Annotated[dict, Depends(pagination_params)],
     as_organizer: bool = False
 ):
-    user_id = current_user["id"]
-    
-    events = await get_user_events(
-        db, 
-        user_id, 
-        pagination["limit"], 
-        pagination["offset"], 
-        as_organizer
+    page = await get_user_events_page(
+        db,
+        current_user["id"],
+        pagination["limit"],
+        pagination["offset"],
+        pagination["cursor"],
+        as_organizer,
+        total_mode=pagination["total_mode"] or "exact"
+    )
+    return conditional_response(
+        request,
+        response,
+        EventList,
+        {"limit": pagination["limit"], "offset": pagination["offset"], **page},
+        list_etag(page["items"], page["next_cursor"], page["total"], pagination["limit"], pagination["offset"])
     )
-    
-    total = await get_user_events_count(db, user_id, as_organizer)
-    
-    return {
-        "total": total,
-        "limit": pagination["limit"],
-        "offset": pagination["offset"],
-        "items": events
-    }
 
 
 @router.get("/{user_id}", response_model=UserPublic)
 async def read_user(
+    request: Request,
+    response: Response,
     user_id: Annotated[str, Path(...)],
     db: Annotated[AsyncIOMotorDatabase, Depends(get_database)]
 ):
@@ -77,21 +89,44 @@ async def read_user(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"User with ID {user_id} not found"
         )
-    return user
+    return conditional_response(
+        request,
+        response,
+        UserPublic,
+        user,
+        document_etag(user),
+        user.get("updated_at"),
+        cache_control=public_cache()
+    )
 
 
 @router.get("", response_model=List[UserPublic])
 async def read_users(
+    request: Request,
+    response: Response,
     db: Annotated[AsyncIOMotorDatabase, Depends(get_database)],
     pagination: Annotated[dict, Depends(pagination_params)],
     current_user: Annotated[dict, Depends(get_current_admin_user)]
 ):
-    users = await get_users(
+    page = await get_users_page(
         db, 
-        pagination["offset"], 
-        pagination["limit"]
+        pagination["limit"], 
+        pagination["offset"],
+        pagination["cursor"],
+        total_mode=pagination["total_mode"] or "none"
+    )
+    headers = {"X-Next-Cursor": page["next_cursor"]} if page["next_cursor"] else {}
+    if page["total"] is not None:
+        headers["X-Total-Count"] = str(page["total"])
+        headers["X-Total-Is-Estimate"] = str(page["total_is_estimate"]).lower()
+    return conditional_response(
+        request,
+        response,
+        List[UserPublic],
+        page["items"],
+        list_etag(page["items"], page["next_cursor"], page["total"]),
+        headers=headers
     )
-    return users
 
 
 @router.put("/{user_id}", response_model=User)
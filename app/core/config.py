@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, List, Optional, Tuple
 from datetime import timedelta
 from functools import lru_cache
 
@@ -14,12 +14,90 @@ class Settings(BaseSettings):
     
     MONGODB_URL: str
     MONGODB_DB_NAME: str
+    MONGODB_MAX_POOL_SIZE: int = 100
+    MONGODB_MIN_POOL_SIZE: int = 0
+    MONGODB_MAX_IDLE_TIME_MS: Optional[int] = None
+    MONGODB_WAIT_QUEUE_TIMEOUT_MS: int = 1000
+    MONGODB_SERVER_SELECTION_TIMEOUT_MS: int = 5000
+    MONGODB_CONNECT_TIMEOUT_MS: int = 5000
+    MONGODB_SOCKET_TIMEOUT_MS: Optional[int] = None
+    MONGODB_COMPRESSORS: str = ""
+    MONGODB_ZLIB_COMPRESSION_LEVEL: Optional[int] = None
+    MONGODB_LIST_MAX_TIME_MS: int = 2000
     
     SECRET_KEY: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     
     CORS_ORIGINS: List[str] = ["*"]
     
+    SERVER_HOST: str = "0.0.0.0"
+    SERVER_PORT: int = 8000
+    SERVER_WORKERS: Optional[int] = None
+    SERVER_MAX_WORKERS: int = 8
+    SERVER_DRAIN_SECONDS: float = 5.0
+    SERVER_GRACEFUL_TIMEOUT_SECONDS: int = 30
+    READINESS_WARMUP_TIMEOUT_SECONDS: float = 30.0
+    READINESS_RECHECK_SECONDS: float = 10.0
+    INDEXES_CREATE_REQUIRED_ON_STARTUP: bool = True
+    
+    METRICS_ENABLED: bool = True
+    METRICS_TOKEN: Optional[str] = None
+    SLOW_QUERY_MS: int = 100
+    
+    PROFILER_ENABLED: bool = True
+    PROFILER_INTERVAL_MS: float = 5
+    PROFILER_POLL_SECONDS: float = 5
+    PROFILER_MAX_DURATION_SECONDS: int = 900
+    PROFILER_TOKEN_TTL_SECONDS: int = 300
+    
+    MAX_IN_FLIGHT_REQUESTS: int = 256
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_BACKEND: str = "memory"
+    RATE_LIMIT_TRUST_FORWARDED_FOR: bool = False
+    RATE_LIMIT_RULES: Dict[str, Tuple[float, float]] = {
+        "auth": (10, 0.2),
+        "search": (30, 2),
+        "write": (60, 5),
+        "export": (5, 0.05),
+        "default": (120, 20),
+    }
+    
+    FAST_SERIALIZATION: bool = False
+    HTTP_CACHE_PUBLIC_MAX_AGE: int = 30
+    
+    PAGINATION_ESTIMATE_CAP: int = 10000
+    COUNT_CACHE_MAX_SIZE: int = 4096
+    COUNT_CACHE_TTL_SECONDS: int = 30
+    
+    USER_CACHE_MAX_SIZE: int = 10000
+    USER_CACHE_TTL_SECONDS: int = 300
+    USER_CACHE_STALE_SECONDS: int = 5
+    
+    PASSWORD_HASH_EXECUTOR: str = "thread"
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_QUEUE: int = 64
+    PASSWORD_HASH_FAIL_FAST: bool = True
+    
+    READ_MODEL_BATCH_SIZE: int = 500
+    
+    BATCH_MAX_EVENTS: int = 500
+    BATCH_MAX_VENUES: int = 500
+    BATCH_MAX_REGISTRATIONS: int = 1000
+    
+    EXPORT_BATCH_SIZE: int = 1000
+    EXPORT_TIME_BUDGET_SECONDS: int = 55
+    
+    REFERENCE_CACHE_ENABLED: bool = True
+    REFERENCE_CACHE_POLL_SECONDS: float = 2.0
+    REFERENCE_CHANGES_TTL_SECONDS: int = 86400
+    
+    GEO_MAX_RADIUS_METERS: int = 50000
+    GEO_MAX_CANDIDATES: int = 1000
+    GEO_MAX_EVENTS_PER_VENUE: int = 50
+    GEO_CELL_DECIMALS: int = 3
+    GEO_CACHE_MAX_SIZE: int = 1024
+    GEO_CACHE_TTL_SECONDS: int = 30
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
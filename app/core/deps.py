@@ -1,15 +1,18 @@
+import hmac
 from typing import Annotated, Dict, Optional
 from jose import JWTError, jwt
 from datetime import datetime
 
-from fastapi import Depends, HTTPException, Query, status
+from fastapi import Depends, HTTPException, Query, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
 from app.core.config import get_settings
 from app.db.mongodb import get_database
 from app.models.user import UserRole
-from app.crud.user import get_user_by_id
+from app.crud.loader import UserLoader
+from app.crud.search import lookup_filter, text_search_filter
+from app.crud.user import get_cached_user
 
 settings = get_settings()
 
@@ -34,13 +37,19 @@ async def get_current_user(
     except JWTError:
         raise credentials_exception
     
-    user = await get_user_by_id(db, user_id)
+    user = await get_cached_user(db, user_id)
     if user is None:
         raise credentials_exception
     
     return user
 
 
+async def get_user_loader(
+    db: Annotated[AsyncIOMotorDatabase, Depends(get_database)]
+) -> UserLoader:
+    return UserLoader(db)
+
+
 async def get_current_admin_user(
     current_user: Annotated[Dict, Depends(get_current_user)]
 ) -> Dict:
@@ -52,6 +61,22 @@ async def get_current_admin_user(
     return current_user
 
 
+async def verify_metrics_access(
+    request: Request,
+    db: Annotated[AsyncIOMotorDatabase, Depends(get_database)]
+) -> None:
+    scheme, _, credentials = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not credentials:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    if settings.METRICS_TOKEN and hmac.compare_digest(credentials.encode(), settings.METRICS_TOKEN.encode()):
+        return
+    await get_current_admin_user(await get_current_user(credentials, db))
+
+
 async def get_current_organizer_or_admin_user(
     current_user: Annotated[Dict, Depends(get_current_user)]
 ) -> Dict:
@@ -65,9 +90,16 @@ async def get_current_organizer_or_admin_user(
 
 async def pagination_params(
     limit: Annotated[int, Query(10, ge=1, le=100)],
-    offset: Annotated[int, Query(0, ge=0)]
+    offset: Annotated[int, Query(0, ge=0)],
+    cursor: Annotated[Optional[str], Query(None, max_length=512)],
+    total_mode: Annotated[Optional[str], Query(None, pattern="^(exact|estimate|none)$")]
 ) -> Dict:
-    return {"limit": limit, "offset": offset}
+    return {
+        "limit": limit,
+        "offset": 0 if cursor else offset,
+        "cursor": cursor,
+        "total_mode": total_mode
+    }
 
 
 async def event_filter_params(
@@ -102,10 +134,7 @@ async def event_filter_params(
         else:
             filters["price"] = {"$gt": 0}
     if search:
-        filters["$or"] = [
-            {"title": {"$regex": search, "$options": "i"}},
-            {"description": {"$regex": search, "$options": "i"}}
-        ]
+        filters["$text"] = text_search_filter(search)
     return filters
 
 
@@ -113,19 +142,16 @@ async def venue_filter_params(
     city: Annotated[Optional[str], Query(None)],
     country: Annotated[Optional[str], Query(None)],
     min_capacity: Annotated[Optional[int], Query(None)],
-    search: Annotated[Optional[str], Query(None)]
+    search: Annotated[Optional[str], Query(None)],
+    location_match: Annotated[str, Query("contains", pattern="^(exact|prefix|contains)$")]
 ) -> Dict:
     filters = {}
     if city:
-        filters["city"] = {"$regex": city, "$options": "i"}
+        filters["city_normalized"] = lookup_filter(city, location_match)
     if country:
-        filters["country"] = {"$regex": country, "$options": "i"}
+        filters["country_normalized"] = lookup_filter(country, location_match)
     if min_capacity:
         filters["capacity"] = {"$gte": min_capacity}
     if search:
-        filters["$or"] = [
-            {"name": {"$regex": search, "$options": "i"}},
-            {"description": {"$regex": search, "$options": "i"}},
-            {"address": {"$regex": search, "$options": "i"}}
-        ]
+        filters["$text"] = text_search_filter(search)
     return filters 
\ No newline at end of file
@@ -0,0 +1,115 @@
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import HTTPException, status
+
+from app.core.config import get_settings
+from app.core.metrics import password_hash_latency
+from app.core.security import get_password_hash, verify_password
+
+settings = get_settings()
+
+
+class HashingExecutor:
+    def __init__(self, mode: str, workers: int, max_queue: int):
+        self.mode = mode
+        self.workers = workers
+        self.max_queue = max_queue
+        self.waiting = 0
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self.queue_seconds_total = 0.0
+        self.run_seconds_total = 0.0
+        self.run_seconds_max = 0.0
+        self._executor: Optional[Executor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.mode == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers,
+                    thread_name_prefix="password-hash"
+                )
+        return self._executor
+
+    async def run(self, func: Callable[..., Any], *args: Any, fail_fast: bool = False) -> Any:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.workers)
+
+        if fail_fast and self.waiting >= self.max_queue:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Authentication service is busy, try again later",
+                headers={"Retry-After": "1"},
+            )
+
+        queued_at = time.perf_counter()
+        self.waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.waiting -= 1
+
+        started_at = time.perf_counter()
+        self.in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            elapsed = time.perf_counter() - started_at
+            self.in_flight -= 1
+            self.completed += 1
+            self.queue_seconds_total += started_at - queued_at
+            self.run_seconds_total += elapsed
+            self.run_seconds_max = max(self.run_seconds_max, elapsed)
+            password_hash_latency.observe((func.__name__,), elapsed)
+            self._semaphore.release()
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "workers": self.workers,
+            "queue_depth": self.waiting,
+            "in_flight": self.in_flight,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "avg_queue_seconds": self.queue_seconds_total / self.completed if self.completed else 0.0,
+            "avg_run_seconds": self.run_seconds_total / self.completed if self.completed else 0.0,
+            "max_run_seconds": self.run_seconds_max,
+        }
+
+
+hashing_executor = HashingExecutor(
+    settings.PASSWORD_HASH_EXECUTOR,
+    settings.PASSWORD_HASH_WORKERS,
+    settings.PASSWORD_HASH_MAX_QUEUE,
+)
+
+
+async def async_verify_password(plain_password: str, hashed_password: str, fail_fast: bool = False) -> bool:
+    return await hashing_executor.run(
+        verify_password,
+        plain_password,
+        hashed_password,
+        fail_fast=fail_fast and settings.PASSWORD_HASH_FAIL_FAST
+    )
+
+
+async def async_get_password_hash(password: str) -> str:
+    return await hashing_executor.run(get_password_hash, password)
+
+
+def shutdown_hashing_executor() -> None:
+    hashing_executor.shutdown()
@@ -0,0 +1,89 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict, Iterable, Optional
+
+from fastapi import Request, Response, status
+
+from app.core.config import get_settings
+from app.core.responses import model_response
+
+settings = get_settings()
+
+PRIVATE_REVALIDATE = "private, no-cache"
+
+
+def public_cache(max_age: Optional[int] = None) -> str:
+    max_age = settings.HTTP_CACHE_PUBLIC_MAX_AGE if max_age is None else max_age
+    return f"public, max-age={max_age}, stale-while-revalidate={max_age}"
+
+
+def _etag(parts: Iterable[Any]) -> str:
+    digest = hashlib.sha1()
+    for part in parts:
+        digest.update(str(part).encode())
+        digest.update(b"|")
+    return f'W/"{digest.hexdigest()[:24]}"'
+
+
+def document_etag(document: Dict[str, Any]) -> str:
+    return _etag([document.get("id"), document.get("updated_at"), document.get("version", "")])
+
+
+def list_etag(items: Iterable[Dict[str, Any]], *extra: Any) -> str:
+    parts = list(extra)
+    for item in items:
+        parts.append(item.get("id"))
+        parts.append(item.get("updated_at"))
+        parts.append(item.get("version", ""))
+    return _etag(parts)
+
+
+def http_date(value: datetime) -> str:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def _strip_weak(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime] = None) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = [_strip_weak(tag) for tag in if_none_match.split(",")]
+        return "*" in tags or _strip_weak(etag) in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        modified = last_modified if last_modified.tzinfo else last_modified.replace(tzinfo=timezone.utc)
+        return modified.replace(microsecond=0) <= since
+    return False
+
+
+def conditional_response(
+    request: Request,
+    response: Response,
+    annotation: Any,
+    content: Any,
+    etag: str,
+    last_modified: Optional[datetime] = None,
+    cache_control: str = PRIVATE_REVALIDATE,
+    headers: Optional[Dict[str, str]] = None
+) -> Any:
+    validators = {"ETag": etag, "Cache-Control": cache_control, "Vary": "Authorization"}
+    if last_modified is not None:
+        validators["Last-Modified"] = http_date(last_modified)
+
+    if request.method in ("GET", "HEAD") and is_not_modified(request, etag, last_modified):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=validators)
+
+    return model_response(annotation, content, headers={**(headers or {}), **validators}, response=response)
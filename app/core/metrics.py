@@ -0,0 +1,228 @@
+import logging
+import time
+from bisect import bisect_left
+from threading import Lock
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from pymongo import monitoring
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import get_settings
+
+settings = get_settings()
+slow_query_logger = logging.getLogger("app.slow_queries")
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+FILTER_FIELDS = {
+    "find": "filter",
+    "count": "query",
+    "distinct": "query",
+    "findAndModify": "query",
+}
+
+Labels = Tuple[str, ...]
+
+
+class Histogram:
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        result = []
+        running = 0
+        for bound, count in zip(self.buckets, self.counts):
+            running += count
+            result.append((repr(bound), running))
+        result.append(("+Inf", self.count))
+        return result
+
+
+class HistogramFamily:
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.series: Dict[Labels, Histogram] = {}
+        self._lock = Lock()
+
+    def observe(self, labels: Labels, value: float) -> None:
+        with self._lock:
+            histogram = self.series.get(labels)
+            if histogram is None:
+                histogram = self.series[labels] = Histogram(self.buckets)
+            histogram.observe(value)
+
+
+class CounterFamily:
+    def __init__(self):
+        self.series: Dict[Labels, float] = {}
+        self._lock = Lock()
+
+    def inc(self, labels: Labels, amount: float = 1) -> None:
+        with self._lock:
+            self.series[labels] = self.series.get(labels, 0) + amount
+
+
+request_latency = HistogramFamily()
+request_statuses = CounterFamily()
+mongo_command_latency = HistogramFamily()
+mongo_command_failures = CounterFamily()
+password_hash_latency = HistogramFamily()
+in_flight_requests = 0
+
+
+def route_template(scope: Scope) -> str:
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        global in_flight_requests
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started_at = time.perf_counter()
+        in_flight_requests += 1
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            in_flight_requests -= 1
+            labels = (scope["method"], route_template(scope))
+            request_latency.observe(labels, time.perf_counter() - started_at)
+            request_statuses.inc(labels + (str(status_code),))
+
+
+def filter_shape(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: filter_shape(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        shapes = []
+        for item in value:
+            shape = filter_shape(item)
+            if shape not in shapes:
+                shapes.append(shape)
+        return shapes
+    return "?"
+
+
+def command_filter(command_name: str, command: Dict[str, Any]) -> Optional[Any]:
+    if command_name in FILTER_FIELDS:
+        return command.get(FILTER_FIELDS[command_name])
+    if command_name == "aggregate":
+        return [stage for stage in command.get("pipeline", []) if "$match" in stage or "$geoNear" in stage]
+    if command_name in ("update", "delete"):
+        statements = command.get(f"{command_name}s") or [{}]
+        return statements[0].get("q")
+    return None
+
+
+class CommandMetricsListener(monitoring.CommandListener):
+    def __init__(self):
+        self._pending: Dict[Tuple[Any, int], Tuple[str, Optional[Any]]] = {}
+        self._lock = Lock()
+
+    def started(self, event):
+        collection = event.command.get(event.command_name)
+        collection = collection if isinstance(collection, str) else ""
+        query = command_filter(event.command_name, event.command) if settings.SLOW_QUERY_MS else None
+        with self._lock:
+            self._pending[(event.connection_id, event.request_id)] = (collection, query)
+
+    def _finish(self, event) -> Tuple[str, Optional[Any]]:
+        with self._lock:
+            return self._pending.pop((event.connection_id, event.request_id), ("", None))
+
+    def succeeded(self, event):
+        collection, query = self._finish(event)
+        duration = event.duration_micros / 1_000_000
+        mongo_command_latency.observe((event.command_name, collection), duration)
+        if settings.SLOW_QUERY_MS and duration * 1000 >= settings.SLOW_QUERY_MS:
+            slow_query_logger.warning(
+                "Slow %s on %s took %.1f ms, filter shape %s",
+                event.command_name,
+                collection or event.database_name,
+                duration * 1000,
+                filter_shape(query)
+            )
+
+    def failed(self, event):
+        collection, _ = self._finish(event)
+        mongo_command_latency.observe((event.command_name, collection), event.duration_micros / 1_000_000)
+        mongo_command_failures.inc((event.command_name, collection))
+
+
+command_metrics = CommandMetricsListener()
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class PrometheusWriter:
+    def __init__(self):
+        self.lines: List[str] = []
+
+    def _header(self, name: str, kind: str, help_text: str) -> None:
+        self.lines.append(f"# HELP {name} {help_text}")
+        self.lines.append(f"# TYPE {name} {kind}")
+
+    def samples(
+        self,
+        name: str,
+        kind: str,
+        help_text: str,
+        label_names: Sequence[str],
+        samples: Iterable[Tuple[Sequence[str], float]]
+    ) -> None:
+        self._header(name, kind, help_text)
+        for values, value in samples:
+            self.lines.append(f"{name}{_labels(label_names, values)} {float(value)!r}")
+
+    def gauge(self, name: str, help_text: str, value: float) -> None:
+        self.samples(name, "gauge", help_text, (), [((), value)])
+
+    def histogram(self, name: str, help_text: str, label_names: Sequence[str], family: HistogramFamily) -> None:
+        self._header(name, "histogram", help_text)
+        with family._lock:
+            series = [(labels, histogram.cumulative(), histogram.sum, histogram.count)
+                      for labels, histogram in family.series.items()]
+        for labels, buckets, total, count in series:
+            for bound, cumulative in buckets:
+                bucket_labels = _labels(label_names, labels, 'le="%s"' % bound)
+                self.lines.append(f"{name}_bucket{bucket_labels} {cumulative}")
+            self.lines.append(f"{name}_sum{_labels(label_names, labels)} {total!r}")
+            self.lines.append(f"{name}_count{_labels(label_names, labels)} {count}")
+
+    def counter(self, name: str, help_text: str, label_names: Sequence[str], family: CounterFamily) -> None:
+        with family._lock:
+            samples = list(family.series.items())
+        self.samples(name, "counter", help_text, label_names, samples)
+
+    def render(self) -> str:
+        return "\n".join(self.lines) + "\n"
@@ -0,0 +1,244 @@
+import asyncio
+import hashlib
+import hmac
+import logging
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from pymongo import UpdateOne
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.config import get_settings
+from app.core.metrics import route_template
+from app.db.mongodb import get_database
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+PROFILE_TOKEN_HEADER = "X-Profile-Token"
+CONTROL_DOCUMENT_ID = "profiling"
+
+
+def _sign(expires: int) -> str:
+    return hmac.new(settings.SECRET_KEY.encode(), f"profile:{expires}".encode(), hashlib.sha256).hexdigest()
+
+
+def create_profile_token(ttl_seconds: int) -> Dict[str, Any]:
+    expires = int(time.time()) + ttl_seconds
+    return {
+        "header": PROFILE_TOKEN_HEADER,
+        "token": f"{expires}.{_sign(expires)}",
+        "expires_at": datetime.utcfromtimestamp(expires),
+    }
+
+
+def verify_profile_token(token: str) -> bool:
+    expires, _, signature = token.partition(".")
+    if not expires.isdigit() or int(expires) < time.time():
+        return False
+    return hmac.compare_digest(signature, _sign(int(expires)))
+
+
+class SamplingProfiler:
+    def __init__(self, interval_seconds: float):
+        self.interval_seconds = interval_seconds
+        self.enabled_until: Optional[datetime] = None
+        self.sample_rate = 0.0
+        self.active = 0
+        self.profiled_requests = 0
+        self.total_samples = 0
+        self._samples: Dict[str, Counter] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+        self._loop_thread_id: Optional[int] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.enabled_until is not None and datetime.utcnow() < self.enabled_until
+
+    def configure(self, enabled_until: Optional[datetime], sample_rate: float) -> None:
+        self.enabled_until = enabled_until
+        self.sample_rate = sample_rate
+
+    def should_profile(self, scope: Scope) -> bool:
+        if self._thread is None:
+            return False
+        for name, value in scope.get("headers") or []:
+            if name == b"x-profile-token":
+                return verify_profile_token(value.decode("latin-1"))
+        return self.enabled and random.random() < self.sample_rate
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stopping = False
+        self._loop_thread_id = threading.get_ident()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopping = True
+        self._wake.set()
+        self._thread = None
+
+    def enter(self) -> None:
+        self.active += 1
+        self.profiled_requests += 1
+        self._wake.set()
+
+    def exit(self) -> None:
+        self.active -= 1
+
+    def _run(self) -> None:
+        while not self._stopping:
+            if not self.active:
+                self._wake.wait()
+                self._wake.clear()
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is not None:
+                self._record(frame)
+            del frame
+            time.sleep(self.interval_seconds)
+
+    def _record(self, frame) -> None:
+        # The loop thread runs one task at a time, so the profiling middleware
+        # frame found below the current frame is the request being served.
+        stack: List[str] = []
+        while frame is not None:
+            if frame.f_code is PROFILED_CALL:
+                if not frame.f_locals.get("profiled"):
+                    return
+                route = f"{frame.f_locals['scope']['method']} {route_template(frame.f_locals['scope'])}"
+                with self._lock:
+                    self._samples.setdefault(route, Counter())[";".join(reversed(stack))] += 1
+                    self.total_samples += 1
+                return
+            stack.append(f"{frame.f_globals.get('__name__', '?')}:{frame.f_code.co_name}")
+            frame = frame.f_back
+
+    def drain(self) -> Dict[str, Counter]:
+        with self._lock:
+            samples, self._samples = self._samples, {}
+        return samples
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "enabled_until": self.enabled_until,
+            "sample_rate": self.sample_rate,
+            "active_requests": self.active,
+            "profiled_requests": self.profiled_requests,
+            "total_samples": self.total_samples,
+        }
+
+
+profiler = SamplingProfiler(settings.PROFILER_INTERVAL_MS / 1000)
+
+
+class ProfilingMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        profiled = scope["type"] == "http" and profiler.should_profile(scope)
+        if not profiled:
+            await self.app(scope, receive, send)
+            return
+
+        profiler.enter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            profiler.exit()
+
+
+PROFILED_CALL = ProfilingMiddleware.__call__.__code__
+
+_poll_task: Optional[asyncio.Task] = None
+
+
+async def flush_profiles(db) -> None:
+    samples = profiler.drain()
+    now = datetime.utcnow()
+    operations = []
+    for route, stacks in samples.items():
+        for stack, count in stacks.items():
+            operations.append(UpdateOne(
+                {"_id": hashlib.sha1(f"{route}\n{stack}".encode()).hexdigest()},
+                {
+                    "$inc": {"samples": count},
+                    "$set": {"updated_at": now},
+                    "$setOnInsert": {"route": route, "stack": stack},
+                },
+                upsert=True
+            ))
+    if operations:
+        await db.profiles.bulk_write(operations, ordered=False)
+
+
+async def refresh_profiling_control(db) -> None:
+    control = await db.meta.find_one({"_id": CONTROL_DOCUMENT_ID}) or {}
+    profiler.configure(control.get("enabled_until"), control.get("sample_rate", 0.0))
+
+
+async def set_profiling(db, duration_seconds: int, sample_rate: float) -> None:
+    enabled_until = datetime.utcnow() + timedelta(seconds=duration_seconds) if duration_seconds else None
+    await db.meta.update_one(
+        {"_id": CONTROL_DOCUMENT_ID},
+        {"$set": {"enabled_until": enabled_until, "sample_rate": sample_rate}},
+        upsert=True
+    )
+    profiler.configure(enabled_until, sample_rate)
+
+
+async def folded_profiles(db, route: Optional[str] = None) -> str:
+    query = {"route": route} if route else {}
+    lines = []
+    async for document in db.profiles.find(query, {"route": 1, "stack": 1, "samples": 1}):
+        stack = document["stack"] if route else f"{document['route']};{document['stack']}"
+        lines.append(f"{stack} {document['samples']}")
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+async def profile_routes(db) -> Dict[str, int]:
+    pipeline = [{"$group": {"_id": "$route", "samples": {"$sum": "$samples"}}}]
+    return {row["_id"]: row["samples"] async for row in db.profiles.aggregate(pipeline)}
+
+
+async def _poll_control() -> None:
+    # The first refresh happens here rather than in start_profiler, so an
+    # unreachable MongoDB at boot is logged and retried instead of aborting
+    # worker startup. Until it succeeds, profiling stays off.
+    while True:
+        try:
+            db = get_database()
+            await refresh_profiling_control(db)
+            await flush_profiles(db)
+        except Exception:
+            logger.exception("Profiler control refresh failed")
+        await asyncio.sleep(settings.PROFILER_POLL_SECONDS)
+
+
+async def start_profiler() -> None:
+    global _poll_task
+    if not settings.PROFILER_ENABLED:
+        return
+    profiler.start()
+    _poll_task = asyncio.create_task(_poll_control())
+
+
+async def stop_profiler() -> None:
+    global _poll_task
+    if _poll_task is not None:
+        _poll_task.cancel()
+        _poll_task = None
+        profiler.stop()
+        await flush_profiles(get_database())
@@ -0,0 +1,177 @@
+import logging
+import math
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from jose import JWTError, jwt
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.config import get_settings
+from app.db.mongodb import get_database
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+AUTH_PATHS = ("/auth/login", "/auth/register", "/auth/change-password")
+# Operational endpoints must answer while the API is saturated or throttled.
+EXEMPT_PATHS = ("/metrics", "/health/")
+
+
+class MemoryRateLimitBackend:
+    def __init__(self, max_keys: int = 100000):
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+    async def acquire(self, key: str, capacity: float, refill_per_second: float, cost: float = 1.0) -> float:
+        now = time.monotonic()
+        tokens, updated_at = self._buckets.get(key, (capacity, now))
+        tokens = min(capacity, tokens + (now - updated_at) * refill_per_second)
+
+        retry_after = 0.0
+        if tokens >= cost:
+            tokens -= cost
+        else:
+            retry_after = (cost - tokens) / refill_per_second
+
+        self._buckets[key] = (tokens, now)
+        self._buckets.move_to_end(key)
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return retry_after
+
+
+class MongoRateLimitBackend:
+    collection_name = "rate_limits"
+
+    async def acquire(self, key: str, capacity: float, refill_per_second: float, cost: float = 1.0) -> float:
+        elapsed_seconds = {"$divide": [{"$subtract": ["$$NOW", {"$ifNull": ["$updated_at", "$$NOW"]}]}, 1000]}
+        refilled = {"$min": [
+            capacity,
+            {"$add": [{"$ifNull": ["$tokens", capacity]}, {"$multiply": [elapsed_seconds, refill_per_second]}]},
+        ]}
+        ttl_ms = math.ceil(capacity / refill_per_second * 1000)
+        pipeline = [
+            {"$set": {"tokens": refilled, "updated_at": "$$NOW"}},
+            {"$set": {
+                "allowed": {"$gte": ["$tokens", cost]},
+                "tokens": {"$cond": [{"$gte": ["$tokens", cost]}, {"$subtract": ["$tokens", cost]}, "$tokens"]},
+                "expires_at": {"$add": ["$$NOW", ttl_ms]},
+            }},
+        ]
+        collection = get_database()[self.collection_name]
+        try:
+            bucket = await collection.find_one_and_update(
+                {"_id": key}, pipeline, upsert=True, return_document=ReturnDocument.AFTER
+            )
+        except DuplicateKeyError:
+            # Two first requests for a key raced to insert the bucket; the
+            # loser retries against the document the winner created.
+            bucket = await collection.find_one_and_update(
+                {"_id": key}, pipeline, upsert=True, return_document=ReturnDocument.AFTER
+            )
+        if bucket["allowed"]:
+            return 0.0
+        return (cost - bucket["tokens"]) / refill_per_second
+
+
+def create_backend(name: str):
+    if name == "mongo":
+        return MongoRateLimitBackend()
+    return MemoryRateLimitBackend()
+
+
+def route_class(scope: Scope) -> str:
+    path = scope["path"]
+    method = scope["method"]
+    if path.endswith(AUTH_PATHS):
+        return "auth"
+    if path.startswith(f"{settings.API_PREFIX}/exports"):
+        return "export"
+    if method in WRITE_METHODS:
+        return "write"
+    if b"search=" in scope.get("query_string", b""):
+        return "search"
+    return "default"
+
+
+def client_identity(scope: Scope) -> str:
+    headers = dict(scope.get("headers") or [])
+    authorization = headers.get(b"authorization", b"").decode("latin-1")
+    if authorization.lower().startswith("bearer "):
+        try:
+            payload = jwt.decode(authorization[7:], settings.SECRET_KEY, algorithms=["HS256"])
+            if payload.get("sub"):
+                return f"user:{payload['sub']}"
+        except JWTError:
+            pass
+
+    if settings.RATE_LIMIT_TRUST_FORWARDED_FOR and b"x-forwarded-for" in headers:
+        return "ip:" + headers[b"x-forwarded-for"].decode("latin-1").split(",")[0].strip()
+    client = scope.get("client")
+    return f"ip:{client[0] if client else 'unknown'}"
+
+
+class AdmissionControlMiddleware:
+    def __init__(self, app: ASGIApp, backend: Optional[object] = None):
+        self.app = app
+        self.backend = backend or create_backend(settings.RATE_LIMIT_BACKEND)
+        self.in_flight = 0
+        self.shed = 0
+        self.limited: Dict[str, int] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(EXEMPT_PATHS):
+            await self.app(scope, receive, send)
+            return
+
+        if settings.MAX_IN_FLIGHT_REQUESTS and self.in_flight >= settings.MAX_IN_FLIGHT_REQUESTS:
+            self.shed += 1
+            response = JSONResponse(
+                {"detail": "Server is overloaded, try again later"},
+                status_code=503,
+                headers={"Retry-After": "1"}
+            )
+            await response(scope, receive, send)
+            return
+
+        # Counted before the rate-limit await so requests parked on the shared
+        # backend still hold a slot and a burst cannot overshoot the limit.
+        self.in_flight += 1
+        try:
+            if settings.RATE_LIMIT_ENABLED:
+                retry_after = await self._check_rate_limit(scope)
+                if retry_after:
+                    response = JSONResponse(
+                        {"detail": "Too many requests"},
+                        status_code=429,
+                        headers={"Retry-After": str(max(1, math.ceil(retry_after)))}
+                    )
+                    await response(scope, receive, send)
+                    return
+
+            await self.app(scope, receive, send)
+        finally:
+            self.in_flight -= 1
+
+    async def _check_rate_limit(self, scope: Scope) -> float:
+        name = route_class(scope)
+        rule = settings.RATE_LIMIT_RULES.get(name)
+        if not rule:
+            return 0.0
+        capacity, refill_per_second = rule
+        try:
+            retry_after = await self.backend.acquire(f"{name}:{client_identity(scope)}", capacity, refill_per_second)
+        except Exception:
+            logger.exception("Rate limit backend failed, admitting request")
+            return 0.0
+        if retry_after:
+            self.limited[name] = self.limited.get(name, 0) + 1
+        return retry_after
+
+    def stats(self) -> Dict[str, object]:
+        return {"in_flight": self.in_flight, "shed": self.shed, "rate_limited": dict(self.limited)}
@@ -0,0 +1,128 @@
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Union, get_args, get_origin
+
+import orjson
+from bson import ObjectId
+from fastapi.responses import Response
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import PydanticUndefined
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+Serializer = Callable[[Any], Any]
+
+
+class SerializerMiss(Exception):
+    pass
+
+
+def _orjson_default(value: Any) -> Any:
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+class ORJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+@lru_cache(maxsize=None)
+def _type_adapter(annotation: Any) -> TypeAdapter:
+    return TypeAdapter(annotation)
+
+
+def pydantic_serialize(annotation: Any, value: Any) -> Any:
+    adapter = _type_adapter(annotation)
+    return adapter.dump_python(adapter.validate_python(value), mode="json")
+
+
+def _compile_model(model: type) -> Serializer:
+    fields = []
+    for name, field in model.model_fields.items():
+        default = field.default if field.default is not PydanticUndefined else None
+        fields.append((name, compile_serializer(field.annotation), field.is_required(), default, field.default_factory))
+
+    def serialize(value: Any) -> Dict[str, Any]:
+        if isinstance(value, BaseModel):
+            value = value.__dict__
+        result = {}
+        for name, field_serializer, required, default, default_factory in fields:
+            if name in value:
+                result[name] = field_serializer(value[name])
+            elif required:
+                raise SerializerMiss(f"{model.__name__}.{name} is missing")
+            else:
+                result[name] = field_serializer(default_factory() if default_factory else default)
+        return result
+
+    return serialize
+
+
+@lru_cache(maxsize=None)
+def compile_serializer(annotation: Any) -> Serializer:
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+
+    if origin is Union:
+        inner_types = [arg for arg in args if arg is not type(None)]
+        if len(inner_types) != 1:
+            return lambda value: pydantic_serialize(annotation, value)
+        inner = compile_serializer(inner_types[0])
+        return lambda value: None if value is None else inner(value)
+
+    if origin in (list, tuple, set, frozenset):
+        if not args or (origin is tuple and len(set(args)) != 1 and args[-1] is not Ellipsis):
+            return list
+        item = compile_serializer(args[0])
+        return lambda value: [item(v) for v in value]
+
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            return _compile_model(annotation)
+        if issubclass(annotation, Enum):
+            return lambda value: value.value if isinstance(value, Enum) else value
+        if issubclass(annotation, (str, int, float, bool, datetime, date)):
+            return _identity
+
+    if annotation is Any:
+        return _identity
+    return lambda value: pydantic_serialize(annotation, value)
+
+
+def model_response(
+    annotation: Any,
+    content: Any,
+    status_code: int = 200,
+    headers: Optional[Dict[str, str]] = None,
+    response: Optional[Response] = None
+) -> Any:
+    if not settings.FAST_SERIALIZATION:
+        if response is not None and headers:
+            response.headers.update(headers)
+        return content
+
+    try:
+        body = compile_serializer(annotation)(content)
+    except SerializerMiss:
+        # Let pydantic validate the document so missing fields fail exactly as
+        # they do on the regular response_model path.
+        body = pydantic_serialize(annotation, content)
+    return ORJSONResponse(body, status_code=status_code, headers=headers)
@@ -0,0 +1,145 @@
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from fastapi import HTTPException, status
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.errors import DuplicateKeyError
+
+from app.crud.counts import bump_generation
+from app.crud.loader import UserLoader, attach_users
+from app.crud.pagination import ATTENDEE_SORT, fetch_page_with_total
+from app.db.read_model import stamp_revision
+from app.models.event import EventStatus
+
+EVENT_FULL = "Event is full"
+EVENT_CLOSED = "Event is not open for registration"
+ALREADY_REGISTERED = "Already registered for this event"
+
+HAS_FREE_SEAT = {
+    "$or": [
+        {"max_attendees": None},
+        {"$expr": {"$lt": ["$attendees_count", "$max_attendees"]}},
+    ]
+}
+
+
+def _event_object_id(event_id: str) -> ObjectId:
+    try:
+        return ObjectId(event_id)
+    except InvalidId:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Event with ID {event_id} not found"
+        )
+
+
+async def _raise_rejection(db: AsyncIOMotorDatabase, event_id: str, event_oid: ObjectId) -> None:
+    event = await db.events.find_one({"_id": event_oid}, {"status": 1})
+    if not event:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Event with ID {event_id} not found"
+        )
+    if event.get("status") != EventStatus.PUBLISHED:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=EVENT_CLOSED
+        )
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=EVENT_FULL
+    )
+
+
+async def release_seat(db: AsyncIOMotorDatabase, event_oid: ObjectId, seats: int = 1) -> None:
+    await db.events.update_one(
+        {"_id": event_oid, "attendees_count": {"$gte": seats}},
+        stamp_revision({"$inc": {"attendees_count": -seats}})
+    )
+
+
+def _already_registered() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=ALREADY_REGISTERED
+    )
+
+
+async def register_attendee(db: AsyncIOMotorDatabase, event_id: str, user_id: str) -> Dict[str, Any]:
+    event_oid = _event_object_id(event_id)
+
+    # Checked before taking a seat so a repeat request on a full event is
+    # answered as a duplicate; the unique index still settles concurrent ones.
+    if await db.event_attendees.find_one({"event_id": event_id, "user_id": user_id}, {"_id": 1}):
+        raise _already_registered()
+
+    seat = await db.events.find_one_and_update(
+        {"_id": event_oid, "status": EventStatus.PUBLISHED.value, **HAS_FREE_SEAT},
+        stamp_revision({"$inc": {"attendees_count": 1}}),
+        projection={"_id": 1}
+    )
+    if seat is None:
+        await _raise_rejection(db, event_id, event_oid)
+
+    attendee = {
+        "event_id": event_id,
+        "user_id": user_id,
+        "registered_at": datetime.utcnow(),
+    }
+    try:
+        await db.event_attendees.insert_one(attendee)
+    except DuplicateKeyError:
+        await release_seat(db, event_oid)
+        raise _already_registered()
+    except BaseException:
+        await release_seat(db, event_oid)
+        raise
+
+    bump_generation("event_attendees")
+    del attendee["_id"]
+    return attendee
+
+
+async def unregister_attendee(db: AsyncIOMotorDatabase, event_id: str, user_id: str) -> bool:
+    event_oid = _event_object_id(event_id)
+
+    result = await db.event_attendees.delete_one({"event_id": event_id, "user_id": user_id})
+    if result.deleted_count == 0:
+        return False
+
+    await release_seat(db, event_oid)
+    bump_generation("event_attendees")
+    return True
+
+
+async def get_event_attendees_page(
+    db: AsyncIOMotorDatabase,
+    event_id: str,
+    loader: UserLoader,
+    limit: int = 10,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    total_mode: str = "none"
+) -> Dict[str, Any]:
+    page = await fetch_page_with_total(
+        db.event_attendees,
+        {"event_id": event_id},
+        ATTENDEE_SORT,
+        limit,
+        offset=offset,
+        cursor=cursor,
+        projection={"user_id": 1, "registered_at": 1},
+        total_mode=total_mode
+    )
+
+    # One $in query for the whole page. Rows of deleted users are left out
+    # rather than rendered without a username.
+    await attach_users(loader, page["items"], "user_id", "user")
+    page["items"] = [
+        {"id": attendee["user_id"], **attendee["user"], "registered_at": attendee["registered_at"]}
+        for attendee in page["items"]
+        if attendee["user"]
+    ]
+    return page
@@ -0,0 +1,259 @@
+import asyncio
+import logging
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from fastapi import HTTPException
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.errors import BulkWriteError
+
+from app.crud.attendee import ALREADY_REGISTERED, EVENT_CLOSED, EVENT_FULL, register_attendee, release_seat
+from app.crud.counts import bump_generation
+from app.crud.reference import category_cache, reference_changed, venue_cache
+from app.crud.venue import venue_document
+from app.db.read_model import stamp_revision
+from app.models.batch import AttendeeRegistration
+from app.models.event import EventCreate, EventStatus
+from app.models.venue import VenueCreate
+
+logger = logging.getLogger(__name__)
+
+DUPLICATE_KEY = 11000
+DOCUMENT_VALIDATION_FAILURE = 121
+
+ERROR_MESSAGES = {
+    "duplicate_key": "Duplicate key",
+    "validation_failed": "Document failed validation",
+    "write_failed": "Write failed",
+    "venue_not_found": "Venue not found",
+    "category_not_found": "Category not found",
+    "event_not_found": "Event not found",
+    "event_closed": EVENT_CLOSED,
+    "event_full": EVENT_FULL,
+    "already_registered": ALREADY_REGISTERED,
+    "invalid_user_id": "Invalid user ID",
+    "user_not_found": "User not found",
+    "registration_failed": "Registration failed",
+}
+
+REGISTRATION_ERRORS = {EVENT_CLOSED: "event_closed", EVENT_FULL: "event_full", ALREADY_REGISTERED: "already_registered"}
+
+
+def item_error(index: int, code: str) -> Dict[str, Any]:
+    return {"index": index, "code": code, "error": ERROR_MESSAGES[code]}
+
+
+def _write_error_code(error: Dict[str, Any]) -> str:
+    if error.get("code") == DUPLICATE_KEY:
+        return "duplicate_key"
+    if error.get("code") == DOCUMENT_VALIDATION_FAILURE:
+        return "validation_failed"
+    return "write_failed"
+
+
+def batch_result(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    results.sort(key=lambda item: item["index"])
+    failed = sum(1 for item in results if item.get("error"))
+    return {"succeeded": len(results) - failed, "failed": failed, "items": results}
+
+
+async def insert_unordered(collection, documents: List[Tuple[int, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    if not documents:
+        return []
+
+    errors: Dict[int, str] = {}
+    try:
+        await collection.insert_many([document for _, document in documents], ordered=False)
+    except BulkWriteError as e:
+        for error in e.details.get("writeErrors", []):
+            errors[error["index"]] = _write_error_code(error)
+
+    results = []
+    for position, (index, document) in enumerate(documents):
+        if position in errors:
+            results.append(item_error(index, errors[position]))
+        else:
+            results.append({"index": index, "id": str(document["_id"])})
+    return results
+
+
+async def bulk_create_events(
+    db: AsyncIOMotorDatabase,
+    organizer: Dict[str, Any],
+    events: List[EventCreate]
+) -> Dict[str, Any]:
+    now = datetime.utcnow()
+    organizer_ref = {
+        "id": organizer["id"],
+        "username": organizer["username"],
+        "full_name": organizer.get("full_name"),
+    }
+
+    results = []
+    documents = []
+    for index, event in enumerate(events):
+        venue = await venue_cache.get_by_id(db, event.venue_id)
+        category = await category_cache.get_by_id(db, event.category_id)
+        if venue is None:
+            results.append(item_error(index, "venue_not_found"))
+            continue
+        if category is None:
+            results.append(item_error(index, "category_not_found"))
+            continue
+
+        document = event.model_dump()
+        document.update({
+            "organizer_id": organizer["id"],
+            "organizer": organizer_ref,
+            "venue": venue,
+            "category": category,
+            "attendees_count": 0,
+            "created_at": now,
+            "updated_at": now,
+        })
+        documents.append((index, document))
+
+    results.extend(await insert_unordered(db.events, documents))
+    bump_generation("events")
+    return batch_result(results)
+
+
+async def bulk_create_venues(db: AsyncIOMotorDatabase, venues: List[VenueCreate]) -> Dict[str, Any]:
+    now = datetime.utcnow()
+    documents = []
+    for index, venue in enumerate(venues):
+        documents.append((index, venue_document(venue, now)))
+
+    results = await insert_unordered(db.venues, documents)
+    bump_generation("venues")
+    await reference_changed(db, "venues", [item["id"] for item in results if "id" in item])
+    return batch_result(results)
+
+
+async def _reserve_seats(db: AsyncIOMotorDatabase, event_oid: ObjectId, seats: int) -> bool:
+    reserved = await db.events.find_one_and_update(
+        {
+            "_id": event_oid,
+            "status": EventStatus.PUBLISHED.value,
+            "$or": [
+                {"max_attendees": None},
+                {"$expr": {"$lte": [{"$add": ["$attendees_count", seats]}, "$max_attendees"]}},
+            ],
+        },
+        stamp_revision({"$inc": {"attendees_count": seats}}),
+        projection={"_id": 1}
+    )
+    return reserved is not None
+
+
+async def _register_one_by_one(
+    db: AsyncIOMotorDatabase,
+    event_id: str,
+    items: List[Tuple[int, AttendeeRegistration]]
+) -> List[Dict[str, Any]]:
+    results = []
+    for index, registration in items:
+        try:
+            await register_attendee(db, event_id, registration.user_id)
+            results.append({"index": index, "id": registration.user_id})
+        except HTTPException as e:
+            if e.status_code == 404:
+                results.append(item_error(index, "event_not_found"))
+            else:
+                results.append(item_error(index, REGISTRATION_ERRORS.get(e.detail, "registration_failed")))
+    return results
+
+
+async def _release_unwritten_seats(db: AsyncIOMotorDatabase, event_oid: ObjectId, documents: List[Dict[str, Any]]) -> None:
+    # insert_many may have written part of the batch before failing, so only
+    # give back the seats whose attendee rows are not in the collection.
+    try:
+        written = await db.event_attendees.count_documents({"_id": {"$in": [document["_id"] for document in documents]}})
+    except Exception:
+        logger.exception(
+            "Could not reconcile seats for event %s; run `python -m app.db.read_model attendees --repair`",
+            event_oid
+        )
+        return
+    if written < len(documents):
+        await release_seat(db, event_oid, len(documents) - written)
+
+
+async def _register_event_group(
+    db: AsyncIOMotorDatabase,
+    event_id: str,
+    items: List[Tuple[int, AttendeeRegistration]]
+) -> List[Dict[str, Any]]:
+    try:
+        event_oid = ObjectId(event_id)
+    except InvalidId:
+        return [item_error(index, "event_not_found") for index, _ in items]
+
+    if not await _reserve_seats(db, event_oid, len(items)):
+        return await _register_one_by_one(db, event_id, items)
+
+    now = datetime.utcnow()
+    documents = [
+        (index, {"_id": ObjectId(), "event_id": event_id, "user_id": registration.user_id, "registered_at": now})
+        for index, registration in items
+    ]
+    try:
+        inserted = await insert_unordered(db.event_attendees, documents)
+    except BaseException:
+        await _release_unwritten_seats(db, event_oid, [document for _, document in documents])
+        raise
+
+    failed = sum(1 for item in inserted if item.get("error"))
+    if failed:
+        await release_seat(db, event_oid, failed)
+
+    user_ids = {index: registration.user_id for index, registration in items}
+    return [
+        item_error(item["index"], "already_registered" if item["code"] == "duplicate_key" else item["code"])
+        if item.get("error") else {"index": item["index"], "id": user_ids[item["index"]]}
+        for item in inserted
+    ]
+
+
+async def _check_users(
+    db: AsyncIOMotorDatabase,
+    registrations: List[AttendeeRegistration]
+) -> Tuple[List[Tuple[int, AttendeeRegistration]], List[Dict[str, Any]]]:
+    valid, errors = [], []
+    for index, registration in enumerate(registrations):
+        try:
+            user_oid = ObjectId(registration.user_id)
+        except InvalidId:
+            errors.append(item_error(index, "invalid_user_id"))
+            continue
+        valid.append((index, registration.model_copy(update={"user_id": str(user_oid)})))
+
+    user_oids = list({ObjectId(registration.user_id) for _, registration in valid})
+    existing = {str(user["_id"]) async for user in db.users.find({"_id": {"$in": user_oids}}, {"_id": 1})}
+    checked = []
+    for index, registration in valid:
+        if registration.user_id in existing:
+            checked.append((index, registration))
+        else:
+            errors.append(item_error(index, "user_not_found"))
+    return checked, errors
+
+
+async def bulk_register_attendees(
+    db: AsyncIOMotorDatabase,
+    registrations: List[AttendeeRegistration]
+) -> Dict[str, Any]:
+    checked, errors = await _check_users(db, registrations)
+
+    groups: Dict[str, List[Tuple[int, AttendeeRegistration]]] = defaultdict(list)
+    for index, registration in checked:
+        groups[registration.event_id].append((index, registration))
+
+    grouped_results = await asyncio.gather(*(
+        _register_event_group(db, event_id, items) for event_id, items in groups.items()
+    ))
+    bump_generation("event_attendees")
+    return batch_result(errors + [item for group in grouped_results for item in group])
@@ -0,0 +1,90 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from fastapi import HTTPException, status
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from app.crud.counts import bump_generation
+from app.crud.reference import reference_changed
+from app.crud.search import CATEGORY_LOOKUP_FIELDS, lookup_fields
+from app.db.read_model import CATEGORY_FIELDS, propagate_category, schedule_propagation
+from app.models.event import CategoryCreate, CategoryUpdate
+
+
+def _to_response(category: Dict[str, Any]) -> Dict[str, Any]:
+    category["id"] = str(category["_id"])
+    del category["_id"]
+    return category
+
+
+def _duplicate_name() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Category with this name already exists"
+    )
+
+
+async def get_categories(db: AsyncIOMotorDatabase) -> List[Dict[str, Any]]:
+    categories = await db.categories.find({}).sort("name", 1).to_list(length=None)
+    return [_to_response(category) for category in categories]
+
+
+async def get_category(db: AsyncIOMotorDatabase, category_id: str) -> Optional[Dict[str, Any]]:
+    try:
+        category = await db.categories.find_one({"_id": ObjectId(category_id)})
+    except InvalidId:
+        return None
+    return _to_response(category) if category else None
+
+
+async def create_category(db: AsyncIOMotorDatabase, category_data: CategoryCreate) -> Dict[str, Any]:
+    now = datetime.utcnow()
+    category = category_data.model_dump()
+    category.update(lookup_fields(category, CATEGORY_LOOKUP_FIELDS))
+    category["created_at"] = now
+    category["updated_at"] = now
+
+    try:
+        result = await db.categories.insert_one(category)
+    except DuplicateKeyError:
+        raise _duplicate_name()
+    bump_generation("categories")
+    await reference_changed(db, "categories", [str(result.inserted_id)])
+    return _to_response(category)
+
+
+async def update_category(
+    db: AsyncIOMotorDatabase,
+    category_id: str,
+    category_data: CategoryUpdate
+) -> Optional[Dict[str, Any]]:
+    try:
+        object_id = ObjectId(category_id)
+    except InvalidId:
+        return None
+
+    update_data = {k: v for k, v in category_data.model_dump(exclude_unset=True).items() if v is not None}
+    update_data.update(lookup_fields(update_data, CATEGORY_LOOKUP_FIELDS))
+    update_data["updated_at"] = datetime.utcnow()
+
+    try:
+        category = await db.categories.find_one_and_update(
+            {"_id": object_id},
+            {"$set": update_data},
+            return_document=ReturnDocument.AFTER
+        )
+    except DuplicateKeyError:
+        raise _duplicate_name()
+    bump_generation("categories")
+    if not category:
+        return None
+
+    category = _to_response(category)
+    if any(field in update_data for field in CATEGORY_FIELDS):
+        await reference_changed(db, "categories", [category["id"]])
+        schedule_propagation(propagate_category(db, category))
+    return category
@@ -0,0 +1,34 @@
+import json
+from typing import Any, Dict, Optional
+
+from app.core.cache import LRUCache
+from app.core.config import get_settings
+
+settings = get_settings()
+
+count_cache = LRUCache(settings.COUNT_CACHE_MAX_SIZE, settings.COUNT_CACHE_TTL_SECONDS)
+generations: Dict[str, int] = {}
+
+
+def bump_generation(collection_name: str) -> None:
+    generations[collection_name] = generations.get(collection_name, 0) + 1
+
+
+def collection_generation(collection_name: str) -> int:
+    return generations.get(collection_name, 0)
+
+
+def normalize_filter(query: Dict[str, Any]) -> str:
+    return json.dumps(query, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def _key(collection_name: str, query: Dict[str, Any]) -> tuple:
+    return collection_name, collection_generation(collection_name), normalize_filter(query)
+
+
+def get_cached_count(collection_name: str, query: Dict[str, Any]) -> Optional[int]:
+    return count_cache.get(_key(collection_name, query))
+
+
+def store_count(collection_name: str, query: Dict[str, Any], total: int) -> None:
+    count_cache.set(_key(collection_name, query), total)
@@ -0,0 +1,103 @@
+from typing import Any, Dict, List, Optional
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.crud.pagination import EVENT_SORT, fetch_page_with_total
+from app.crud.search import fetch_search_page_with_total, is_text_search
+from app.db.read_model import EMBEDDED, load_refs
+
+
+def _to_response(event: Dict[str, Any]) -> Dict[str, Any]:
+    event["id"] = str(event["_id"])
+    del event["_id"]
+    return event
+
+
+async def fill_missing_refs(db: AsyncIOMotorDatabase, events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    # Events written before the read model existed have no embedded refs until
+    # `python -m app.db.read_model check --repair` runs; batch-load those so the
+    # response shape does not depend on when a document was written.
+    for embedded, (id_field, collection, fields) in EMBEDDED.items():
+        missing = [event for event in events if not event.get(embedded) and event.get(id_field)]
+        if not missing:
+            continue
+        refs = await load_refs(db, collection, [event[id_field] for event in missing], fields)
+        for event in missing:
+            event[embedded] = refs.get(event[id_field])
+    return events
+
+
+async def get_event(db: AsyncIOMotorDatabase, event_id: str) -> Optional[Dict[str, Any]]:
+    try:
+        object_id = ObjectId(event_id)
+    except InvalidId:
+        return None
+
+    event = await db.events.find_one({"_id": object_id})
+    if not event:
+        return None
+    await fill_missing_refs(db, [event])
+    return _to_response(event)
+
+
+async def get_events_page(
+    db: AsyncIOMotorDatabase,
+    filters: Dict[str, Any],
+    limit: int = 10,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    total_mode: str = "none"
+) -> Dict[str, Any]:
+    fetch = fetch_search_page_with_total if is_text_search(filters) else fetch_page_with_total
+    page = await fetch(
+        db.events,
+        filters,
+        EVENT_SORT,
+        limit,
+        offset=offset,
+        cursor=cursor,
+        total_mode=total_mode
+    )
+
+    await fill_missing_refs(db, page["items"])
+    page["items"] = [_to_response(event) for event in page["items"]]
+    return page
+
+
+async def _user_events_query(db: AsyncIOMotorDatabase, user_id: str, as_organizer: bool) -> Dict[str, Any]:
+    if as_organizer:
+        return {"organizer_id": user_id}
+    event_ids = await db.event_attendees.distinct("event_id", {"user_id": user_id})
+    object_ids = []
+    for event_id in event_ids:
+        try:
+            object_ids.append(ObjectId(event_id))
+        except (InvalidId, TypeError):
+            continue
+    return {"_id": {"$in": object_ids}}
+
+
+async def get_user_events_page(
+    db: AsyncIOMotorDatabase,
+    user_id: str,
+    limit: int = 10,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    as_organizer: bool = False,
+    total_mode: str = "exact"
+) -> Dict[str, Any]:
+    query = await _user_events_query(db, user_id, as_organizer)
+    page = await fetch_page_with_total(
+        db.events,
+        query,
+        EVENT_SORT,
+        limit,
+        offset=offset,
+        cursor=cursor,
+        total_mode=total_mode
+    )
+    await fill_missing_refs(db, page["items"])
+    page["items"] = [_to_response(event) for event in page["items"]]
+    return page
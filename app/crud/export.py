@@ -0,0 +1,144 @@
+import csv
+import io
+import time
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+
+import orjson
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.core.config import get_settings
+from app.crud.loader import UserLoader, attach_users
+from app.crud.pagination import SortSpec, apply_cursor, encode_cursor
+
+settings = get_settings()
+
+EXPORT_SORT: SortSpec = [("_id", 1)]
+CHUNK_BYTES = 64 * 1024
+
+ATTENDEE_COLUMNS = ["user_id", "username", "full_name", "registered_at"]
+EVENT_COLUMNS = [
+    "id", "title", "status", "start_date", "end_date", "venue_id", "category_id",
+    "price", "max_attendees", "attendees_count", "is_private", "created_at", "updated_at",
+]
+REVIEW_COLUMNS = ["id", "event_id", "author_id", "author_username", "rating", "comment", "created_at", "updated_at"]
+REVIEW_FIELDS = ["event_id", "author", "rating", "comment", "created_at", "updated_at"]
+
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv; charset=utf-8"}
+
+Row = Dict[str, Any]
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return "" if value is None else value
+
+
+class RowEncoder:
+    def __init__(self, columns: List[str], export_format: str):
+        self.columns = columns
+        self.export_format = export_format
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer)
+
+    def header(self) -> bytes:
+        if self.export_format != "csv":
+            return b""
+        self._writer.writerow(self.columns)
+        return self._drain()
+
+    def row(self, row: Row) -> bytes:
+        if self.export_format == "csv":
+            self._writer.writerow([_csv_value(row.get(column)) for column in self.columns])
+            return self._drain()
+        return orjson.dumps({column: row.get(column) for column in self.columns}) + b"\n"
+
+    def trailer(self, next_cursor: str) -> bytes:
+        if self.export_format == "csv":
+            return f"# next_cursor={next_cursor}\n".encode()
+        return orjson.dumps({"next_cursor": next_cursor}) + b"\n"
+
+    def _drain(self) -> bytes:
+        data = self._buffer.getvalue().encode()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return data
+
+
+async def _close(documents: AsyncIterator[Dict[str, Any]]) -> None:
+    if hasattr(documents, "aclose"):
+        await documents.aclose()
+    elif hasattr(documents, "close"):
+        await documents.close()
+
+
+async def stream_export(
+    documents: AsyncIterator[Dict[str, Any]],
+    to_row: Callable[[Dict[str, Any]], Row],
+    encoder: RowEncoder
+) -> AsyncIterator[bytes]:
+    deadline = time.monotonic() + settings.EXPORT_TIME_BUDGET_SECONDS
+    chunk = bytearray(encoder.header())
+    try:
+        async for document in documents:
+            last_id = document["_id"]
+            chunk += encoder.row(to_row(document))
+            if time.monotonic() > deadline:
+                chunk += encoder.trailer(encode_cursor([last_id]))
+                break
+            if len(chunk) >= CHUNK_BYTES:
+                yield bytes(chunk)
+                chunk.clear()
+        if chunk:
+            yield bytes(chunk)
+    finally:
+        # Runs on completion, on the budget cut-off and when the client
+        # disconnects, so the server-side cursor is never left open.
+        await _close(documents)
+
+
+def with_id(document: Dict[str, Any]) -> Row:
+    document["id"] = str(document.pop("_id"))
+    return document
+
+
+def review_row(document: Dict[str, Any]) -> Row:
+    row = with_id(document)
+    author = row.pop("author", None) or {}
+    row["author_id"] = author.get("id")
+    row["author_username"] = author.get("username")
+    return row
+
+
+async def export_attendees(
+    db: AsyncIOMotorDatabase,
+    event_id: str,
+    cursor: Optional[str],
+    loader: UserLoader
+) -> AsyncIterator[Dict[str, Any]]:
+    query = apply_cursor({"event_id": event_id}, EXPORT_SORT, cursor)
+    attendees = db.event_attendees.find(query, {"user_id": 1, "registered_at": 1}).sort(EXPORT_SORT)
+    attendees = attendees.batch_size(settings.EXPORT_BATCH_SIZE)
+    try:
+        while True:
+            batch = await attendees.to_list(length=settings.EXPORT_BATCH_SIZE)
+            if not batch:
+                return
+            for attendee in await attach_users(loader, batch, "user_id"):
+                yield attendee
+            loader.clear()
+    finally:
+        await attendees.close()
+
+
+def export_events(db: AsyncIOMotorDatabase, organizer_id: str, cursor: Optional[str]) -> AsyncIterator[Dict[str, Any]]:
+    projection = {column: 1 for column in EVENT_COLUMNS if column != "id"}
+    query = apply_cursor({"organizer_id": organizer_id}, EXPORT_SORT, cursor)
+    return db.events.find(query, projection).sort(EXPORT_SORT).batch_size(settings.EXPORT_BATCH_SIZE)
+
+
+def export_reviews(db: AsyncIOMotorDatabase, event_id: str, cursor: Optional[str]) -> AsyncIterator[Dict[str, Any]]:
+    projection = {field: 1 for field in REVIEW_FIELDS}
+    query = apply_cursor({"event_id": event_id}, EXPORT_SORT, cursor)
+    return db.reviews.find(query, projection).sort(EXPORT_SORT).batch_size(settings.EXPORT_BATCH_SIZE)
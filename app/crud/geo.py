@@ -0,0 +1,260 @@
+import math
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.core.cache import LRUCache
+from app.core.config import get_settings
+from app.crud.pagination import SortSpec, cursor_for, decode_cursor
+from app.db.mongodb import get_list_max_time_ms
+from app.models.event import EventStatus
+
+settings = get_settings()
+
+GEO_SORT: SortSpec = [("distance", 1), ("_id", 1)]
+GEO_RADIUS_BUCKETS = (250, 500, 1000, 2000, 5000, 10000, 20000, 50000, 100000, 200000)
+EARTH_RADIUS_METERS = 6371008.8
+# $geoNear measures on a slightly larger sphere than haversine_meters; widen
+# the candidate search so points right at the radius are not lost.
+CANDIDATE_SLACK = 1.01
+
+geo_cache = LRUCache(settings.GEO_CACHE_MAX_SIZE, settings.GEO_CACHE_TTL_SECONDS)
+
+
+def snap_to_cell(lng: float, lat: float) -> Tuple[float, float]:
+    return round(lng, settings.GEO_CELL_DECIMALS), round(lat, settings.GEO_CELL_DECIMALS)
+
+
+def cell_margin_meters() -> float:
+    # Largest distance between a point and the centre of its cell (at the equator).
+    half_cell = 0.5 * 10 ** -settings.GEO_CELL_DECIMALS
+    return haversine_meters(0, 0, half_cell, half_cell)
+
+
+def bucket_radius(radius: float) -> float:
+    for bucket in GEO_RADIUS_BUCKETS:
+        if radius <= bucket:
+            return min(bucket, settings.GEO_MAX_RADIUS_METERS)
+    return settings.GEO_MAX_RADIUS_METERS
+
+
+def haversine_meters(lng1: float, lat1: float, lng2: float, lat2: float) -> float:
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lng2 - lng1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_METERS * math.asin(math.sqrt(a))
+
+
+def _geo_near_stage(
+    lng: float,
+    lat: float,
+    radius: float,
+    query: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    stage = {
+        "near": {"type": "Point", "coordinates": [lng, lat]},
+        "key": "location.coordinates",
+        "distanceField": "cell_distance",
+        "maxDistance": radius,
+        "spherical": True,
+    }
+    if query:
+        stage["query"] = query
+    return {"$geoNear": stage}
+
+
+def _candidate_radius(radius_bucket: float) -> float:
+    return radius_bucket * CANDIDATE_SLACK + cell_margin_meters()
+
+
+async def _candidates(key: Tuple, collection, pipeline: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    # Candidates are cached per grid cell and radius bucket; distances and the
+    # radius cut-off are then computed from the caller's exact point.
+    candidates = geo_cache.get(key)
+    if candidates is None:
+        candidates = await collection.aggregate(pipeline, maxTimeMS=get_list_max_time_ms()).to_list(
+            length=settings.GEO_MAX_CANDIDATES
+        )
+        for candidate in candidates:
+            candidate.pop("cell_distance", None)
+        geo_cache.set(key, candidates)
+    return candidates
+
+
+def _page(
+    candidates: List[Dict[str, Any]],
+    lng: float,
+    lat: float,
+    radius: float,
+    limit: int,
+    cursor: Optional[str],
+    coordinates: Callable[[Dict[str, Any]], List[float]],
+    accept: Optional[Callable[[Dict[str, Any]], bool]] = None
+) -> Dict[str, Any]:
+    matches = []
+    for candidate in candidates:
+        if accept is not None and not accept(candidate):
+            continue
+        point_lng, point_lat = coordinates(candidate)
+        distance = haversine_meters(lng, lat, point_lng, point_lat)
+        if distance <= radius:
+            matches.append((distance, candidate["_id"], candidate))
+    matches.sort(key=lambda match: (match[0], match[1]))
+
+    if cursor:
+        after = tuple(decode_cursor(cursor, GEO_SORT))
+        matches = [match for match in matches if (match[0], match[1]) > after]
+
+    documents = []
+    for distance, _, candidate in matches[:limit + 1]:
+        document = {key: value for key, value in candidate.items() if key != "venue_location"}
+        document["distance"] = distance
+        documents.append(document)
+
+    next_cursor = None
+    if len(documents) > limit:
+        documents = documents[:limit]
+        next_cursor = cursor_for(documents[-1], GEO_SORT)
+
+    for document in documents:
+        document["id"] = str(document.pop("_id"))
+    return {"items": documents, "next_cursor": next_cursor}
+
+
+def _venue_coordinates(venue: Dict[str, Any]) -> List[float]:
+    return venue["location"]["coordinates"]
+
+
+def _validate_radius(radius: float) -> None:
+    if radius <= 0 or radius > settings.GEO_MAX_RADIUS_METERS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Radius must be between 0 and {settings.GEO_MAX_RADIUS_METERS} meters"
+        )
+
+
+async def find_venues_near(
+    db: AsyncIOMotorDatabase,
+    lng: float,
+    lat: float,
+    radius: float,
+    limit: int = 10,
+    cursor: Optional[str] = None
+) -> Dict[str, Any]:
+    _validate_radius(radius)
+    cell_lng, cell_lat = snap_to_cell(lng, lat)
+    radius_bucket = bucket_radius(radius)
+
+    pipeline = [
+        _geo_near_stage(cell_lng, cell_lat, _candidate_radius(radius_bucket)),
+        {"$limit": settings.GEO_MAX_CANDIDATES},
+    ]
+    candidates = await _candidates(("venues", cell_lng, cell_lat, radius_bucket), db.venues, pipeline)
+    return _page(candidates, lng, lat, radius, limit, cursor, _venue_coordinates)
+
+
+async def find_venues_in_box(
+    db: AsyncIOMotorDatabase,
+    west: float,
+    south: float,
+    east: float,
+    north: float,
+    limit: int = 10,
+    cursor: Optional[str] = None
+) -> Dict[str, Any]:
+    if west >= east or south >= north:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Bounding box must satisfy west < east and south < north"
+        )
+
+    # The box itself is matched exactly on coordinates; candidates come from a
+    # $geoNear circle around the box widened to the cache grid, so a box with
+    # more than GEO_MAX_CANDIDATES venues keeps only those nearest its centre.
+    step = 10 ** -settings.GEO_CELL_DECIMALS
+    grid = (
+        round(math.floor(west / step) * step, settings.GEO_CELL_DECIMALS),
+        round(math.floor(south / step) * step, settings.GEO_CELL_DECIMALS),
+        round(math.ceil(east / step) * step, settings.GEO_CELL_DECIMALS),
+        round(math.ceil(north / step) * step, settings.GEO_CELL_DECIMALS),
+    )
+    grid_lng, grid_lat = (grid[0] + grid[2]) / 2, (grid[1] + grid[3]) / 2
+    grid_radius = max(
+        haversine_meters(grid_lng, grid_lat, corner_lng, corner_lat)
+        for corner_lng in (grid[0], grid[2])
+        for corner_lat in (grid[1], grid[3])
+    )
+    _validate_radius(grid_radius)
+
+    box = {
+        "location.coordinates.0": {"$gte": grid[0], "$lte": grid[2]},
+        "location.coordinates.1": {"$gte": grid[1], "$lte": grid[3]},
+    }
+    pipeline = [
+        _geo_near_stage(grid_lng, grid_lat, grid_radius * CANDIDATE_SLACK, box),
+        {"$limit": settings.GEO_MAX_CANDIDATES},
+    ]
+    candidates = await _candidates(("venues-box",) + grid, db.venues, pipeline)
+
+    def inside(venue: Dict[str, Any]) -> bool:
+        point_lng, point_lat = _venue_coordinates(venue)
+        return west <= point_lng <= east and south <= point_lat <= north
+
+    lng, lat = (west + east) / 2, (south + north) / 2
+    return _page(candidates, lng, lat, math.inf, limit, cursor, _venue_coordinates, inside)
+
+
+async def find_events_near(
+    db: AsyncIOMotorDatabase,
+    lng: float,
+    lat: float,
+    radius: float,
+    limit: int = 10,
+    cursor: Optional[str] = None,
+    upcoming_only: bool = True
+) -> Dict[str, Any]:
+    _validate_radius(radius)
+    cell_lng, cell_lat = snap_to_cell(lng, lat)
+    radius_bucket = bucket_radius(radius)
+
+    event_match: Dict[str, Any] = {
+        "$expr": {"$eq": ["$venue_id", "$$venue_id"]},
+        "status": EventStatus.PUBLISHED.value,
+        "is_private": {"$ne": True},
+    }
+    if upcoming_only:
+        event_match["end_date"] = {"$gte": datetime.utcnow()}
+
+    pipeline = [
+        _geo_near_stage(cell_lng, cell_lat, _candidate_radius(radius_bucket)),
+        {"$limit": settings.GEO_MAX_CANDIDATES},
+        {"$lookup": {
+            "from": "events",
+            "let": {"venue_id": {"$toString": "$_id"}},
+            "pipeline": [
+                {"$match": event_match},
+                {"$limit": settings.GEO_MAX_EVENTS_PER_VENUE},
+            ],
+            "as": "events",
+        }},
+        {"$unwind": "$events"},
+        {"$replaceRoot": {"newRoot": {"$mergeObjects": [
+            "$events",
+            {
+                "venue_location": "$location.coordinates",
+                "venue": {
+                    "id": {"$toString": "$_id"},
+                    "name": "$name",
+                    "address": "$address",
+                    "city": "$city",
+                },
+            },
+        ]}}},
+        {"$limit": settings.GEO_MAX_CANDIDATES},
+    ]
+    key = ("events", cell_lng, cell_lat, radius_bucket, upcoming_only)
+    candidates = await _candidates(key, db.venues, pipeline)
+    return _page(candidates, lng, lat, radius, limit, cursor, lambda event: event["venue_location"])
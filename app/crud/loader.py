@@ -0,0 +1,108 @@
+import asyncio
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+logger = logging.getLogger(__name__)
+
+USER_REF_FIELDS = ("username", "full_name")
+
+
+class UserLoader:
+    def __init__(self, db: AsyncIOMotorDatabase, fields: Tuple[str, ...] = USER_REF_FIELDS):
+        self.db = db
+        self.fields = fields
+        self.queries = 0
+        self._cache: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._dispatch_scheduled = False
+        self._dispatch_task: Optional[asyncio.Task] = None
+
+    def prime(self, user: Dict[str, Any]) -> None:
+        self._cache[user["id"]] = {"id": user["id"], **{field: user.get(field) for field in self.fields}}
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    async def load(self, user_id: Optional[str]) -> Optional[Dict[str, Any]]:
+        # ObjectId(None) would mint a fresh id, so missing and malformed ids
+        # resolve to None here instead of reaching the batched query.
+        if not isinstance(user_id, str) or not ObjectId.is_valid(user_id):
+            return None
+        if user_id in self._cache:
+            return self._cache[user_id]
+
+        future = self._pending.get(user_id)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[user_id] = future
+            if not self._dispatch_scheduled:
+                self._dispatch_scheduled = True
+                loop.call_soon(self._start_dispatch)
+        return await future
+
+    async def load_many(self, user_ids: Iterable[str]) -> List[Optional[Dict[str, Any]]]:
+        return list(await asyncio.gather(*(self.load(user_id) for user_id in user_ids)))
+
+    def _start_dispatch(self) -> None:
+        self._dispatch_task = asyncio.ensure_future(self._dispatch())
+        self._dispatch_task.add_done_callback(self._dispatch_done)
+
+    def _dispatch_done(self, task: asyncio.Task) -> None:
+        if self._dispatch_task is task:
+            self._dispatch_task = None
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("User loader batch failed", exc_info=task.exception())
+
+    async def _fetch(self, user_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        found = {}
+        self.queries += 1
+        cursor = self.db.users.find(
+            {"_id": {"$in": [ObjectId(user_id) for user_id in user_ids]}},
+            {field: 1 for field in self.fields}
+        )
+        async for user in cursor:
+            user_id = str(user.pop("_id"))
+            found[user_id] = {"id": user_id, **{field: user.get(field) for field in self.fields}}
+        return found
+
+    async def _dispatch(self) -> None:
+        pending, self._pending = self._pending, {}
+        self._dispatch_scheduled = False
+
+        try:
+            found = await self._fetch(list(pending))
+        except BaseException as e:
+            # Waiters must never hang: hand them the failure, then let the
+            # task finish with it so _dispatch_done reports it too.
+            for future in pending.values():
+                if future.done():
+                    continue
+                if isinstance(e, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(e)
+            raise
+
+        for user_id, future in pending.items():
+            self._cache[user_id] = found.get(user_id)
+            if not future.done():
+                future.set_result(found.get(user_id))
+
+
+async def attach_users(
+    loader: UserLoader,
+    items: List[Dict[str, Any]],
+    id_field: str,
+    target_field: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    users = await loader.load_many(item.get(id_field) for item in items)
+    for item, user in zip(items, users):
+        if target_field:
+            item[target_field] = user
+        elif user:
+            item.update({key: value for key, value in user.items() if key != "id"})
+    return items
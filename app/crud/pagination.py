@@ -0,0 +1,167 @@
+import asyncio
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from fastapi import HTTPException, status
+
+from app.core.config import get_settings
+from app.crud.counts import get_cached_count, store_count
+from app.db.mongodb import get_list_max_time_ms
+
+settings = get_settings()
+
+SortSpec = List[Tuple[str, int]]
+
+USER_SORT: SortSpec = [("_id", 1)]
+EVENT_SORT: SortSpec = [("start_date", 1), ("_id", 1)]
+VENUE_SORT: SortSpec = [("name", 1), ("_id", 1)]
+REVIEW_SORT: SortSpec = [("created_at", -1), ("_id", -1)]
+ATTENDEE_SORT: SortSpec = [("_id", 1)]
+
+TOTAL_MODES = ("exact", "estimate", "none")
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, ObjectId):
+        return {"$oid": str(value)}
+    if isinstance(value, datetime):
+        return {"$date": value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "$oid" in value:
+            return ObjectId(value["$oid"])
+        if "$date" in value:
+            return datetime.fromisoformat(value["$date"])
+        raise ValueError("Unknown cursor value")
+    return value
+
+
+def _get_field(document: Dict[str, Any], field: str) -> Any:
+    if field == "_id" and "_id" not in document:
+        return ObjectId(document["id"])
+    value: Any = document
+    for part in field.split("."):
+        value = value.get(part) if isinstance(value, dict) else None
+    return value
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    raw = json.dumps([_encode_value(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: SortSpec) -> List[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(sort):
+            raise ValueError("Cursor does not match sort order")
+        return [_decode_value(v) for v in values]
+    except (ValueError, TypeError, InvalidId, binascii.Error):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
+
+
+def keyset_filter(sort: SortSpec, values: Sequence[Any]) -> Dict[str, Any]:
+    clauses = []
+    for i, (field, direction) in enumerate(sort):
+        clause = {prev_field: values[j] for j, (prev_field, _) in enumerate(sort[:i])}
+        clause[field] = {"$gt" if direction == 1 else "$lt": values[i]}
+        clauses.append(clause)
+    return clauses[0] if len(clauses) == 1 else {"$or": clauses}
+
+
+def apply_cursor(query: Dict[str, Any], sort: SortSpec, cursor: Optional[str]) -> Dict[str, Any]:
+    if not cursor:
+        return query
+    keyset = keyset_filter(sort, decode_cursor(cursor, sort))
+    return {"$and": [query, keyset]} if query else keyset
+
+
+def cursor_for(document: Dict[str, Any], sort: SortSpec) -> str:
+    return encode_cursor([_get_field(document, field) for field, _ in sort])
+
+
+async def fetch_page(
+    collection,
+    query: Dict[str, Any],
+    sort: SortSpec,
+    limit: int,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    projection: Optional[Dict[str, Any]] = None
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    find = collection.find(apply_cursor(query, sort, cursor), projection).sort(sort)
+    find = find.max_time_ms(get_list_max_time_ms())
+    if not cursor and offset:
+        find = find.skip(offset)
+    documents = await find.limit(limit + 1).to_list(length=limit + 1)
+
+    return _split_page(documents, sort, limit)
+
+
+def _split_page(documents: List[Dict[str, Any]], sort: SortSpec, limit: int) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    if len(documents) <= limit:
+        return documents, None
+    documents = documents[:limit]
+    return documents, cursor_for(documents[-1], sort)
+
+
+async def count_total(collection, query: Dict[str, Any], total_mode: str) -> Tuple[int, bool]:
+    if not query:
+        return await collection.estimated_document_count(), True
+
+    if total_mode == "estimate":
+        total = await collection.count_documents(
+            query,
+            limit=settings.PAGINATION_ESTIMATE_CAP,
+            maxTimeMS=get_list_max_time_ms()
+        )
+        return total, total >= settings.PAGINATION_ESTIMATE_CAP
+
+    total = get_cached_count(collection.name, query)
+    if total is None:
+        total = await collection.count_documents(query, maxTimeMS=get_list_max_time_ms())
+        store_count(collection.name, query, total)
+    return total, False
+
+
+async def fetch_page_with_total(
+    collection,
+    query: Dict[str, Any],
+    sort: SortSpec,
+    limit: int,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    projection: Optional[Dict[str, Any]] = None,
+    total_mode: str = "exact"
+) -> Dict[str, Any]:
+    # The page always comes from the cursor-bounded find so later pages start at
+    # the keyset instead of re-reading everything before it; the total is a
+    # separate count that is cached per filter (exact) or capped (estimate).
+    if total_mode == "none":
+        documents, next_cursor = await fetch_page(collection, query, sort, limit, offset, cursor, projection)
+        total, total_is_estimate = None, False
+    else:
+        (documents, next_cursor), (total, total_is_estimate) = await asyncio.gather(
+            fetch_page(collection, query, sort, limit, offset, cursor, projection),
+            count_total(collection, query, total_mode)
+        )
+
+    return {
+        "items": documents,
+        "next_cursor": next_cursor,
+        "has_more": next_cursor is not None,
+        "total": total,
+        "total_is_estimate": total_is_estimate,
+    }
@@ -0,0 +1,112 @@
+from typing import Any, Dict, Iterable, Optional
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
+
+RATING_VALUES = range(1, 6)
+
+
+def empty_summary() -> Dict[str, Any]:
+    return {"count": 0, "sum": 0, "distribution": {str(value): 0 for value in RATING_VALUES}}
+
+
+def normalize_summary(summary: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    summary = summary or {}
+    distribution = summary.get("distribution", {})
+    return {
+        "count": summary.get("count", 0),
+        "sum": summary.get("sum", 0),
+        "distribution": {str(value): distribution.get(str(value), 0) for value in RATING_VALUES},
+    }
+
+
+def rating_delta(old_rating: Optional[int], new_rating: Optional[int]) -> Dict[str, int]:
+    delta: Dict[str, int] = {}
+    for rating, sign in ((old_rating, -1), (new_rating, 1)):
+        if rating is None:
+            continue
+        for field, amount in (
+            ("rating_summary.count", 1),
+            ("rating_summary.sum", rating),
+            (f"rating_summary.distribution.{rating}", 1),
+        ):
+            delta[field] = delta.get(field, 0) + sign * amount
+    return {field: amount for field, amount in delta.items() if amount}
+
+
+async def apply_rating_change(
+    db: AsyncIOMotorDatabase,
+    event_id: str,
+    old_rating: Optional[int],
+    new_rating: Optional[int]
+) -> None:
+    delta = rating_delta(old_rating, new_rating)
+    if not delta:
+        return
+    try:
+        event_oid = ObjectId(event_id)
+    except InvalidId:
+        return
+    await db.events.update_one({"_id": event_oid}, {"$inc": delta})
+
+
+def rating_summary_response(summary: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    summary = normalize_summary(summary)
+    count = summary["count"]
+    return {
+        "average_rating": round(summary["sum"] / count, 2) if count else 0.0,
+        "ratings_count": count,
+        "ratings_distribution": summary["distribution"],
+    }
+
+
+async def get_rating_summary(db: AsyncIOMotorDatabase, event_id: str) -> Optional[Dict[str, Any]]:
+    try:
+        event = await db.events.find_one({"_id": ObjectId(event_id)}, {"rating_summary": 1})
+    except InvalidId:
+        return None
+    if not event:
+        return None
+    return rating_summary_response(event.get("rating_summary"))
+
+
+async def compute_rating_summaries(
+    db: AsyncIOMotorDatabase,
+    event_ids: Optional[Iterable[str]] = None
+) -> Dict[str, Dict[str, Any]]:
+    pipeline = []
+    if event_ids is not None:
+        pipeline.append({"$match": {"event_id": {"$in": list(event_ids)}}})
+    pipeline.append({"$group": {"_id": {"event_id": "$event_id", "rating": "$rating"}, "count": {"$sum": 1}}})
+
+    summaries: Dict[str, Dict[str, Any]] = {}
+    async for row in db.reviews.aggregate(pipeline):
+        summary = summaries.setdefault(row["_id"]["event_id"], empty_summary())
+        rating = row["_id"]["rating"]
+        summary["count"] += row["count"]
+        summary["sum"] += rating * row["count"]
+        summary["distribution"][str(rating)] = row["count"]
+    return summaries
+
+
+async def recompute_rating_summaries(
+    db: AsyncIOMotorDatabase,
+    repair: bool = False,
+    batch_size: int = 500
+) -> Dict[str, int]:
+    summaries = await compute_rating_summaries(db)
+
+    checked = 0
+    operations = []
+    async for event in db.events.find({}, {"rating_summary": 1}).batch_size(batch_size):
+        checked += 1
+        expected = summaries.get(str(event["_id"]), empty_summary())
+        if "rating_summary" not in event or normalize_summary(event["rating_summary"]) != expected:
+            operations.append(UpdateOne({"_id": event["_id"]}, {"$set": {"rating_summary": expected}}))
+
+    if repair:
+        for start in range(0, len(operations), batch_size):
+            await db.events.bulk_write(operations[start:start + batch_size], ordered=False)
+    return {"checked": checked, "inconsistent": len(operations), "repaired": len(operations) if repair else 0}
@@ -0,0 +1,242 @@
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument
+
+from app.core.config import get_settings
+from app.crud.search import normalize_lookup
+from app.db.mongodb import get_database
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+VERSION_DOCUMENT_ID = "reference_versions"
+CHANGES_COLLECTION = "reference_changes"
+
+
+class ReferenceCache:
+    def __init__(self, collection: str, fields: Tuple[str, ...]):
+        self.collection = collection
+        self.fields = fields
+        self.by_id: Dict[str, Dict[str, Any]] = {}
+        self.by_name: Dict[str, Dict[str, Any]] = {}
+        self.version: Optional[int] = None
+        self.loaded_at: Optional[float] = None
+        self.checked_at: Optional[float] = None
+        self.hits = 0
+        self.misses = 0
+
+    def _entry(self, document: Dict[str, Any]) -> Dict[str, Any]:
+        entry = {"id": str(document["_id"])}
+        entry.update({field: document.get(field) for field in self.fields})
+        return entry
+
+    def _store(self, entry: Dict[str, Any]) -> None:
+        self._discard(entry["id"])
+        self.by_id[entry["id"]] = entry
+        if entry.get("name"):
+            self.by_name[normalize_lookup(entry["name"])] = entry
+
+    def _discard(self, document_id: str) -> None:
+        entry = self.by_id.pop(document_id, None)
+        if entry and entry.get("name"):
+            key = normalize_lookup(entry["name"])
+            if self.by_name.get(key) is entry:
+                del self.by_name[key]
+
+    async def load(self, db: AsyncIOMotorDatabase, version: Optional[int] = None) -> None:
+        projection = {field: 1 for field in self.fields}
+        by_id = {}
+        by_name = {}
+        async for document in db[self.collection].find({}, projection):
+            entry = self._entry(document)
+            by_id[entry["id"]] = entry
+            if entry.get("name"):
+                by_name[normalize_lookup(entry["name"])] = entry
+        self.by_id, self.by_name = by_id, by_name
+        self.version = version
+        self.loaded_at = self.checked_at = time.monotonic()
+
+    async def reload(self, db: AsyncIOMotorDatabase, document_ids: Iterable[str]) -> None:
+        object_ids = []
+        for document_id in set(document_ids):
+            try:
+                object_ids.append(ObjectId(document_id))
+            except (InvalidId, TypeError):
+                continue
+        if not object_ids:
+            return
+        projection = {field: 1 for field in self.fields}
+        found = set()
+        async for document in db[self.collection].find({"_id": {"$in": object_ids}}, projection):
+            entry = self._entry(document)
+            self._store(entry)
+            found.add(entry["id"])
+        for object_id in object_ids:
+            if str(object_id) not in found:
+                self._discard(str(object_id))
+
+    async def get_by_id(self, db: AsyncIOMotorDatabase, document_id: str) -> Optional[Dict[str, Any]]:
+        entry = self.by_id.get(document_id)
+        if entry is not None:
+            self.hits += 1
+            return dict(entry)
+
+        self.misses += 1
+        try:
+            document = await db[self.collection].find_one(
+                {"_id": ObjectId(document_id)},
+                {field: 1 for field in self.fields}
+            )
+        except InvalidId:
+            return None
+        if document is None:
+            return None
+        entry = self._entry(document)
+        self._store(entry)
+        return dict(entry)
+
+    async def get_by_name(self, db: AsyncIOMotorDatabase, name: str) -> Optional[Dict[str, Any]]:
+        normalized = normalize_lookup(name)
+        entry = self.by_name.get(normalized)
+        if entry is not None:
+            self.hits += 1
+            return dict(entry)
+
+        self.misses += 1
+        document = await db[self.collection].find_one(
+            {"name_normalized": normalized},
+            {field: 1 for field in self.fields}
+        )
+        if document is None:
+            return None
+        entry = self._entry(document)
+        self._store(entry)
+        return dict(entry)
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        total = self.hits + self.misses
+        return {
+            "size": len(self.by_id),
+            "version": self.version,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "age_seconds": now - self.loaded_at if self.loaded_at is not None else None,
+            "staleness_seconds": now - self.checked_at if self.checked_at is not None else None,
+        }
+
+
+category_cache = ReferenceCache("categories", ("name",))
+venue_cache = ReferenceCache("venues", ("name", "address", "city"))
+
+reference_caches = {cache.collection: cache for cache in (category_cache, venue_cache)}
+
+_poll_task: Optional[asyncio.Task] = None
+
+
+async def _versions(db: AsyncIOMotorDatabase) -> Dict[str, int]:
+    document = await db.meta.find_one({"_id": VERSION_DOCUMENT_ID}) or {}
+    return {collection: document.get(collection, 0) for collection in reference_caches}
+
+
+async def _changed_ids(db: AsyncIOMotorDatabase, collection: str, since: int, until: int) -> Optional[List[str]]:
+    changes = await db[CHANGES_COLLECTION].find(
+        {"collection": collection, "version": {"$gt": since, "$lte": until}},
+        {"ids": 1}
+    ).to_list(length=None)
+    # A change recorded without ids, or a gap left by an expired or still
+    # in-flight entry, means we cannot tell what moved: reload everything.
+    if len(changes) != until - since or any(change.get("ids") is None for change in changes):
+        return None
+    return [document_id for change in changes for document_id in change["ids"]]
+
+
+async def refresh_reference_caches(db: AsyncIOMotorDatabase) -> None:
+    versions = await _versions(db)
+    now = time.monotonic()
+    for collection, cache in reference_caches.items():
+        version = versions[collection]
+        if cache.version != version:
+            changed = None
+            if cache.version is not None and cache.version < version:
+                changed = await _changed_ids(db, collection, cache.version, version)
+            if changed is None:
+                await cache.load(db, version)
+            else:
+                await cache.reload(db, changed)
+                cache.version = version
+        cache.checked_at = now
+
+
+async def reference_changed(
+    db: AsyncIOMotorDatabase,
+    collection: str,
+    document_ids: Optional[Iterable[str]] = None
+) -> None:
+    ids = sorted(set(document_ids)) if document_ids is not None else None
+    versions = await db.meta.find_one_and_update(
+        {"_id": VERSION_DOCUMENT_ID},
+        {"$inc": {collection: 1}},
+        upsert=True,
+        return_document=ReturnDocument.AFTER
+    )
+    await db[CHANGES_COLLECTION].insert_one({
+        "collection": collection,
+        "version": versions[collection],
+        "ids": ids,
+        "created_at": datetime.utcnow(),
+    })
+
+    # The local cache keeps its version: other workers may have bumped it in
+    # between, and the poller replays every change after it idempotently.
+    cache = reference_caches[collection]
+    if ids is None:
+        await cache.load(db, cache.version)
+    else:
+        await cache.reload(db, ids)
+
+
+async def _poll_versions() -> None:
+    while True:
+        await asyncio.sleep(settings.REFERENCE_CACHE_POLL_SECONDS)
+        try:
+            await refresh_reference_caches(get_database())
+        except Exception:
+            logger.exception("Reference cache refresh failed")
+
+
+async def preload_reference_cache() -> None:
+    # Runs inside the readiness warm-up rather than at startup, so an
+    # unreachable MongoDB delays readiness instead of killing the worker.
+    if settings.REFERENCE_CACHE_ENABLED:
+        await refresh_reference_caches(get_database())
+
+
+async def start_reference_cache() -> None:
+    global _poll_task
+    if not settings.REFERENCE_CACHE_ENABLED:
+        return
+    _poll_task = asyncio.create_task(_poll_versions())
+
+
+async def stop_reference_cache() -> None:
+    global _poll_task
+    if _poll_task is not None:
+        _poll_task.cancel()
+        try:
+            await _poll_task
+        except asyncio.CancelledError:
+            pass
+        _poll_task = None
+
+
+def get_reference_cache_stats() -> Dict[str, Dict[str, Any]]:
+    return {collection: cache.stats() for collection, cache in reference_caches.items()}
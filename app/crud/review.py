@@ -0,0 +1,117 @@
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument
+
+from app.crud.counts import bump_generation
+from app.crud.pagination import REVIEW_SORT, fetch_page_with_total
+from app.crud.rating import apply_rating_change
+from app.models.review import ReviewCreate, ReviewUpdate
+
+
+def _to_response(review: Dict[str, Any]) -> Dict[str, Any]:
+    review["id"] = str(review["_id"])
+    del review["_id"]
+    return review
+
+
+def author_ref(user: Dict[str, Any]) -> Dict[str, Any]:
+    return {"id": user["id"], "username": user["username"], "full_name": user.get("full_name")}
+
+
+async def get_review(db: AsyncIOMotorDatabase, review_id: str) -> Optional[Dict[str, Any]]:
+    try:
+        review = await db.reviews.find_one({"_id": ObjectId(review_id)})
+    except InvalidId:
+        return None
+    return _to_response(review) if review else None
+
+
+async def get_event_reviews_page(
+    db: AsyncIOMotorDatabase,
+    event_id: str,
+    limit: int = 10,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    total_mode: str = "none"
+) -> Dict[str, Any]:
+    page = await fetch_page_with_total(
+        db.reviews,
+        {"event_id": event_id},
+        REVIEW_SORT,
+        limit,
+        offset=offset,
+        cursor=cursor,
+        total_mode=total_mode
+    )
+    page["items"] = [_to_response(review) for review in page["items"]]
+    return page
+
+
+async def create_review(
+    db: AsyncIOMotorDatabase,
+    author: Dict[str, Any],
+    review_data: ReviewCreate
+) -> Optional[Dict[str, Any]]:
+    try:
+        event = await db.events.find_one({"_id": ObjectId(review_data.event_id)}, {"_id": 1})
+    except InvalidId:
+        return None
+    if not event:
+        return None
+
+    now = datetime.utcnow()
+    review = review_data.model_dump()
+    review.update({"author": author_ref(author), "created_at": now, "updated_at": now})
+
+    await db.reviews.insert_one(review)
+    bump_generation("reviews")
+    await apply_rating_change(db, review["event_id"], None, review["rating"])
+    return _to_response(review)
+
+
+async def update_review(
+    db: AsyncIOMotorDatabase,
+    review_id: str,
+    review_data: ReviewUpdate
+) -> Optional[Dict[str, Any]]:
+    try:
+        object_id = ObjectId(review_id)
+    except InvalidId:
+        return None
+
+    update_data = {k: v for k, v in review_data.model_dump(exclude_unset=True).items() if v is not None}
+    update_data["updated_at"] = datetime.utcnow()
+
+    # The rating being replaced comes from the before-image of this very write,
+    # so concurrent edits of one review each subtract the value they overwrote.
+    before = await db.reviews.find_one_and_update(
+        {"_id": object_id},
+        {"$set": update_data},
+        return_document=ReturnDocument.BEFORE
+    )
+    if not before:
+        return None
+    bump_generation("reviews")
+
+    if "rating" in update_data:
+        await apply_rating_change(db, before["event_id"], before.get("rating"), update_data["rating"])
+    before.update(update_data)
+    return _to_response(before)
+
+
+async def delete_review(db: AsyncIOMotorDatabase, review_id: str) -> bool:
+    try:
+        object_id = ObjectId(review_id)
+    except InvalidId:
+        return False
+
+    review = await db.reviews.find_one_and_delete({"_id": object_id}, projection={"event_id": 1, "rating": 1})
+    if not review:
+        return False
+    bump_generation("reviews")
+    await apply_rating_change(db, review["event_id"], review.get("rating"), None)
+    return True
@@ -0,0 +1,136 @@
+import asyncio
+import re
+import unicodedata
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+
+from app.crud.pagination import SortSpec, count_total
+from app.db.mongodb import get_list_max_time_ms
+
+TEXT_SCORE = {"$meta": "textScore"}
+
+EVENT_TEXT_INDEX = {
+    "keys": [("title", "text"), ("description", "text")],
+    "weights": {"title": 10, "description": 1},
+    "default_language": "russian",
+    "name": "events_text",
+}
+
+VENUE_TEXT_INDEX = {
+    "keys": [("name", "text"), ("address", "text"), ("description", "text")],
+    "weights": {"name": 10, "address": 5, "description": 1},
+    "default_language": "russian",
+    "name": "venues_text",
+}
+
+VENUE_LOOKUP_FIELDS = {"name": "name_normalized", "city": "city_normalized", "country": "country_normalized"}
+CATEGORY_LOOKUP_FIELDS = {"name": "name_normalized"}
+
+VENUE_LOOKUP_INDEXES = [
+    [("country_normalized", 1), ("city_normalized", 1)],
+    [("city_normalized", 1)],
+    [("name_normalized", 1)],
+    [("capacity", 1)],
+]
+
+
+def normalize_lookup(value: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", value.casefold())
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(stripped.split())
+
+
+def lookup_fields(data: Dict[str, Any], fields: Dict[str, str]) -> Dict[str, str]:
+    return {
+        normalized: normalize_lookup(data[field])
+        for field, normalized in fields.items()
+        if data.get(field)
+    }
+
+
+def venue_lookup_fields(venue_data: Dict[str, Any]) -> Dict[str, str]:
+    return lookup_fields(venue_data, VENUE_LOOKUP_FIELDS)
+
+
+def lookup_filter(value: str, match: str = "exact") -> Any:
+    normalized = normalize_lookup(value)
+    if match == "prefix":
+        return {"$regex": "^" + re.escape(normalized)}
+    if match == "contains":
+        return {"$regex": re.escape(normalized)}
+    return normalized
+
+
+def text_search_filter(search: str) -> Dict[str, Any]:
+    return {"$search": search}
+
+
+def is_text_search(query: Dict[str, Any]) -> bool:
+    return "$text" in query
+
+
+def search_projection(query: Dict[str, Any], projection: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+    if not is_text_search(query):
+        return projection
+    projection = dict(projection or {})
+    projection["score"] = TEXT_SCORE
+    return projection
+
+
+def search_sort(query: Dict[str, Any], sort: SortSpec) -> List[Tuple[str, Any]]:
+    if not is_text_search(query):
+        return list(sort)
+    return [("score", TEXT_SCORE)] + list(sort)
+
+
+async def fetch_search_page(
+    collection,
+    query: Dict[str, Any],
+    sort: SortSpec,
+    limit: int,
+    offset: int = 0,
+    projection: Optional[Dict[str, Any]] = None
+) -> List[Dict[str, Any]]:
+    cursor = collection.find(query, search_projection(query, projection)).sort(search_sort(query, sort))
+    cursor = cursor.max_time_ms(get_list_max_time_ms())
+    documents = await cursor.skip(offset).limit(limit).to_list(length=limit)
+    for document in documents:
+        document.pop("score", None)
+    return documents
+
+
+async def fetch_search_page_with_total(
+    collection,
+    query: Dict[str, Any],
+    sort: SortSpec,
+    limit: int,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    projection: Optional[Dict[str, Any]] = None,
+    total_mode: str = "none"
+) -> Dict[str, Any]:
+    # Results are ranked by text score, which a keyset cursor cannot encode, so
+    # search pages by offset only; one extra document tells whether more follow.
+    if cursor:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cursor pagination is not supported with search, use offset"
+        )
+
+    if total_mode == "none":
+        documents = await fetch_search_page(collection, query, sort, limit + 1, offset, projection)
+        total, total_is_estimate = None, False
+    else:
+        documents, (total, total_is_estimate) = await asyncio.gather(
+            fetch_search_page(collection, query, sort, limit + 1, offset, projection),
+            count_total(collection, query, total_mode)
+        )
+
+    return {
+        "items": documents[:limit],
+        "next_cursor": None,
+        "has_more": len(documents) > limit,
+        "total": total,
+        "total_is_estimate": total_is_estimate,
+    }
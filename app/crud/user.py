@@ -1,12 +1,25 @@
+import time
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, NoReturn
 from bson import ObjectId
+from bson.errors import InvalidId
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
 from fastapi import HTTPException, status
 
-from app.core.security import verify_password, get_password_hash
+from app.core.cache import LRUCache
+from app.core.config import get_settings
+from app.core.hashing import async_verify_password, async_get_password_hash
+from app.crud.counts import bump_generation, get_cached_count, store_count
+from app.crud.pagination import USER_SORT, fetch_page_with_total
+from app.db.read_model import ORGANIZER_FIELDS, propagate_user, schedule_propagation
 from app.models.user import UserCreate, UserUpdate, UserRole
 
+settings = get_settings()
+
+user_cache = LRUCache(settings.USER_CACHE_MAX_SIZE, settings.USER_CACHE_TTL_SECONDS)
+
 
 async def get_user_by_id(db: AsyncIOMotorDatabase, user_id: str) -> Optional[Dict[str, Any]]:
     try:
@@ -21,10 +34,50 @@ async def get_user_by_id(db: AsyncIOMotorDatabase, user_id: str) -> Optional[Dic
             del user["password"]
         
         return user
-    except Exception:
+    except InvalidId:
         return None
 
 
+async def get_cached_user(db: AsyncIOMotorDatabase, user_id: str) -> Optional[Dict[str, Any]]:
+    now = time.monotonic()
+    # Hits are recorded only once the entry is known to be current, so stale
+    # entries that get refetched count as misses.
+    entry = user_cache.get_entry(user_id, record=False)
+    
+    if entry is not None:
+        stored_at, (user, version, checked_at) = entry
+        if now - checked_at <= settings.USER_CACHE_STALE_SECONDS:
+            user_cache.record(hit=True)
+            return dict(user)
+        
+        try:
+            current = await db.users.find_one({"_id": ObjectId(user_id)}, {"version": 1})
+        except InvalidId:
+            return None
+        
+        if current is None:
+            user_cache.record(hit=False)
+            invalidate_cached_user(user_id)
+            return None
+        
+        if current.get("version", 0) == version:
+            user_cache.record(hit=True)
+            user_cache.set(user_id, (user, version, now), stored_at=stored_at)
+            return dict(user)
+    
+    user_cache.record(hit=False)
+    user = await get_user_by_id(db, user_id)
+    if user is None:
+        return None
+    
+    user_cache.set(user_id, (user, user.get("version", 0), now))
+    return dict(user)
+
+
+def invalidate_cached_user(user_id: str) -> None:
+    user_cache.delete(user_id)
+
+
 async def get_user_by_email(db: AsyncIOMotorDatabase, email: str) -> Optional[Dict[str, Any]]:
     user = await db.users.find_one({"email": email})
     if not user:
@@ -72,40 +125,86 @@ async def get_users(
     return users
 
 
-async def get_users_count(db: AsyncIOMotorDatabase, role: Optional[UserRole] = None) -> int:
+async def get_users_page(
+    db: AsyncIOMotorDatabase,
+    limit: int = 10,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    role: Optional[UserRole] = None,
+    total_mode: str = "none"
+) -> Dict[str, Any]:
     query = {}
     if role:
         query["role"] = role
     
-    return await db.users.count_documents(query)
+    page = await fetch_page_with_total(
+        db.users,
+        query,
+        USER_SORT,
+        limit,
+        offset=offset,
+        cursor=cursor,
+        projection={"password": 0},
+        total_mode=total_mode
+    )
+    
+    for user in page["items"]:
+        user["id"] = str(user["_id"])
+        del user["_id"]
+    
+    return page
 
 
-async def create_user(db: AsyncIOMotorDatabase, user_data: UserCreate) -> Dict[str, Any]:
-    if await get_user_by_email(db, user_data.email):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered"
-        )
+async def get_users_count(db: AsyncIOMotorDatabase, role: Optional[UserRole] = None) -> int:
+    query = {}
+    if role:
+        query["role"] = role
     
-    if await get_user_by_username(db, user_data.username):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Username already taken"
-        )
+    if not query:
+        return await db.users.estimated_document_count()
+    
+    total = get_cached_count("users", query)
+    if total is None:
+        total = await db.users.count_documents(query)
+        store_count("users", query, total)
+    
+    return total
+
+
+def raise_duplicate_user_error(error: DuplicateKeyError) -> NoReturn:
+    key_pattern = (error.details or {}).get("keyPattern") or {}
+    if "username" in key_pattern or ("email" not in key_pattern and "username" in str(error)):
+        detail = "Username already taken"
+    else:
+        detail = "Email already registered"
     
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=detail
+    )
+
+
+async def create_user(db: AsyncIOMotorDatabase, user_data: UserCreate) -> Dict[str, Any]:
     user_dict = user_data.model_dump()
     now = datetime.utcnow()
     
-    hashed_password = get_password_hash(user_dict["password"])
+    hashed_password = await async_get_password_hash(user_dict["password"])
     user_dict["password"] = hashed_password
     user_dict["role"] = UserRole.USER
     user_dict["created_at"] = now
     user_dict["updated_at"] = now
     
-    result = await db.users.insert_one(user_dict)
+    try:
+        result = await db.users.insert_one(user_dict)
+    except DuplicateKeyError as e:
+        raise_duplicate_user_error(e)
+    bump_generation("users")
+    
+    user_dict["id"] = str(result.inserted_id)
+    del user_dict["_id"]
+    del user_dict["password"]
     
-    created_user = await get_user_by_id(db, str(result.inserted_id))
-    return created_user
+    return user_dict
 
 
 async def update_user(
@@ -113,38 +212,46 @@ async def update_user(
     user_id: str, 
     user_data: UserUpdate
 ) -> Optional[Dict[str, Any]]:
-    user = await get_user_by_id(db, user_id)
-    if not user:
+    try:
+        object_id = ObjectId(user_id)
+    except InvalidId:
         return None
     
     update_data = {k: v for k, v in user_data.model_dump(exclude_unset=True).items() if v is not None}
+    update_data["updated_at"] = datetime.utcnow()
     
-    if "email" in update_data and update_data["email"] != user["email"]:
-        if await get_user_by_email(db, update_data["email"]):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already registered"
-            )
+    try:
+        user = await db.users.find_one_and_update(
+            {"_id": object_id},
+            {"$set": update_data, "$inc": {"version": 1}},
+            projection={"password": 0},
+            return_document=ReturnDocument.AFTER
+        )
+    except DuplicateKeyError as e:
+        raise_duplicate_user_error(e)
     
-    if "username" in update_data and update_data["username"] != user["username"]:
-        if await get_user_by_username(db, update_data["username"]):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Username already taken"
-            )
+    invalidate_cached_user(user_id)
+    bump_generation("users")
     
-    update_data["updated_at"] = datetime.utcnow()
+    if not user:
+        return None
+    
+    user["id"] = str(user["_id"])
+    del user["_id"]
     
-    await db.users.update_one({"_id": ObjectId(user_id)}, {"$set": update_data})
+    if any(field in update_data for field in ORGANIZER_FIELDS):
+        schedule_propagation(propagate_user(db, user))
     
-    return await get_user_by_id(db, user_id)
+    return user
 
 
 async def delete_user(db: AsyncIOMotorDatabase, user_id: str) -> bool:
     try:
         result = await db.users.delete_one({"_id": ObjectId(user_id)})
+        invalidate_cached_user(user_id)
+        bump_generation("users")
         return result.deleted_count > 0
-    except Exception:
+    except InvalidId:
         return False
 
 
@@ -153,19 +260,23 @@ async def authenticate_user(
     username_or_email: str, 
     password: str
 ) -> Optional[Dict[str, Any]]:
-    user = await get_user_by_username(db, username_or_email)
-    
-    if not user:
-        user = await get_user_by_email(db, username_or_email)
+    cursor = db.users.find(
+        {"$or": [{"username": username_or_email}, {"email": username_or_email}]},
+        {"username": 1, "email": 1, "role": 1, "password": 1}
+    ).limit(2)
+    candidates = await cursor.to_list(length=2)
     
-    if not user:
+    if not candidates:
         return None
     
-    user_with_password = await db.users.find_one({"_id": ObjectId(user["id"])})
+    user = next((c for c in candidates if c["username"] == username_or_email), candidates[0])
     
-    if not verify_password(password, user_with_password["password"]):
+    if not await async_verify_password(password, user.pop("password"), fail_fast=True):
         return None
     
+    user["id"] = str(user["_id"])
+    del user["_id"]
+    
     return user
 
 
@@ -175,18 +286,22 @@ async def change_user_password(
     current_password: str,
     new_password: str
 ) -> bool:
-    user = await db.users.find_one({"_id": ObjectId(user_id)})
+    user = await db.users.find_one({"_id": ObjectId(user_id)}, {"password": 1})
     if not user:
         return False
     
-    if not verify_password(current_password, user["password"]):
+    if not await async_verify_password(current_password, user["password"]):
         return False
     
-    hashed_password = get_password_hash(new_password)
+    hashed_password = await async_get_password_hash(new_password)
     
     await db.users.update_one(
         {"_id": ObjectId(user_id)},
-        {"$set": {"password": hashed_password, "updated_at": datetime.utcnow()}}
+        {
+            "$set": {"password": hashed_password, "updated_at": datetime.utcnow()},
+            "$inc": {"version": 1}
+        }
     )
+    invalidate_cached_user(user_id)
     
     return True 
\ No newline at end of file
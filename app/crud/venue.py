@@ -0,0 +1,65 @@
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument
+
+from app.crud.counts import bump_generation
+from app.crud.reference import reference_changed
+from app.crud.search import VENUE_LOOKUP_FIELDS, venue_lookup_fields
+from app.db.read_model import VENUE_FIELDS, propagate_venue, schedule_propagation
+from app.models.venue import VenueCreate, VenueUpdate
+
+
+def venue_document(venue_data: VenueCreate, now: datetime) -> Dict[str, Any]:
+    document = venue_data.model_dump()
+    document.update(venue_lookup_fields(document))
+    document["created_at"] = now
+    document["updated_at"] = now
+    return document
+
+
+async def create_venue(db: AsyncIOMotorDatabase, venue_data: VenueCreate) -> Dict[str, Any]:
+    venue = venue_document(venue_data, datetime.utcnow())
+    result = await db.venues.insert_one(venue)
+    bump_generation("venues")
+    await reference_changed(db, "venues", [str(result.inserted_id)])
+
+    venue["id"] = str(result.inserted_id)
+    del venue["_id"]
+    return venue
+
+
+async def update_venue(
+    db: AsyncIOMotorDatabase,
+    venue_id: str,
+    venue_data: VenueUpdate
+) -> Optional[Dict[str, Any]]:
+    try:
+        object_id = ObjectId(venue_id)
+    except InvalidId:
+        return None
+
+    update_data = {k: v for k, v in venue_data.model_dump(exclude_unset=True).items() if v is not None}
+    update_data.update(venue_lookup_fields(update_data))
+    update_data["updated_at"] = datetime.utcnow()
+
+    venue = await db.venues.find_one_and_update(
+        {"_id": object_id},
+        {"$set": update_data},
+        return_document=ReturnDocument.AFTER
+    )
+    bump_generation("venues")
+    if not venue:
+        return None
+
+    venue["id"] = str(venue["_id"])
+    del venue["_id"]
+
+    if any(field in update_data for field in (*VENUE_FIELDS, *VENUE_LOOKUP_FIELDS)):
+        await reference_changed(db, "venues", [venue["id"]])
+    if any(field in update_data for field in VENUE_FIELDS):
+        schedule_propagation(propagate_venue(db, venue))
+    return venue
@@ -0,0 +1,253 @@
+import argparse
+import asyncio
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo import ASCENDING, GEOSPHERE, IndexModel
+
+from app.core.config import get_settings
+from app.crud.search import EVENT_TEXT_INDEX, VENUE_LOOKUP_INDEXES, VENUE_TEXT_INDEX
+
+settings = get_settings()
+
+MANIFEST_VERSION = 6
+
+
+def text_index(spec: Dict[str, Any]) -> IndexModel:
+    options = {key: value for key, value in spec.items() if key != "keys"}
+    return IndexModel(spec["keys"], **options)
+
+
+INDEX_MANIFEST: Dict[str, List[IndexModel]] = {
+    "users": [
+        IndexModel([("email", ASCENDING)], unique=True),
+        IndexModel([("username", ASCENDING)], unique=True),
+    ],
+    "categories": [
+        IndexModel([("name", ASCENDING)], unique=True),
+        IndexModel([("name_normalized", ASCENDING)]),
+    ],
+    "venues": [
+        IndexModel([("name", ASCENDING)]),
+        IndexModel([("location.coordinates", GEOSPHERE)]),
+        text_index(VENUE_TEXT_INDEX),
+        *[IndexModel(keys) for keys in VENUE_LOOKUP_INDEXES],
+    ],
+    "events": [
+        IndexModel([("title", ASCENDING)]),
+        text_index(EVENT_TEXT_INDEX),
+        IndexModel([("start_date", ASCENDING), ("_id", ASCENDING)]),
+        IndexModel([("status", ASCENDING), ("start_date", ASCENDING), ("_id", ASCENDING)]),
+        IndexModel([("status", ASCENDING), ("price", ASCENDING), ("start_date", ASCENDING)]),
+        IndexModel([("category_id", ASCENDING), ("status", ASCENDING), ("start_date", ASCENDING), ("_id", ASCENDING)]),
+        IndexModel([("venue_id", ASCENDING), ("start_date", ASCENDING), ("_id", ASCENDING)]),
+        IndexModel([("organizer_id", ASCENDING), ("start_date", ASCENDING), ("_id", ASCENDING)]),
+        IndexModel([("organizer_id", ASCENDING), ("_id", ASCENDING)]),
+    ],
+    "event_attendees": [
+        IndexModel([("event_id", ASCENDING), ("user_id", ASCENDING)], unique=True),
+        IndexModel([("user_id", ASCENDING), ("registered_at", ASCENDING)]),
+        IndexModel([("event_id", ASCENDING), ("_id", ASCENDING)]),
+    ],
+    "reviews": [
+        IndexModel([("event_id", ASCENDING), ("_id", ASCENDING)]),
+    ],
+    "profiles": [
+        IndexModel([("route", ASCENDING)]),
+    ],
+    "rate_limits": [
+        IndexModel([("expires_at", ASCENDING)], expireAfterSeconds=0),
+    ],
+    "reference_changes": [
+        IndexModel([("collection", ASCENDING), ("version", ASCENDING)]),
+        IndexModel([("created_at", ASCENDING)], expireAfterSeconds=settings.REFERENCE_CHANGES_TTL_SECONDS),
+    ],
+}
+
+
+INDEX_OPTIONS = ("unique", "sparse", "expireAfterSeconds", "partialFilterExpression", "collation")
+TEXT_INDEX_KEYS = ("_fts", "_ftsx")
+
+
+def _model_keys(model: IndexModel) -> List[tuple]:
+    return list(model.document["key"].items())
+
+
+def _is_text(model: IndexModel) -> bool:
+    return any(value == "text" for _, value in _model_keys(model))
+
+
+def is_required(model: IndexModel) -> bool:
+    # Unique indexes back duplicate detection, text and geo indexes are
+    # mandatory for $text and $geoNear; without them requests fail.
+    return bool(model.document.get("unique")) or any(
+        value in ("text", GEOSPHERE) for _, value in _model_keys(model)
+    )
+
+
+def _same_keys(model: IndexModel, info: Dict[str, Any]) -> bool:
+    live_keys = [tuple(pair) for pair in info["key"]]
+    if _is_text(model):
+        return any(key in TEXT_INDEX_KEYS for key, _ in live_keys)
+    return _model_keys(model) == live_keys
+
+
+def _same_options(model: IndexModel, info: Dict[str, Any]) -> bool:
+    document = model.document
+    for option in INDEX_OPTIONS:
+        expected, actual = document.get(option), info.get(option)
+        if option in ("unique", "sparse"):
+            expected, actual = bool(expected), bool(actual)
+        if expected != actual:
+            return False
+    if _is_text(model):
+        weights = document.get("weights") or {key: 1 for key, value in _model_keys(model) if value == "text"}
+        if dict(info.get("weights", {})) != dict(weights):
+            return False
+        if info.get("default_language", "english") != document.get("default_language", "english"):
+            return False
+    return True
+
+
+def _live_match(model: IndexModel, live: Dict[str, Dict[str, Any]]) -> Tuple[str, Optional[str]]:
+    for name, info in live.items():
+        if _same_keys(model, info) or name == model.document["name"]:
+            if _same_keys(model, info) and _same_options(model, info):
+                return "present", name
+            return "conflicting", name
+    return "missing", None
+
+
+async def plan_indexes(db: AsyncIOMotorDatabase) -> Dict[str, Dict[str, List[Any]]]:
+    plan = {}
+    for collection, models in INDEX_MANIFEST.items():
+        live = await db[collection].index_information()
+        missing, conflicting, matched = [], [], set()
+        for model in models:
+            state, name = _live_match(model, live)
+            if state == "missing":
+                missing.append(model)
+            else:
+                matched.add(name)
+            if state == "conflicting":
+                conflicting.append((model, name))
+        extra = [name for name in live if name != "_id_" and name not in matched]
+        plan[collection] = {"missing": missing, "conflicting": conflicting, "extra": extra}
+    return plan
+
+
+async def reconcile_indexes(
+    db: AsyncIOMotorDatabase,
+    drop_extra: bool = False,
+    rebuild_conflicting: bool = False
+) -> Dict[str, Dict[str, List[str]]]:
+    plan = await plan_indexes(db)
+    report = {}
+    for collection, changes in plan.items():
+        to_create = list(changes["missing"])
+        dropped = []
+        if rebuild_conflicting:
+            for model, name in changes["conflicting"]:
+                await db[collection].drop_index(name)
+                dropped.append(name)
+                to_create.append(model)
+        created = []
+        if to_create:
+            created = await db[collection].create_indexes(to_create)
+        if drop_extra:
+            for name in changes["extra"]:
+                await db[collection].drop_index(name)
+                dropped.append(name)
+        report[collection] = {
+            "created": created,
+            "dropped": dropped,
+            "extra": changes["extra"],
+            "conflicting": [] if rebuild_conflicting else [name for _, name in changes["conflicting"]],
+        }
+
+    await db.meta.update_one(
+        {"_id": "index_manifest"},
+        {"$set": {"version": MANIFEST_VERSION, "applied_at": datetime.utcnow()}},
+        upsert=True
+    )
+    return report
+
+
+async def missing_required_indexes(db: AsyncIOMotorDatabase) -> List[str]:
+    plan = await plan_indexes(db)
+    problems = []
+    for collection, changes in plan.items():
+        problems.extend(
+            f"{collection}.{model.document['name']} (missing)" for model in changes["missing"] if is_required(model)
+        )
+        problems.extend(
+            f"{collection}.{name} (options differ from manifest)"
+            for model, name in changes["conflicting"] if is_required(model)
+        )
+    return problems
+
+
+async def create_required_indexes(db: AsyncIOMotorDatabase) -> List[str]:
+    created = []
+    for collection, changes in (await plan_indexes(db)).items():
+        required = [model for model in changes["missing"] if is_required(model)]
+        if required:
+            names = await db[collection].create_indexes(required)
+            created.extend(f"{collection}.{name}" for name in names)
+    return created
+
+
+async def unused_indexes(db: AsyncIOMotorDatabase) -> Dict[str, List[Dict[str, Any]]]:
+    unused = {}
+    for collection in INDEX_MANIFEST:
+        stats = await db[collection].aggregate([{"$indexStats": {}}]).to_list(length=None)
+        unused[collection] = [
+            {"name": stat["name"], "since": stat["accesses"]["since"], "host": stat.get("host")}
+            for stat in stats
+            if stat["name"] != "_id_" and stat["accesses"]["ops"] == 0
+        ]
+    return unused
+
+
+async def run(command: str, drop_extra: bool, rebuild_conflicting: bool) -> None:
+    client = AsyncIOMotorClient(settings.MONGODB_URL)
+    db = client[settings.MONGODB_DB_NAME]
+    try:
+        if command == "plan":
+            applied = await db.meta.find_one({"_id": "index_manifest"})
+            print(f"manifest version {MANIFEST_VERSION}, applied {applied['version'] if applied else 'never'}")
+            for collection, changes in (await plan_indexes(db)).items():
+                for model in changes["missing"]:
+                    print(f"{collection}: missing {model.document['name']}")
+                for model, name in changes["conflicting"]:
+                    print(f"{collection}: {name} differs from manifest {model.document}")
+                for name in changes["extra"]:
+                    print(f"{collection}: not in manifest {name}")
+        elif command == "apply":
+            for collection, result in (await reconcile_indexes(db, drop_extra, rebuild_conflicting)).items():
+                for name in result["created"]:
+                    print(f"{collection}: created {name}")
+                for name in result["dropped"]:
+                    print(f"{collection}: dropped {name}")
+                for name in result["conflicting"]:
+                    print(f"{collection}: {name} differs from manifest, rerun with --rebuild-conflicting")
+        elif command == "unused":
+            for collection, stats in (await unused_indexes(db)).items():
+                for stat in stats:
+                    print(f"{collection}: {stat['name']} unused on {stat['host']} since {stat['since']}")
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Reconcile MongoDB indexes with the index manifest")
+    parser.add_argument("command", choices=["plan", "apply", "unused"])
+    parser.add_argument("--drop-extra", action="store_true", help="drop indexes that are not in the manifest")
+    parser.add_argument(
+        "--rebuild-conflicting",
+        action="store_true",
+        help="drop and rebuild indexes whose keys or options differ from the manifest"
+    )
+    args = parser.parse_args()
+    asyncio.run(run(args.command, args.drop_extra, args.rebuild_conflicting))
@@ -0,0 +1,65 @@
+import argparse
+import asyncio
+from functools import partial
+from typing import Any, Dict
+
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo import UpdateOne
+
+from app.core.config import get_settings
+from app.crud.search import CATEGORY_LOOKUP_FIELDS, VENUE_LOOKUP_FIELDS, lookup_fields
+
+settings = get_settings()
+
+
+async def backfill_lookup_fields(
+    db: AsyncIOMotorDatabase,
+    collection: str,
+    fields: Dict[str, str],
+    batch_size: int = 1000
+) -> int:
+    projection: Dict[str, Any] = {field: 1 for field in fields}
+    projection.update({field: 1 for field in fields.values()})
+
+    updated = 0
+    operations = []
+    async for document in db[collection].find({}, projection).batch_size(batch_size):
+        lookup = lookup_fields(document, fields)
+        if all(document.get(field) == value for field, value in lookup.items()):
+            continue
+        operations.append(UpdateOne({"_id": document["_id"]}, {"$set": lookup}))
+        if len(operations) >= batch_size:
+            result = await db[collection].bulk_write(operations, ordered=False)
+            updated += result.modified_count
+            operations = []
+
+    if operations:
+        result = await db[collection].bulk_write(operations, ordered=False)
+        updated += result.modified_count
+
+    return updated
+
+
+backfill_venue_lookup_fields = partial(backfill_lookup_fields, collection="venues", fields=VENUE_LOOKUP_FIELDS)
+backfill_category_lookup_fields = partial(backfill_lookup_fields, collection="categories", fields=CATEGORY_LOOKUP_FIELDS)
+
+MIGRATIONS = {
+    "venue-lookup-fields": backfill_venue_lookup_fields,
+    "category-lookup-fields": backfill_category_lookup_fields,
+}
+
+
+async def run(name: str) -> None:
+    client = AsyncIOMotorClient(settings.MONGODB_URL)
+    try:
+        updated = await MIGRATIONS[name](client[settings.MONGODB_DB_NAME])
+        print(f"{name}: {updated} documents updated")
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run data migrations")
+    parser.add_argument("migration", choices=sorted(MIGRATIONS))
+    args = parser.parse_args()
+    asyncio.run(run(args.migration))
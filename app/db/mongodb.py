@@ -1,30 +1,217 @@
+import asyncio
+import logging
+import time
+from typing import Any, Dict
+
+from fastapi import Request, status
+from fastapi.responses import JSONResponse
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import monitoring
+from pymongo.errors import ConnectionFailure, ExecutionTimeout, OperationFailure
+
 from app.core.config import get_settings
+from app.core.metrics import command_metrics
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
 
 client = None
 db = None
+readiness = {"warm": False, "indexes": False, "reference": False, "draining": False, "missing_indexes": []}
+_warm_up_task = None
+
+
+class PoolStatsListener(monitoring.ConnectionPoolListener):
+    def __init__(self):
+        self.pools = 0
+        self.open_connections = 0
+        self.checked_out = 0
+        self.waiting = 0
+        self.checkouts = 0
+        self.checkout_failures: Dict[str, int] = {}
+        self.pool_clears = 0
+
+    def pool_created(self, event):
+        self.pools += 1
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        self.pool_clears += 1
+
+    def pool_closed(self, event):
+        self.pools -= 1
+
+    def connection_created(self, event):
+        self.open_connections += 1
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        self.open_connections -= 1
+
+    def connection_check_out_started(self, event):
+        self.waiting += 1
+
+    def connection_check_out_failed(self, event):
+        self.waiting -= 1
+        reason = str(event.reason)
+        self.checkout_failures[reason] = self.checkout_failures.get(reason, 0) + 1
+
+    def connection_checked_out(self, event):
+        self.waiting -= 1
+        self.checked_out += 1
+        self.checkouts += 1
+
+    def connection_checked_in(self, event):
+        self.checked_out -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "pools": self.pools,
+            "max_pool_size": settings.MONGODB_MAX_POOL_SIZE,
+            "open_connections": self.open_connections,
+            "checked_out": self.checked_out,
+            "waiting": self.waiting,
+            "checkouts": self.checkouts,
+            "checkout_failures": dict(self.checkout_failures),
+            "pool_clears": self.pool_clears,
+        }
+
+
+pool_stats = PoolStatsListener()
+
+
+def client_options() -> Dict[str, Any]:
+    options = {
+        "maxPoolSize": settings.MONGODB_MAX_POOL_SIZE,
+        "minPoolSize": settings.MONGODB_MIN_POOL_SIZE,
+        "maxIdleTimeMS": settings.MONGODB_MAX_IDLE_TIME_MS,
+        "waitQueueTimeoutMS": settings.MONGODB_WAIT_QUEUE_TIMEOUT_MS,
+        "serverSelectionTimeoutMS": settings.MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+        "connectTimeoutMS": settings.MONGODB_CONNECT_TIMEOUT_MS,
+        "socketTimeoutMS": settings.MONGODB_SOCKET_TIMEOUT_MS,
+        "compressors": settings.MONGODB_COMPRESSORS or None,
+        "zlibCompressionLevel": settings.MONGODB_ZLIB_COMPRESSION_LEVEL,
+        "event_listeners": [pool_stats, command_metrics],
+    }
+    return {key: value for key, value in options.items() if value is not None}
+
+
+def get_list_max_time_ms() -> int:
+    return settings.MONGODB_LIST_MAX_TIME_MS
 
 
 async def connect_to_mongo():
     global client, db
-    client = AsyncIOMotorClient(settings.MONGODB_URL)
+    client = AsyncIOMotorClient(settings.MONGODB_URL, **client_options())
     db = client[settings.MONGODB_DB_NAME]
-    
-    await db.events.create_index("title")
-    await db.users.create_index("email", unique=True)
-    await db.users.create_index("username", unique=True)
-    await db.categories.create_index("name", unique=True)
-    await db.venues.create_index("name")
-    await db.venues.create_index([("location.coordinates", "2dsphere")])
 
 
 async def close_mongo_connection():
-    global client
+    global client, _warm_up_task
+    if _warm_up_task is not None:
+        _warm_up_task.cancel()
+        _warm_up_task = None
     if client:
         client.close()
 
 
+async def warm_up_pool() -> None:
+    await client.admin.command("ping")
+    connections = max(1, settings.MONGODB_MIN_POOL_SIZE)
+    await asyncio.gather(*(client.admin.command("ping") for _ in range(connections)))
+
+    deadline = time.monotonic() + settings.READINESS_WARMUP_TIMEOUT_SECONDS
+    while pool_stats.open_connections < settings.MONGODB_MIN_POOL_SIZE and time.monotonic() < deadline:
+        await asyncio.sleep(0.05)
+    readiness["warm"] = True
+
+
+async def check_required_indexes() -> None:
+    from app.db.indexes import create_required_indexes, missing_required_indexes
+
+    if settings.INDEXES_CREATE_REQUIRED_ON_STARTUP:
+        try:
+            created = await create_required_indexes(db)
+            if created:
+                logger.info("Created required indexes: %s", ", ".join(created))
+        except OperationFailure:
+            logger.exception("Could not create required indexes")
+
+    while True:
+        missing = await missing_required_indexes(db)
+        readiness["missing_indexes"] = missing
+        if not missing:
+            readiness["indexes"] = True
+            return
+        logger.error(
+            "Not ready, required indexes are not in place: %s. Run `python -m app.db.indexes apply`",
+            ", ".join(missing)
+        )
+        await asyncio.sleep(settings.READINESS_RECHECK_SECONDS)
+
+
+async def preload_reference_caches() -> None:
+    from app.crud.reference import preload_reference_cache
+
+    await preload_reference_cache()
+    readiness["reference"] = True
+
+
+async def _warm_up_until_ready() -> None:
+    while True:
+        try:
+            if not readiness["warm"]:
+                await warm_up_pool()
+            if not readiness["indexes"]:
+                await check_required_indexes()
+            await preload_reference_caches()
+            return
+        except ConnectionFailure:
+            logger.warning("MongoDB is not reachable yet, retrying warm-up")
+            await asyncio.sleep(1)
+        except Exception:
+            # Auth errors and other server-side failures would otherwise end the
+            # task silently and leave the worker not ready forever.
+            logger.exception("Warm-up failed, retrying in %.0fs", settings.READINESS_RECHECK_SECONDS)
+            await asyncio.sleep(settings.READINESS_RECHECK_SECONDS)
+
+
+async def start_pool_warm_up() -> None:
+    global _warm_up_task
+    _warm_up_task = asyncio.create_task(_warm_up_until_ready())
+
+
+def start_draining() -> None:
+    readiness["draining"] = True
+
+
+def is_ready() -> bool:
+    return readiness["warm"] and readiness["indexes"] and readiness["reference"] and not readiness["draining"]
+
+
 def get_database():
-    return db 
\ No newline at end of file
+    return db
+
+
+def get_pool_stats() -> Dict[str, Any]:
+    return pool_stats.stats()
+
+
+async def database_unavailable_handler(request: Request, exc: ConnectionFailure) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Database is temporarily unavailable, try again later"},
+        headers={"Retry-After": "1"},
+    )
+
+
+async def query_timeout_handler(request: Request, exc: ExecutionTimeout) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Query exceeded its time budget, narrow the filters or try again later"},
+        headers={"Retry-After": "1"},
+    )
@@ -0,0 +1,226 @@
+import argparse
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Awaitable, Dict, Iterable, List, Optional, Set, Tuple
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo import UpdateMany, UpdateOne
+
+from app.core.config import get_settings
+from app.crud.rating import recompute_rating_summaries
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+ORGANIZER_FIELDS = ("username", "full_name")
+VENUE_FIELDS = ("name", "address", "city")
+CATEGORY_FIELDS = ("name",)
+
+EMBEDDED = {
+    "organizer": ("organizer_id", "users", ORGANIZER_FIELDS),
+    "venue": ("venue_id", "venues", VENUE_FIELDS),
+    "category": ("category_id", "categories", CATEGORY_FIELDS),
+}
+
+
+def _object_ids(ids: Iterable[str]) -> List[ObjectId]:
+    object_ids = []
+    for value in ids:
+        try:
+            object_ids.append(ObjectId(value))
+        except (InvalidId, TypeError):
+            continue
+    return object_ids
+
+
+def embedded_ref(document: Dict[str, Any], fields: Tuple[str, ...]) -> Dict[str, Any]:
+    ref = {"id": str(document["_id"])}
+    ref.update({field: document.get(field) for field in fields})
+    return ref
+
+
+async def load_refs(
+    db: AsyncIOMotorDatabase,
+    collection: str,
+    ids: Iterable[str],
+    fields: Tuple[str, ...]
+) -> Dict[str, Dict[str, Any]]:
+    object_ids = _object_ids(set(ids))
+    if not object_ids:
+        return {}
+    projection = {field: 1 for field in fields}
+    cursor = db[collection].find({"_id": {"$in": object_ids}}, projection)
+    return {str(doc["_id"]): embedded_ref(doc, fields) async for doc in cursor}
+
+
+def stamp_revision(update: Dict[str, Any]) -> Dict[str, Any]:
+    # Every write that changes what an event renders (seat count, embedded
+    # names) moves updated_at and version, which its HTTP validators hash.
+    stamped = dict(update)
+    stamped["$set"] = {**update.get("$set", {}), "updated_at": datetime.utcnow()}
+    stamped["$inc"] = {**update.get("$inc", {}), "version": 1}
+    return stamped
+
+
+def _propagation_op(embedded: str, document: Dict[str, Any]) -> UpdateMany:
+    id_field, _, fields = EMBEDDED[embedded]
+    document_id = document.get("id") or str(document["_id"])
+    return UpdateMany(
+        {id_field: document_id},
+        stamp_revision({"$set": {f"{embedded}.{field}": document.get(field) for field in fields}})
+    )
+
+
+async def propagate_changes(db: AsyncIOMotorDatabase, changes: List[Tuple[str, Dict[str, Any]]]) -> int:
+    modified = 0
+    operations = [_propagation_op(embedded, document) for embedded, document in changes]
+    for start in range(0, len(operations), settings.READ_MODEL_BATCH_SIZE):
+        batch = operations[start:start + settings.READ_MODEL_BATCH_SIZE]
+        result = await db.events.bulk_write(batch, ordered=False)
+        modified += result.modified_count
+    return modified
+
+
+async def propagate_user(db: AsyncIOMotorDatabase, user: Dict[str, Any]) -> int:
+    return await propagate_changes(db, [("organizer", user)])
+
+
+async def propagate_venue(db: AsyncIOMotorDatabase, venue: Dict[str, Any]) -> int:
+    return await propagate_changes(db, [("venue", venue)])
+
+
+async def propagate_category(db: AsyncIOMotorDatabase, category: Dict[str, Any]) -> int:
+    return await propagate_changes(db, [("category", category)])
+
+
+_propagation_tasks: Set[asyncio.Task] = set()
+
+
+def _propagation_done(task: asyncio.Task) -> None:
+    _propagation_tasks.discard(task)
+    if task.cancelled():
+        return
+    error = task.exception()
+    if error is not None:
+        logger.error(
+            "Read model propagation failed; run `python -m app.db.read_model check --repair`",
+            exc_info=error
+        )
+
+
+def schedule_propagation(propagation: Awaitable[int]) -> asyncio.Task:
+    task = asyncio.ensure_future(propagation)
+    _propagation_tasks.add(task)
+    task.add_done_callback(_propagation_done)
+    return task
+
+
+async def wait_for_propagation() -> None:
+    if _propagation_tasks:
+        await asyncio.gather(*_propagation_tasks, return_exceptions=True)
+
+
+async def _check_batch(db: AsyncIOMotorDatabase, events: List[Dict[str, Any]], repair: bool) -> Tuple[int, int]:
+    refs = {}
+    for embedded, (id_field, collection, fields) in EMBEDDED.items():
+        refs[embedded] = await load_refs(db, collection, [e.get(id_field) for e in events if e.get(id_field)], fields)
+
+    operations = []
+    dangling = 0
+    for event in events:
+        stale = {}
+        for embedded, (id_field, _, _) in EMBEDDED.items():
+            ref_id = event.get(id_field)
+            if not ref_id:
+                continue
+            expected = refs[embedded].get(ref_id)
+            if expected is None:
+                # The referenced document is gone. Keep the last embedded copy
+                # so the event still renders, and report it for manual cleanup.
+                dangling += 1
+                logger.warning("Event %s references missing %s %s", event["_id"], embedded, ref_id)
+            elif event.get(embedded) != expected:
+                stale[embedded] = expected
+        if stale:
+            operations.append(UpdateOne({"_id": event["_id"]}, stamp_revision({"$set": stale})))
+
+    if repair and operations:
+        await db.events.bulk_write(operations, ordered=False)
+    return len(operations), dangling
+
+
+async def check_read_model(db: AsyncIOMotorDatabase, repair: bool = False, batch_size: Optional[int] = None) -> Dict[str, int]:
+    batch_size = batch_size or settings.READ_MODEL_BATCH_SIZE
+    projection = {field: 1 for field in EMBEDDED}
+    projection.update({id_field: 1 for id_field, _, _ in EMBEDDED.values()})
+
+    checked = 0
+    inconsistent = 0
+    dangling = 0
+    batch = []
+    async for event in db.events.find({}, projection).batch_size(batch_size):
+        batch.append(event)
+        if len(batch) >= batch_size:
+            stale, missing = await _check_batch(db, batch, repair)
+            inconsistent += stale
+            dangling += missing
+            checked += len(batch)
+            batch = []
+    if batch:
+        stale, missing = await _check_batch(db, batch, repair)
+        inconsistent += stale
+        dangling += missing
+        checked += len(batch)
+
+    return {
+        "checked": checked,
+        "inconsistent": inconsistent,
+        "repaired": inconsistent if repair else 0,
+        "dangling": dangling,
+    }
+
+
+async def check_attendee_counts(db: AsyncIOMotorDatabase, repair: bool = False) -> Dict[str, int]:
+    counts = {
+        row["_id"]: row["count"]
+        async for row in db.event_attendees.aggregate([{"$group": {"_id": "$event_id", "count": {"$sum": 1}}}])
+    }
+
+    checked = 0
+    operations = []
+    async for event in db.events.find({}, {"attendees_count": 1}).batch_size(settings.READ_MODEL_BATCH_SIZE):
+        checked += 1
+        expected = counts.get(str(event["_id"]), 0)
+        if event.get("attendees_count", 0) != expected:
+            operations.append(UpdateOne({"_id": event["_id"]}, stamp_revision({"$set": {"attendees_count": expected}})))
+
+    if repair:
+        for start in range(0, len(operations), settings.READ_MODEL_BATCH_SIZE):
+            await db.events.bulk_write(operations[start:start + settings.READ_MODEL_BATCH_SIZE], ordered=False)
+    return {"checked": checked, "inconsistent": len(operations), "repaired": len(operations) if repair else 0}
+
+
+async def run(command: str, repair: bool) -> None:
+    client = AsyncIOMotorClient(settings.MONGODB_URL)
+    try:
+        db = client[settings.MONGODB_DB_NAME]
+        if command == "check":
+            report = await check_read_model(db, repair)
+        elif command == "attendees":
+            report = await check_attendee_counts(db, repair)
+        elif command == "ratings":
+            report = await recompute_rating_summaries(db, repair, settings.READ_MODEL_BATCH_SIZE)
+        print(", ".join(f"{key}={value}" for key, value in report.items()))
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Maintain the materialized event read model")
+    parser.add_argument("command", choices=["check", "attendees", "ratings"])
+    parser.add_argument("--repair", action="store_true", help="rewrite stale values")
+    args = parser.parse_args()
+    asyncio.run(run(args.command, args.repair))
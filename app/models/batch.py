@@ -0,0 +1,20 @@
+from typing import List, Optional
+from pydantic import BaseModel
+
+
+class AttendeeRegistration(BaseModel):
+    event_id: str
+    user_id: str
+
+
+class BatchItemResult(BaseModel):
+    index: int
+    id: Optional[str] = None
+    code: Optional[str] = None
+    error: Optional[str] = None
+
+
+class BatchResult(BaseModel):
+    succeeded: int
+    failed: int
+    items: List[BatchItemResult]
@@ -90,10 +90,30 @@ class Event(EventBase):
 
 
 class EventList(BaseModel):
-    total: int
+    total: Optional[int] = None
     limit: int
     offset: int
     items: List[Event]
+    next_cursor: Optional[str] = None
+    has_more: Optional[bool] = None
+    total_is_estimate: bool = False
+
+
+class EventNearby(BaseModel):
+    id: str
+    title: str
+    start_date: datetime
+    end_date: datetime
+    status: EventStatus
+    price: Optional[float] = 0.0
+    venue: EventVenue
+    distance: float
+
+
+class EventNearbyList(BaseModel):
+    limit: int
+    items: List[EventNearby]
+    next_cursor: Optional[str] = None
 
 
 class EventAttendee(BaseModel):
@@ -0,0 +1,24 @@
+from datetime import datetime
+from typing import Dict, Optional
+from pydantic import BaseModel, Field
+
+
+class ProfilingUpdate(BaseModel):
+    duration_seconds: int = Field(60, gt=0)
+    sample_rate: float = Field(0.05, gt=0, le=1)
+
+
+class ProfilingStatus(BaseModel):
+    enabled: bool
+    enabled_until: Optional[datetime] = None
+    sample_rate: float
+    active_requests: int
+    profiled_requests: int
+    total_samples: int
+    routes: Dict[str, int] = {}
+
+
+class ProfileToken(BaseModel):
+    header: str
+    token: str
+    expires_at: datetime
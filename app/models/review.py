@@ -38,10 +38,13 @@ class Review(ReviewBase):
 
 
 class ReviewList(BaseModel):
-    total: int
+    total: Optional[int] = None
     limit: int
     offset: int
     items: List[Review]
+    next_cursor: Optional[str] = None
+    has_more: Optional[bool] = None
+    total_is_estimate: bool = False
 
 
 class EventRatingSummary(BaseModel):
@@ -43,7 +43,20 @@ class Venue(VenueBase):
 
 
 class VenueList(BaseModel):
-    total: int
+    total: Optional[int] = None
     limit: int
     offset: int
-    items: List[Venue] 
\ No newline at end of file
+    items: List[Venue] 
+    next_cursor: Optional[str] = None
+    has_more: Optional[bool] = None
+    total_is_estimate: bool = False
+
+
+class VenueNearby(Venue):
+    distance: float
+
+
+class VenueNearbyList(BaseModel):
+    limit: int
+    items: List[VenueNearby]
+    next_cursor: Optional[str] = None
\ No newline at end of file
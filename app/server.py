@@ -0,0 +1,187 @@
+import argparse
+import importlib.util
+import inspect
+import logging
+import os
+import threading
+
+import uvicorn
+
+logger = logging.getLogger(__name__)
+
+
+def create_app():
+    # Routers, models and middleware are imported here rather than at module
+    # level so the launcher process stays cheap and only workers build the app.
+    from fastapi import FastAPI
+    from fastapi.middleware.cors import CORSMiddleware
+    from pymongo.errors import ConnectionFailure, ExecutionTimeout
+
+    from app.api.api import api_router
+    from app.api.endpoints import health, metrics
+    from app.core.config import get_settings
+    from app.core.hashing import shutdown_hashing_executor
+    from app.core.metrics import MetricsMiddleware
+    from app.core.profiler import ProfilingMiddleware, start_profiler, stop_profiler
+    from app.core.ratelimit import AdmissionControlMiddleware
+    from app.crud.reference import start_reference_cache, stop_reference_cache
+    from app.db.read_model import wait_for_propagation
+    from app.db.mongodb import (
+        connect_to_mongo,
+        close_mongo_connection,
+        database_unavailable_handler,
+        query_timeout_handler,
+        start_pool_warm_up,
+    )
+
+    settings = get_settings()
+
+    app = FastAPI(
+        title=settings.PROJECT_NAME,
+        version=settings.VERSION,
+        description=settings.DESCRIPTION,
+        openapi_url=f"{settings.API_PREFIX}/openapi.json",
+        docs_url=f"{settings.API_PREFIX}/docs",
+        redoc_url=f"{settings.API_PREFIX}/redoc",
+    )
+
+    app.add_middleware(ProfilingMiddleware)
+    app.add_middleware(AdmissionControlMiddleware)
+    app.add_middleware(MetricsMiddleware)
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.CORS_ORIGINS,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    app.add_event_handler("startup", connect_to_mongo)
+    app.add_event_handler("startup", start_pool_warm_up)
+    app.add_event_handler("startup", start_reference_cache)
+    app.add_event_handler("startup", start_profiler)
+    app.add_event_handler("shutdown", stop_profiler)
+    app.add_event_handler("shutdown", stop_reference_cache)
+    app.add_event_handler("shutdown", wait_for_propagation)
+    app.add_event_handler("shutdown", close_mongo_connection)
+    app.add_event_handler("shutdown", shutdown_hashing_executor)
+
+    app.add_exception_handler(ConnectionFailure, database_unavailable_handler)
+    app.add_exception_handler(ExecutionTimeout, query_timeout_handler)
+
+    app.include_router(api_router, prefix=settings.API_PREFIX)
+    app.include_router(health.router, prefix="/health", tags=["health"])
+
+    if settings.METRICS_ENABLED:
+        app.include_router(metrics.router, prefix="/metrics")
+
+    return app
+
+
+def available_cpus() -> int:
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def default_workers(max_workers: int) -> int:
+    concurrency = os.environ.get("WEB_CONCURRENCY")
+    if concurrency:
+        try:
+            return max(1, int(concurrency))
+        except ValueError:
+            logger.warning("Ignoring non-integer WEB_CONCURRENCY=%r", concurrency)
+    return max(1, min(available_cpus(), max_workers))
+
+
+def select_loop() -> str:
+    return "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+
+
+def select_http() -> str:
+    return "httptools" if importlib.util.find_spec("httptools") else "h11"
+
+
+class DrainingServer(uvicorn.Server):
+    """Reports not-ready for a drain period on SIGTERM before uvicorn stops accepting connections."""
+
+    def __init__(self, config: uvicorn.Config, drain_seconds: float):
+        super().__init__(config)
+        self.drain_seconds = drain_seconds
+        self.draining = False
+
+    def handle_exit(self, sig, frame) -> None:
+        if self.draining or self.drain_seconds <= 0:
+            super().handle_exit(sig, frame)
+            return
+
+        from app.db.mongodb import start_draining
+
+        self.draining = True
+        start_draining()
+        logger.info("Draining for %.1fs before shutdown", self.drain_seconds)
+        timer = threading.Timer(self.drain_seconds, super().handle_exit, (sig, frame))
+        timer.daemon = True
+        timer.start()
+
+
+def build_config(args: argparse.Namespace, graceful_timeout: int) -> uvicorn.Config:
+    options = {
+        "factory": True,
+        "host": args.host,
+        "port": args.port,
+        "workers": args.workers,
+        "loop": args.loop,
+        "http": args.http,
+        "proxy_headers": True,
+        "forwarded_allow_ips": args.forwarded_allow_ips,
+        "timeout_keep_alive": 5,
+        "access_log": args.access_log,
+    }
+    if "timeout_graceful_shutdown" in inspect.signature(uvicorn.Config.__init__).parameters:
+        options["timeout_graceful_shutdown"] = graceful_timeout
+    return uvicorn.Config("app.server:create_app", **options)
+
+
+def run(args: argparse.Namespace) -> None:
+    from app.core.config import get_settings
+
+    settings = get_settings()
+    config = build_config(args, settings.SERVER_GRACEFUL_TIMEOUT_SECONDS)
+    server = DrainingServer(config, args.drain_seconds)
+    logger.info(
+        "Starting %d worker(s) with loop=%s http=%s, up to %d MongoDB connections in total",
+        args.workers,
+        args.loop,
+        args.http,
+        args.workers * settings.MONGODB_MAX_POOL_SIZE
+    )
+
+    if args.workers > 1:
+        from uvicorn.supervisors import Multiprocess
+
+        sock = config.bind_socket()
+        Multiprocess(config, target=server.run, sockets=[sock]).run()
+    else:
+        server.run()
+
+
+def parse_args() -> argparse.Namespace:
+    from app.core.config import get_settings
+
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description="Run the Event Management API in production mode")
+    parser.add_argument("--host", default=settings.SERVER_HOST)
+    parser.add_argument("--port", type=int, default=settings.SERVER_PORT)
+    parser.add_argument("--workers", type=int, default=settings.SERVER_WORKERS or default_workers(settings.SERVER_MAX_WORKERS))
+    parser.add_argument("--loop", choices=["auto", "asyncio", "uvloop"], default=select_loop())
+    parser.add_argument("--http", choices=["auto", "h11", "httptools"], default=select_http())
+    parser.add_argument("--drain-seconds", type=float, default=settings.SERVER_DRAIN_SECONDS)
+    parser.add_argument("--forwarded-allow-ips", default=os.environ.get("FORWARDED_ALLOW_IPS", "127.0.0.1"))
+    parser.add_argument("--access-log", action="store_true")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    run(parse_args())
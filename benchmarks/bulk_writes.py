@@ -0,0 +1,82 @@
+import argparse
+import asyncio
+import os
+import time
+from datetime import datetime, timedelta
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from app.crud.attendee import register_attendee
+from app.crud.bulk import bulk_create_events, bulk_register_attendees
+from app.models.batch import AttendeeRegistration
+from app.models.event import EventCreate, EventStatus
+
+
+def make_events(count: int, venue_id: str, category_id: str):
+    start = datetime.utcnow() + timedelta(days=30)
+    return [
+        EventCreate(
+            title=f"Imported event {i}",
+            description="Imported by the bulk write benchmark",
+            start_date=start + timedelta(hours=i),
+            end_date=start + timedelta(hours=i + 2),
+            category_id=category_id,
+            venue_id=venue_id,
+            max_attendees=None,
+            status=EventStatus.PUBLISHED,
+        )
+        for i in range(count)
+    ]
+
+
+async def timed(label: str, count: int, coro) -> float:
+    started = time.perf_counter()
+    await coro
+    rate = count / (time.perf_counter() - started)
+    print(f"{label:<38}{rate:>10.0f} items/s")
+    return rate
+
+
+async def main(items: int) -> None:
+    client = AsyncIOMotorClient(os.environ.get("MONGODB_URL", "mongodb://localhost:27017"))
+    db = client[os.environ.get("BENCH_DB_NAME", "event_bench_bulk")]
+    for collection in ("events", "venues", "categories", "event_attendees"):
+        await db[collection].drop()
+    await db.event_attendees.create_index([("event_id", 1), ("user_id", 1)], unique=True)
+
+    venue_id = str((await db.venues.insert_one({"name": "Bench hall", "address": "1 Main st", "city": "Moscow"})).inserted_id)
+    category_id = str((await db.categories.insert_one({"name": "Bench"})).inserted_id)
+    organizer = {"id": str(ObjectId()), "username": "organizer", "full_name": None}
+
+    async def single_events():
+        for event in make_events(items, venue_id, category_id):
+            document = event.model_dump()
+            document.update({"organizer_id": organizer["id"], "attendees_count": 0})
+            await db.events.insert_one(document)
+
+    single = await timed("events: one insert per item", items, single_events())
+    batched = await timed("events: batch insert_many", items, bulk_create_events(db, organizer, make_events(items, venue_id, category_id)))
+    print(f"{'events speedup':<38}{batched / single:>10.1f}x")
+
+    event_id = str((await db.events.insert_one({"status": EventStatus.PUBLISHED.value, "max_attendees": None, "attendees_count": 0})).inserted_id)
+
+    async def single_registrations():
+        for _ in range(items):
+            await register_attendee(db, event_id, str(ObjectId()))
+
+    registrations = [AttendeeRegistration(event_id=event_id, user_id=str(ObjectId())) for _ in range(items)]
+    single = await timed("registrations: one per item", items, single_registrations())
+    batched = await timed("registrations: batch", items, bulk_register_attendees(db, registrations))
+    print(f"{'registrations speedup':<38}{batched / single:>10.1f}x")
+
+    for collection in ("events", "venues", "categories", "event_attendees"):
+        await db[collection].drop()
+    client.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare single-item and batch write throughput")
+    parser.add_argument("--items", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(main(args.items))
@@ -0,0 +1,321 @@
+import argparse
+import asyncio
+import os
+import random
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from app.core.security import get_password_hash
+from app.crud.rating import empty_summary
+from app.crud.search import CATEGORY_LOOKUP_FIELDS, lookup_fields, venue_lookup_fields
+from app.db.indexes import reconcile_indexes
+from app.models.event import EventStatus
+from app.models.user import UserRole
+
+PASSWORD = "Benchmark-password1"
+ADMIN_USERNAME = "bench_admin"
+
+SCALES = {
+    "small": {"users": 1000, "categories": 10, "venues": 200, "events": 5000, "attendees": 20000, "reviews": 5000},
+    "medium": {"users": 20000, "categories": 20, "venues": 2000, "events": 100000, "attendees": 400000, "reviews": 100000},
+    "large": {"users": 200000, "categories": 40, "venues": 20000, "events": 1000000, "attendees": 4000000, "reviews": 1000000},
+}
+
+CITIES = [
+    ("Москва", 37.6173, 55.7558),
+    ("Санкт-Петербург", 30.3351, 59.9343),
+    ("Казань", 49.1221, 55.7887),
+    ("Новосибирск", 82.9204, 55.0302),
+    ("Екатеринбург", 60.6122, 56.8389),
+    ("Berlin", 13.4050, 52.5200),
+    ("Paris", 2.3522, 48.8566),
+]
+WORDS = [
+    "конференция", "фестиваль", "концерт", "выставка", "мастер-класс", "лекция", "семинар",
+    "музыка", "технологии", "искусство", "театр", "спорт", "кино", "наука", "бизнес",
+    "conference", "festival", "concert", "exhibition", "workshop", "meetup", "lecture",
+    "python", "design", "startup", "jazz", "marathon", "cinema", "science", "community",
+]
+SEARCH_TERMS = ["python", "фестиваль", "jazz", "выставка", "startup workshop", "театр"]
+STATUSES = [EventStatus.PUBLISHED.value] * 6 + [
+    EventStatus.DRAFT.value, EventStatus.CANCELED.value, EventStatus.COMPLETED.value,
+]
+
+
+BENCH_DB_SUFFIX = "_bench"
+
+
+def check_bench_database(name: str) -> None:
+    # generate_dataset drops collections, so never point it at a real database.
+    if not name.endswith(BENCH_DB_SUFFIX):
+        raise SystemExit(f"Refusing to seed {name!r}: benchmark database names must end in {BENCH_DB_SUFFIX!r}")
+
+
+def username_for(index: int) -> str:
+    return f"bench_user_{index}"
+
+
+def full_name_for(index: int) -> str:
+    return f"Benchmark User {index}"
+
+
+def words(rng: random.Random, low: int, high: int) -> str:
+    return " ".join(rng.choices(WORDS, k=rng.randint(low, high)))
+
+
+def share(total: int, done: int, count: int, batch: int) -> int:
+    """Rows of `total` that belong to a batch of `batch` parents after `done` of `count`."""
+    return total * (done + batch) // count - total * done // count
+
+
+class UserRef:
+    __slots__ = ("_id", "username", "full_name")
+
+    def __init__(self, _id: ObjectId, username: str, full_name: str):
+        self._id = _id
+        self.username = username
+        self.full_name = full_name
+
+    def ref(self) -> Dict[str, Any]:
+        return {"id": str(self._id), "username": self.username, "full_name": self.full_name}
+
+
+async def insert_users(db, count: int, hashed_password: str, now: datetime, batch_size: int) -> List[UserRef]:
+    admin = {
+        "_id": ObjectId(),
+        "email": "bench_admin@example.com",
+        "username": ADMIN_USERNAME,
+        "full_name": "Benchmark Admin",
+        "password": hashed_password,
+        "role": UserRole.ADMIN.value,
+        "created_at": now,
+        "updated_at": now,
+    }
+    await db.users.insert_one(admin)
+    refs = [UserRef(admin["_id"], admin["username"], admin["full_name"])]
+
+    for start in range(0, count, batch_size):
+        batch = []
+        for index in range(start, min(count, start + batch_size)):
+            batch.append({
+                "_id": ObjectId(),
+                "email": f"{username_for(index)}@example.com",
+                "username": username_for(index),
+                "full_name": full_name_for(index),
+                "password": hashed_password,
+                "role": UserRole.ORGANIZER.value if index % 50 == 0 else UserRole.USER.value,
+                "created_at": now,
+                "updated_at": now,
+            })
+        await db.users.insert_many(batch, ordered=False)
+        refs.extend(UserRef(user["_id"], user["username"], user["full_name"]) for user in batch)
+    return refs
+
+
+def make_venues(rng: random.Random, count: int, now: datetime) -> List[Dict[str, Any]]:
+    venues = []
+    for index in range(count):
+        city, lng, lat = rng.choice(CITIES)
+        venue = {
+            "_id": ObjectId(),
+            "name": f"{words(rng, 1, 2).capitalize()} Hall {index}",
+            "address": f"ул. Тестовая, {rng.randint(1, 200)}",
+            "city": city,
+            "country": "Россия" if lng > 20 else "Europe",
+            "capacity": rng.choice([50, 100, 300, 1000, 5000]),
+            "amenities": rng.sample(["wifi", "parking", "stage", "bar", "projector"], k=rng.randint(0, 3)),
+            "location": {
+                "type": "Point",
+                "coordinates": [round(lng + rng.uniform(-0.2, 0.2), 6), round(lat + rng.uniform(-0.15, 0.15), 6)],
+            },
+            "created_at": now,
+            "updated_at": now,
+        }
+        venue.update(venue_lookup_fields(venue))
+        venues.append(venue)
+    return venues
+
+
+def make_events(
+    rng: random.Random,
+    count: int,
+    organizers: List[UserRef],
+    venues: List[Dict[str, Any]],
+    categories: List[Dict[str, Any]],
+    now: datetime
+) -> List[Dict[str, Any]]:
+    events = []
+    for _ in range(count):
+        organizer = rng.choice(organizers)
+        venue = rng.choice(venues)
+        category = rng.choice(categories)
+        start = now + timedelta(days=rng.randint(-180, 365), hours=rng.randint(0, 23))
+        events.append({
+            "_id": ObjectId(),
+            "title": words(rng, 2, 5).capitalize(),
+            "description": words(rng, 20, 60),
+            "start_date": start,
+            "end_date": start + timedelta(hours=rng.randint(1, 48)),
+            "category_id": str(category["_id"]),
+            "venue_id": str(venue["_id"]),
+            "organizer_id": str(organizer._id),
+            "organizer": organizer.ref(),
+            "venue": {
+                "id": str(venue["_id"]),
+                "name": venue["name"],
+                "address": venue["address"],
+                "city": venue["city"],
+            },
+            "category": {"id": str(category["_id"]), "name": category["name"]},
+            "status": rng.choice(STATUSES),
+            "max_attendees": rng.choice([None, 50, 200, 1000]),
+            "attendees_count": 0,
+            "price": rng.choice([0.0, 0.0, 500.0, 1500.0, 3000.0]),
+            "is_private": rng.random() < 0.05,
+            "rating_summary": empty_summary(),
+            "created_at": now,
+            "updated_at": now,
+        })
+    return events
+
+
+def make_attendees(
+    rng: random.Random,
+    count: int,
+    users: List[UserRef],
+    events: List[Dict[str, Any]],
+    now: datetime
+) -> List[Dict[str, Any]]:
+    attendees = []
+    seen = set()
+    for _ in range(count * 2):
+        if len(attendees) >= count:
+            break
+        event = rng.choice(events)
+        user = rng.choice(users)
+        key = (event["_id"], user._id)
+        full = event["max_attendees"] is not None and event["attendees_count"] >= event["max_attendees"]
+        if key in seen or full:
+            continue
+        seen.add(key)
+        event["attendees_count"] += 1
+        attendees.append({
+            "event_id": str(event["_id"]),
+            "user_id": str(user._id),
+            "registered_at": now - timedelta(minutes=rng.randint(0, 100000)),
+        })
+    return attendees
+
+
+def make_reviews(
+    rng: random.Random,
+    count: int,
+    users: List[UserRef],
+    events: List[Dict[str, Any]],
+    now: datetime
+) -> List[Dict[str, Any]]:
+    reviews = []
+    for _ in range(count):
+        event = rng.choice(events)
+        author = rng.choice(users)
+        rating = rng.choices([1, 2, 3, 4, 5], weights=[1, 1, 3, 5, 6])[0]
+        summary = event["rating_summary"]
+        summary["count"] += 1
+        summary["sum"] += rating
+        summary["distribution"][str(rating)] += 1
+        created_at = now - timedelta(minutes=rng.randint(0, 100000))
+        reviews.append({
+            "event_id": str(event["_id"]),
+            "author": author.ref(),
+            "rating": rating,
+            "comment": words(rng, 3, 30),
+            "created_at": created_at,
+            "updated_at": created_at,
+        })
+    return reviews
+
+
+async def generate_dataset(db, scale: Dict[str, int], seed: int = 42, batch_size: int = 5000) -> Dict[str, Any]:
+    check_bench_database(db.name)
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+
+    for collection in ("users", "categories", "venues", "events", "event_attendees", "reviews", "meta"):
+        await db[collection].drop()
+
+    # Users, categories and venues are small enough to keep as references;
+    # events are generated batch by batch together with their attendees and
+    # reviews, so memory stays bounded by batch_size at any scale.
+    users = await insert_users(db, scale["users"], get_password_hash(PASSWORD), now, batch_size)
+    organizers = [user for index, user in enumerate(users) if index == 0 or (index - 1) % 50 == 0]
+    categories = [
+        {"_id": ObjectId(), "name": f"{word.capitalize()} {index}", "description": None, "created_at": now, "updated_at": now}
+        for index, word in enumerate(rng.sample(WORDS, k=min(scale["categories"], len(WORDS))))
+    ]
+    for category in categories:
+        category.update(lookup_fields(category, CATEGORY_LOOKUP_FIELDS))
+    await db.categories.insert_many(categories)
+    venues = make_venues(rng, scale["venues"], now)
+    for start in range(0, len(venues), batch_size):
+        await db.venues.insert_many(venues[start:start + batch_size], ordered=False)
+
+    totals = {"events": 0, "attendees": 0, "reviews": 0}
+    event_count = scale["events"]
+    for done in range(0, event_count, batch_size):
+        size = min(batch_size, event_count - done)
+        events = make_events(rng, size, organizers, venues, categories, now)
+        attendees = make_attendees(rng, share(scale["attendees"], done, event_count, size), users, events, now)
+        reviews = make_reviews(rng, share(scale["reviews"], done, event_count, size), users, events, now)
+
+        await db.events.insert_many(events, ordered=False)
+        if attendees:
+            await db.event_attendees.insert_many(attendees, ordered=False)
+        if reviews:
+            await db.reviews.insert_many(reviews, ordered=False)
+        totals["events"] += len(events)
+        totals["attendees"] += len(attendees)
+        totals["reviews"] += len(reviews)
+
+    await reconcile_indexes(db)
+
+    return {
+        "seed": seed,
+        "scale": scale,
+        "users": len(users),
+        "categories": len(categories),
+        "venues": len(venues),
+        **totals,
+    }
+
+
+def scale_from_args(args: argparse.Namespace) -> Dict[str, int]:
+    scale = dict(SCALES[args.scale])
+    for name in scale:
+        value = getattr(args, name, None)
+        if value is not None:
+            scale[name] = value
+    return scale
+
+
+def add_scale_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    parser.add_argument("--seed", type=int, default=42)
+    for name in SCALES["small"]:
+        parser.add_argument(f"--{name}", type=int, default=None, help=f"Override the number of {name}")
+
+
+async def main(args: argparse.Namespace) -> None:
+    client = AsyncIOMotorClient(os.environ.get("MONGODB_URL", "mongodb://localhost:27017"))
+    db = client[os.environ.get("BENCH_DB_NAME", "event_bench")]
+    summary = await generate_dataset(db, scale_from_args(args), args.seed)
+    print(", ".join(f"{name}={value}" for name, value in summary.items() if name != "scale"))
+    client.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load a synthetic dataset into a local mongod")
+    add_scale_arguments(parser)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,57 @@
+import argparse
+import asyncio
+import os
+import random
+from typing import List
+
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from app.crud.rating import compute_rating_summaries, empty_summary, normalize_summary
+from app.crud.review import create_review, delete_review, update_review
+from app.models.review import ReviewCreate, ReviewUpdate
+
+AUTHOR = {"id": "bench", "username": "bench"}
+
+
+async def main(events: int, operations: int, seed: int) -> None:
+    client = AsyncIOMotorClient(os.environ.get("MONGODB_URL", "mongodb://localhost:27017"))
+    db = client[os.environ.get("BENCH_DB_NAME", "event_bench_ratings")]
+    await db.events.drop()
+    await db.reviews.drop()
+
+    rng = random.Random(seed)
+    event_ids = [str((await db.events.insert_one({"title": f"Event {i}"})).inserted_id) for i in range(events)]
+    reviews: List[str] = []
+
+    for _ in range(operations):
+        action = rng.choice(["create", "create", "update", "delete"]) if reviews else "create"
+        if action == "create":
+            review_data = ReviewCreate(event_id=rng.choice(event_ids), rating=rng.randint(1, 5))
+            reviews.append((await create_review(db, AUTHOR, review_data))["id"])
+        elif action == "update":
+            await update_review(db, rng.choice(reviews), ReviewUpdate(rating=rng.randint(1, 5)))
+        else:
+            await delete_review(db, reviews.pop(rng.randrange(len(reviews))))
+
+    expected = await compute_rating_summaries(db)
+    mismatches = 0
+    async for event in db.events.find({}, {"rating_summary": 1}):
+        incremental = normalize_summary(event.get("rating_summary"))
+        if incremental != expected.get(str(event["_id"]), empty_summary()):
+            mismatches += 1
+
+    await db.events.drop()
+    await db.reviews.drop()
+    client.close()
+
+    print(f"{operations} random review operations over {events} events: {mismatches} mismatching summaries")
+    assert mismatches == 0, "incremental rating summaries diverged from a full recompute"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check incremental rating summaries against a full recompute")
+    parser.add_argument("--events", type=int, default=20)
+    parser.add_argument("--operations", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    asyncio.run(main(args.events, args.operations, args.seed))
@@ -0,0 +1,82 @@
+import argparse
+import asyncio
+import os
+import statistics
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+from bson import ObjectId
+from fastapi import HTTPException
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from app.crud.attendee import register_attendee
+from app.models.event import EventStatus
+
+
+async def attempt(db, event_id: str, user_id: str, latencies: List[float]) -> bool:
+    started = time.perf_counter()
+    try:
+        await register_attendee(db, event_id, user_id)
+        return True
+    except HTTPException:
+        return False
+    finally:
+        latencies.append((time.perf_counter() - started) * 1000)
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+async def main(requests: int, seats: int, pool_size: int) -> None:
+    client = AsyncIOMotorClient(
+        os.environ.get("MONGODB_URL", "mongodb://localhost:27017"),
+        maxPoolSize=pool_size,
+        waitQueueTimeoutMS=60000
+    )
+    db = client[os.environ.get("BENCH_DB_NAME", "event_bench_registration")]
+    await db.event_attendees.drop()
+    await db.event_attendees.create_index([("event_id", 1), ("user_id", 1)], unique=True)
+
+    now = datetime.utcnow()
+    event = await db.events.insert_one({
+        "title": "Registration rush",
+        "start_date": now + timedelta(days=7),
+        "end_date": now + timedelta(days=7, hours=3),
+        "status": EventStatus.PUBLISHED.value,
+        "max_attendees": seats,
+        "attendees_count": 0,
+    })
+    event_id = str(event.inserted_id)
+
+    user_ids = [str(ObjectId()) for _ in range(requests)]
+    latencies: List[float] = []
+    started = time.perf_counter()
+    results = await asyncio.gather(*(attempt(db, event_id, user_id, latencies) for user_id in user_ids))
+    elapsed = time.perf_counter() - started
+
+    succeeded = sum(results)
+    stored = await db.event_attendees.count_documents({"event_id": event_id})
+    counter = (await db.events.find_one({"_id": event.inserted_id}))["attendees_count"]
+
+    print(f"{requests} registrations for {seats} seats in {elapsed:.2f}s ({requests / elapsed:.0f} req/s)")
+    print(f"succeeded={succeeded} attendee_rows={stored} attendees_count={counter}")
+    print(f"latency p50={statistics.median(latencies):.1f}ms p95={percentile(latencies, 0.95):.1f}ms "
+          f"p99={percentile(latencies, 0.99):.1f}ms")
+
+    await db.events.delete_one({"_id": event.inserted_id})
+    await db.event_attendees.drop()
+    client.close()
+
+    assert succeeded == seats == stored == counter, "capacity was not enforced exactly"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Concurrent registration stress test against a local mongod")
+    parser.add_argument("--requests", type=int, default=10000)
+    parser.add_argument("--seats", type=int, default=500)
+    parser.add_argument("--pool-size", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.seats, args.pool_size))
@@ -0,0 +1,91 @@
+import asyncio
+import time
+from collections import Counter
+from typing import Any, Dict, List
+
+from benchmarks.scenarios import BenchContext, Scenario, UnexpectedResult
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def summarize(latencies: List[float], errors: Counter, elapsed: float) -> Dict[str, Any]:
+    requests = len(latencies)
+    return {
+        "requests": requests,
+        "errors": sum(errors.values()),
+        "error_rate": sum(errors.values()) / requests if requests else 0.0,
+        "error_kinds": dict(errors),
+        "elapsed_seconds": round(elapsed, 3),
+        "throughput": round(requests / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 0.50), 2),
+        "p95_ms": round(percentile(latencies, 0.95), 2),
+        "p99_ms": round(percentile(latencies, 0.99), 2),
+        "max_ms": round(max(latencies), 2) if latencies else 0.0,
+    }
+
+
+async def run_scenario(
+    scenario: Scenario,
+    ctx: BenchContext,
+    target: str,
+    requests: int,
+    concurrency: int,
+    warmup: int = 0
+) -> Dict[str, Any]:
+    operation = scenario.db if target == "db" else scenario.http
+    await scenario.setup(ctx, requests)
+
+    for i in range(warmup):
+        try:
+            await operation(ctx, {}, i)
+        except Exception:
+            pass
+
+    latencies: List[float] = []
+    errors: Counter = Counter()
+    indexes = iter(range(requests))
+
+    async def worker() -> None:
+        state: Dict[str, Any] = {}
+        for i in indexes:
+            started = time.perf_counter()
+            try:
+                await operation(ctx, state, i)
+            except UnexpectedResult as e:
+                errors[str(e)] += 1
+            except Exception as e:
+                errors[e.__class__.__name__] += 1
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    result = summarize(latencies, errors, elapsed)
+    result.update(await scenario.teardown(ctx))
+    return result
+
+
+def compare_results(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float
+) -> List[str]:
+    regressions = []
+    for name, now in current["scenarios"].items():
+        before = baseline["scenarios"].get(name)
+        if before is None:
+            continue
+        for metric in ("p50_ms", "p95_ms", "p99_ms"):
+            if before[metric] and now[metric] > before[metric] * (1 + threshold):
+                regressions.append(f"{name}: {metric} {before[metric]} -> {now[metric]}")
+        if before["throughput"] and now["throughput"] < before["throughput"] * (1 - threshold):
+            regressions.append(f"{name}: throughput {before['throughput']} -> {now['throughput']}")
+        if now["error_rate"] > before["error_rate"] + 0.01:
+            regressions.append(f"{name}: error_rate {before['error_rate']:.3f} -> {now['error_rate']:.3f}")
+    return regressions
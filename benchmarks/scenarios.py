@@ -0,0 +1,182 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from bson import ObjectId
+from fastapi import HTTPException
+
+from app.core.security import create_access_token
+from app.crud.attendee import register_attendee
+from app.crud.pagination import EVENT_SORT, fetch_page_with_total
+from app.crud.search import fetch_search_page, text_search_filter
+from app.crud.user import authenticate_user
+from app.models.event import EventStatus
+from benchmarks.datagen import ADMIN_USERNAME, PASSWORD, SEARCH_TERMS
+
+TOKEN_LIFETIME = timedelta(hours=2)
+# The events router hides private events; the db target applies the same filter.
+PUBLIC_ONLY = {"is_private": {"$ne": True}}
+
+
+class UnexpectedResult(Exception):
+    pass
+
+
+class BenchContext:
+    def __init__(self, db, client=None, api_prefix: str = "/api"):
+        self.db = db
+        self.client = client
+        self.api_prefix = api_prefix
+        self.users: List[Dict[str, Any]] = []
+        self.admin: Optional[Dict[str, Any]] = None
+
+    async def load_users(self, limit: int) -> None:
+        self.admin = await self.db.users.find_one({"username": ADMIN_USERNAME}, {"username": 1, "email": 1, "role": 1})
+        cursor = self.db.users.find({"username": {"$regex": "^bench_user_"}}, {"username": 1, "email": 1, "role": 1})
+        self.users = await cursor.limit(limit).to_list(length=limit)
+        if self.admin is None or not self.users:
+            raise RuntimeError("Benchmark dataset not found, run `python -m benchmarks.run seed` first")
+
+    def token_for(self, user: Dict[str, Any]) -> str:
+        return create_access_token(
+            {"sub": str(user["_id"]), "username": user["username"], "email": user["email"], "role": user["role"]},
+            expires_delta=TOKEN_LIFETIME
+        )
+
+    def url(self, path: str) -> str:
+        return f"{self.api_prefix}{path}"
+
+
+def expect(response, *statuses: int):
+    if response.status_code not in statuses:
+        raise UnexpectedResult(f"HTTP {response.status_code}")
+    return response
+
+
+class Scenario:
+    name = ""
+    description = ""
+
+    async def setup(self, ctx: BenchContext, requests: int) -> None:
+        pass
+
+    async def http(self, ctx: BenchContext, state: Dict[str, Any], i: int) -> None:
+        raise NotImplementedError
+
+    async def db(self, ctx: BenchContext, state: Dict[str, Any], i: int) -> None:
+        raise NotImplementedError
+
+    async def teardown(self, ctx: BenchContext) -> Dict[str, Any]:
+        return {}
+
+
+class LoginStorm(Scenario):
+    name = "login_storm"
+    description = "Password logins spread over many accounts; dominated by bcrypt"
+
+    async def http(self, ctx, state, i):
+        user = ctx.users[i % len(ctx.users)]
+        response = await ctx.client.post(
+            ctx.url("/auth/login"),
+            data={"username": user["username"], "password": PASSWORD}
+        )
+        expect(response, 200)
+
+    async def db(self, ctx, state, i):
+        user = ctx.users[i % len(ctx.users)]
+        if not await authenticate_user(ctx.db, user["username"], PASSWORD):
+            raise UnexpectedResult("authentication failed")
+
+
+class EventSearch(Scenario):
+    name = "event_search"
+    description = "Full-text event search over published events"
+
+    async def http(self, ctx, state, i):
+        term = SEARCH_TERMS[i % len(SEARCH_TERMS)]
+        response = await ctx.client.get(
+            ctx.url("/events"),
+            params={"search": term, "status": EventStatus.PUBLISHED.value, "limit": 20}
+        )
+        expect(response, 200)
+
+    async def db(self, ctx, state, i):
+        term = SEARCH_TERMS[i % len(SEARCH_TERMS)]
+        query = {"$text": text_search_filter(term), "status": EventStatus.PUBLISHED.value, **PUBLIC_ONLY}
+        await fetch_search_page(ctx.db.events, query, EVENT_SORT, 20)
+
+
+class RegistrationRush(Scenario):
+    name = "registration_rush"
+    description = "Many users registering for one event with fewer seats than requests"
+
+    def __init__(self, seats: Optional[int] = None):
+        self.seats = seats
+        self.event_id: Optional[str] = None
+        self.tokens: List[str] = []
+
+    async def setup(self, ctx, requests):
+        seats = self.seats or max(1, requests // 4)
+        now = datetime.utcnow()
+        result = await ctx.db.events.insert_one({
+            "title": "Benchmark registration rush",
+            "description": "Synthetic event for the registration rush scenario",
+            "start_date": now + timedelta(days=7),
+            "end_date": now + timedelta(days=7, hours=3),
+            "status": EventStatus.PUBLISHED.value,
+            "max_attendees": seats,
+            "attendees_count": 0,
+            "created_at": now,
+            "updated_at": now,
+        })
+        self.seats = seats
+        self.event_id = str(result.inserted_id)
+        if ctx.client is not None:
+            self.tokens = [ctx.token_for(user) for user in ctx.users]
+
+    async def http(self, ctx, state, i):
+        response = await ctx.client.post(
+            ctx.url(f"/events/{self.event_id}/register"),
+            headers={"Authorization": f"Bearer {self.tokens[i % len(self.tokens)]}"}
+        )
+        expect(response, 201, 400)
+
+    async def db(self, ctx, state, i):
+        try:
+            await register_attendee(ctx.db, self.event_id, str(ctx.users[i % len(ctx.users)]["_id"]))
+        except HTTPException as e:
+            if e.status_code != 400:
+                raise
+
+    async def teardown(self, ctx):
+        event = await ctx.db.events.find_one_and_delete({"_id": ObjectId(self.event_id)})
+        attendees = await ctx.db.event_attendees.count_documents({"event_id": self.event_id})
+        await ctx.db.event_attendees.delete_many({"event_id": self.event_id})
+        return {"seats": self.seats, "attendees_count": event["attendees_count"], "attendee_rows": attendees}
+
+
+class DeepPagination(Scenario):
+    name = "deep_pagination"
+    description = "Walking the published events listing page by page with keyset cursors"
+    page_size = 50
+
+    async def http(self, ctx, state, i):
+        params = {"status": EventStatus.PUBLISHED.value, "limit": self.page_size}
+        if state.get("cursor"):
+            params["cursor"] = state["cursor"]
+        response = expect(await ctx.client.get(ctx.url("/events"), params=params), 200)
+        state["cursor"] = response.json()["next_cursor"]
+
+    async def db(self, ctx, state, i):
+        page = await fetch_page_with_total(
+            ctx.db.events,
+            {"status": EventStatus.PUBLISHED.value, **PUBLIC_ONLY},
+            EVENT_SORT,
+            self.page_size,
+            cursor=state.get("cursor"),
+            total_mode="none"
+        )
+        state["cursor"] = page["next_cursor"]
+
+
+SCENARIOS = {scenario.name: scenario for scenario in (LoginStorm, EventSearch, RegistrationRush, DeepPagination)}
+
@@ -0,0 +1,92 @@
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from app.crud.search import EVENT_TEXT_INDEX, TEXT_SCORE
+
+WORDS = [
+    "конференция", "фестиваль", "концерт", "выставка", "мастер-класс", "лекция", "семинар",
+    "музыка", "технологии", "искусство", "театр", "спорт", "кино", "наука", "бизнес",
+    "conference", "festival", "concert", "exhibition", "workshop", "meetup", "lecture",
+    "python", "design", "startup", "jazz", "marathon", "cinema", "science", "community",
+]
+QUERIES = ["python", "фестиваль", "jazz", "выставка", "startup workshop", "театр"]
+
+
+def make_event(rng: random.Random, now: datetime) -> Dict:
+    title = " ".join(rng.choices(WORDS, k=rng.randint(2, 5)))
+    start = now + timedelta(days=rng.randint(-365, 365))
+    return {
+        "title": title.capitalize(),
+        "description": " ".join(rng.choices(WORDS, k=rng.randint(20, 60))),
+        "start_date": start,
+        "end_date": start + timedelta(hours=rng.randint(1, 48)),
+        "status": rng.choice(["draft", "published", "canceled", "completed"]),
+        "price": rng.choice([0, 0, 500, 1500, 3000]),
+        "attendees_count": 0,
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
+async def generate(db, count: int, batch_size: int = 10000) -> None:
+    rng = random.Random(42)
+    now = datetime.utcnow()
+    existing = await db.events.estimated_document_count()
+    for start in range(existing, count, batch_size):
+        batch = [make_event(rng, now) for _ in range(min(batch_size, count - start))]
+        await db.events.insert_many(batch, ordered=False)
+    await db.events.create_index(**EVENT_TEXT_INDEX)
+
+
+async def time_query(make_cursor, repeats: int) -> List[float]:
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        await make_cursor().to_list(length=20)
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def summarize(samples: List[float]) -> str:
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return f"p50={statistics.median(ordered):9.2f}ms p95={p95:9.2f}ms"
+
+
+async def main(count: int, repeats: int) -> None:
+    client = AsyncIOMotorClient(os.environ.get("MONGODB_URL", "mongodb://localhost:27017"))
+    db = client[os.environ.get("BENCH_DB_NAME", "event_bench_search")]
+    await generate(db, count)
+
+    for term in QUERIES:
+        regex = await time_query(
+            lambda: db.events.find({"$or": [
+                {"title": {"$regex": term, "$options": "i"}},
+                {"description": {"$regex": term, "$options": "i"}},
+            ]}).limit(20),
+            repeats,
+        )
+        text = await time_query(
+            lambda: db.events.find({"$text": {"$search": term}}, {"score": TEXT_SCORE})
+            .sort([("score", TEXT_SCORE)]).limit(20),
+            repeats,
+        )
+        print(f"{term:<18} regex {summarize(regex)} | text {summarize(text)}")
+
+    client.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare regex and text-index event search latency")
+    parser.add_argument("--events", type=int, default=1_000_000)
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.events, args.repeats))
@@ -0,0 +1,73 @@
+import argparse
+import json
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict
+
+import orjson
+from pydantic import TypeAdapter
+
+from app.core.responses import compile_serializer
+from app.models.event import EventList
+
+
+def make_page(size: int) -> Dict[str, Any]:
+    now = datetime.utcnow()
+    items = []
+    for i in range(size):
+        start = now + timedelta(days=i)
+        items.append({
+            "id": f"{i:024x}",
+            "title": f"Конференция по технологиям #{i}",
+            "description": "Описание конференции " * 20,
+            "start_date": start,
+            "end_date": start + timedelta(hours=8),
+            "category_id": "6500000000000000000000c1",
+            "venue_id": "6500000000000000000000a1",
+            "max_attendees": 500,
+            "price": 1500.0,
+            "is_private": False,
+            "status": "published",
+            "organizer": {"id": "6500000000000000000000f1", "username": "organizer", "full_name": "Организатор"},
+            "venue": {"id": "6500000000000000000000a1", "name": "Экспоцентр", "address": "Краснопресненская наб., 14", "city": "Москва"},
+            "category": {"id": "6500000000000000000000c1", "name": "Технологии"},
+            "attendees_count": i,
+            "created_at": now,
+            "updated_at": now,
+        })
+    return {"total": 10000, "limit": size, "offset": 0, "items": items}
+
+
+def cpu_ms_per_call(func: Callable[[], bytes], iterations: int) -> float:
+    func()
+    started = time.process_time()
+    for _ in range(iterations):
+        func()
+    return (time.process_time() - started) * 1000 / iterations
+
+
+def main(size: int, iterations: int) -> None:
+    page = make_page(size)
+    adapter = TypeAdapter(EventList)
+    serializer = compile_serializer(EventList)
+
+    def validated() -> bytes:
+        model = adapter.validate_python(page)
+        return json.dumps(adapter.dump_python(model, mode="json"), ensure_ascii=False).encode()
+
+    def fast() -> bytes:
+        return orjson.dumps(serializer(page))
+
+    assert json.loads(validated()) == json.loads(fast())
+    baseline = cpu_ms_per_call(validated, iterations)
+    optimized = cpu_ms_per_call(fast, iterations)
+    print(f"EventList page of {size}: validate+json {baseline:.3f} ms, precompiled+orjson {optimized:.3f} ms "
+          f"({baseline / optimized:.1f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="CPU time per serialized EventList page")
+    parser.add_argument("--size", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+    main(args.size, args.iterations)
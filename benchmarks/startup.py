@@ -0,0 +1,90 @@
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from typing import Dict, List, Optional
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for(url: str, started: float, timeout: float) -> Optional[float]:
+    while time.perf_counter() - started < timeout:
+        try:
+            with urllib.request.urlopen(url, timeout=1) as response:
+                if response.status == 200:
+                    return time.perf_counter() - started
+        except (urllib.error.URLError, ConnectionError, OSError):
+            pass
+        time.sleep(0.01)
+    return None
+
+
+def measure_once(workers: int, timeout: float) -> Dict[str, Optional[float]]:
+    port = free_port()
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "app.server", "--host", "127.0.0.1", "--port", str(port),
+         "--workers", str(workers), "--drain-seconds", "0"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        env=os.environ.copy()
+    )
+    try:
+        first_request = wait_for(f"http://127.0.0.1:{port}/health/live", started, timeout)
+        ready = wait_for(f"http://127.0.0.1:{port}/health/ready", started, timeout)
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+    return {"first_request_seconds": first_request, "ready_seconds": ready}
+
+
+def measure_import(module: str) -> float:
+    output = subprocess.run(
+        [sys.executable, "-c", f"import time; t = time.perf_counter(); import {module}; print(time.perf_counter() - t)"],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return float(output.stdout.strip())
+
+
+def median(values: List[Optional[float]]) -> Optional[float]:
+    present = [value for value in values if value is not None]
+    return round(statistics.median(present), 3) if present else None
+
+
+def main(runs: int, workers: int, timeout: float, output: Optional[str]) -> None:
+    results = [measure_once(workers, timeout) for _ in range(runs)]
+    summary = {
+        "runs": runs,
+        "workers": workers,
+        "import_app_server_seconds": round(measure_import("app.server"), 3),
+        "import_main_seconds": round(measure_import("main"), 3),
+        "first_request_seconds": median([result["first_request_seconds"] for result in results]),
+        "ready_seconds": median([result["ready_seconds"] for result in results]),
+        "failed_runs": sum(1 for result in results if result["first_request_seconds"] is None),
+    }
+    print(json.dumps(summary, indent=2))
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure time-to-first-request and time-to-ready of app.server")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--output")
+    args = parser.parse_args()
+    main(args.runs, args.workers, args.timeout, args.output)
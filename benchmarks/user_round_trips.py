@@ -0,0 +1,78 @@
+import asyncio
+import os
+from collections import Counter
+from typing import Dict
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import monitoring
+
+from app.crud.user import authenticate_user, create_user, update_user
+from app.models.user import UserCreate, UserUpdate
+
+# Round trips per operation before the single-round-trip rewrite of app/crud/user.py.
+BASELINE = {
+    "create_user": 4,
+    "authenticate_user (username)": 2,
+    "authenticate_user (email)": 3,
+    "update_user (email + username)": 5,
+}
+
+
+class CommandCounter(monitoring.CommandListener):
+    def __init__(self):
+        self.commands: Counter = Counter()
+
+    def started(self, event):
+        if event.command_name not in ("endSessions", "hello", "isMaster", "ping"):
+            self.commands[event.command_name] += 1
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+
+async def measure(counter: CommandCounter, coro) -> int:
+    counter.commands.clear()
+    await coro
+    return sum(counter.commands.values())
+
+
+async def main() -> Dict[str, int]:
+    counter = CommandCounter()
+    client = AsyncIOMotorClient(
+        os.environ.get("MONGODB_URL", "mongodb://localhost:27017"),
+        event_listeners=[counter]
+    )
+    db = client[os.environ.get("BENCH_DB_NAME", "event_bench_round_trips")]
+    await db.users.drop()
+    await db.users.create_index("email", unique=True)
+    await db.users.create_index("username", unique=True)
+
+    user_data = UserCreate(username="bench_user", email="bench@example.com", password="Password123")
+    results = {}
+    results["create_user"] = await measure(counter, create_user(db, user_data))
+    user = await db.users.find_one({"username": "bench_user"})
+    results["authenticate_user (username)"] = await measure(
+        counter, authenticate_user(db, "bench_user", "Password123")
+    )
+    results["authenticate_user (email)"] = await measure(
+        counter, authenticate_user(db, "bench@example.com", "Password123")
+    )
+    results["update_user (email + username)"] = await measure(
+        counter,
+        update_user(db, str(user["_id"]), UserUpdate(username="bench_user2", email="bench2@example.com"))
+    )
+
+    await db.users.drop()
+    client.close()
+
+    print(f"{'operation':<34}{'before':>8}{'after':>8}")
+    for name, after in results.items():
+        print(f"{name:<34}{BASELINE[name]:>8}{after:>8}")
+    return results
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,56 @@
+import asyncio
+import os
+from typing import Any, Dict, List
+
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from app.core.deps import venue_filter_params
+from app.crud.search import VENUE_LOOKUP_INDEXES, VENUE_TEXT_INDEX
+
+CASES: List[Dict[str, Any]] = [
+    {"city": "Москва"},
+    {"city": "Санкт", "location_match": "prefix"},
+    {"country": "Россия", "location_match": "exact"},
+    {"country": "Россия", "city": "Казань", "location_match": "exact"},
+    {"country": "Fra", "city": "Par", "location_match": "prefix"},
+    {"min_capacity": 500},
+    {"search": "концертный зал"},
+    {"city": "Москва", "search": "клуб"},
+]
+
+
+def stages(plan: Dict[str, Any]) -> List[str]:
+    found = [plan.get("stage")]
+    for key in ("inputStage", "queryPlan"):
+        if key in plan:
+            found.extend(stages(plan[key]))
+    for child in plan.get("inputStages", []):
+        found.extend(stages(child))
+    return [stage for stage in found if stage]
+
+
+async def main() -> None:
+    client = AsyncIOMotorClient(os.environ.get("MONGODB_URL", "mongodb://localhost:27017"))
+    db = client[os.environ.get("BENCH_DB_NAME", "event_bench_venues")]
+    await db.venues.create_index(**VENUE_TEXT_INDEX)
+    for keys in VENUE_LOOKUP_INDEXES:
+        await db.venues.create_index(keys)
+
+    failures = 0
+    for case in CASES:
+        params = {"city": None, "country": None, "min_capacity": None, "search": None, "location_match": "prefix"}
+        params.update(case)
+        filters = await venue_filter_params(**params)
+        explain = await db.command("explain", {"find": "venues", "filter": filters}, verbosity="queryPlanner")
+        plan_stages = stages(explain["queryPlanner"]["winningPlan"])
+        collscan = "COLLSCAN" in plan_stages
+        failures += collscan
+        print(f"{'FAIL' if collscan else 'ok  '} {case} -> {' < '.join(plan_stages)}")
+
+    client.close()
+    if failures:
+        raise SystemExit(f"{failures} venue filter(s) produced a COLLSCAN")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
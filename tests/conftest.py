@@ -0,0 +1,46 @@
+import asyncio
+import os
+import uuid
+
+import pytest
+
+MONGODB_TEST_URL = os.environ.get("MONGODB_TEST_URL", "mongodb://localhost:27017")
+
+
+@pytest.fixture(scope="session")
+def mongo_url():
+    pymongo = pytest.importorskip("pymongo")
+    pytest.importorskip("motor")
+    client = pymongo.MongoClient(MONGODB_TEST_URL, serverSelectionTimeoutMS=1000)
+    try:
+        client.admin.command("ping")
+    except pymongo.errors.PyMongoError:
+        pytest.skip(f"MongoDB is not available at {MONGODB_TEST_URL}")
+    finally:
+        client.close()
+    return MONGODB_TEST_URL
+
+
+@pytest.fixture
+def run_db(mongo_url):
+    """Run an async scenario against a throwaway database that is dropped afterwards."""
+
+    def run(scenario, event_listeners=()):
+        async def main():
+            from motor.motor_asyncio import AsyncIOMotorClient
+
+            from app.db import mongodb
+
+            client = AsyncIOMotorClient(mongo_url, event_listeners=list(event_listeners))
+            db = client[f"event_test_{uuid.uuid4().hex[:12]}"]
+            mongodb.db = db
+            try:
+                return await scenario(db)
+            finally:
+                mongodb.db = None
+                await client.drop_database(db.name)
+                client.close()
+
+        return asyncio.run(main())
+
+    return run
@@ -0,0 +1,62 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("motor")
+
+from fastapi import HTTPException  # noqa: E402
+
+from app.crud.attendee import register_attendee, unregister_attendee  # noqa: E402
+from app.db.indexes import reconcile_indexes  # noqa: E402
+
+
+async def create_event(db, max_attendees):
+    result = await db.events.insert_one({
+        "title": "Rush",
+        "status": "published",
+        "max_attendees": max_attendees,
+        "attendees_count": 0,
+    })
+    return str(result.inserted_id)
+
+
+async def attempt(db, event_id, user_id):
+    try:
+        await register_attendee(db, event_id, user_id)
+        return "ok"
+    except HTTPException as e:
+        return e.detail
+
+
+def test_registration_rush_does_not_oversell(run_db):
+    async def scenario(db):
+        await reconcile_indexes(db)
+        event_id = await create_event(db, 10)
+
+        users = [f"user-{i}" for i in range(60)]
+        # Every user retries once so duplicates race with first registrations.
+        outcomes = await asyncio.gather(*(attempt(db, event_id, user) for user in users + users))
+
+        assert outcomes.count("ok") == 10
+        assert set(outcomes) <= {"ok", "Event is full", "Already registered for this event"}
+        assert await db.event_attendees.count_documents({"event_id": event_id}) == 10
+        event = await db.events.find_one({}, {"attendees_count": 1})
+        assert event["attendees_count"] == 10
+
+    run_db(scenario)
+
+
+def test_registered_user_on_full_event_is_told_they_are_registered(run_db):
+    async def scenario(db):
+        await reconcile_indexes(db)
+        event_id = await create_event(db, 1)
+        await register_attendee(db, event_id, "first")
+
+        assert await attempt(db, event_id, "first") == "Already registered for this event"
+        assert await attempt(db, event_id, "second") == "Event is full"
+
+        assert await unregister_attendee(db, event_id, "first")
+        assert await attempt(db, event_id, "second") == "ok"
+
+    run_db(scenario)
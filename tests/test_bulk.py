@@ -0,0 +1,43 @@
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("motor")
+
+from bson import ObjectId  # noqa: E402
+
+from app.crud.bulk import bulk_register_attendees  # noqa: E402
+from app.db.indexes import reconcile_indexes  # noqa: E402
+from app.models.batch import AttendeeRegistration  # noqa: E402
+
+
+def test_bulk_registration_reports_stable_codes(run_db):
+    async def scenario(db):
+        await reconcile_indexes(db)
+        users = (await db.users.insert_many([{"username": f"user{i}"} for i in range(3)])).inserted_ids
+        event_id = str((await db.events.insert_one({
+            "status": "published", "max_attendees": 2, "attendees_count": 0
+        })).inserted_id)
+
+        result = await bulk_register_attendees(db, [
+            AttendeeRegistration(event_id=event_id, user_id=str(users[0])),
+            AttendeeRegistration(event_id=event_id, user_id="not-an-id"),
+            AttendeeRegistration(event_id=event_id, user_id=str(ObjectId())),
+            AttendeeRegistration(event_id=event_id, user_id=str(users[0]).upper()),
+            AttendeeRegistration(event_id="missing", user_id=str(users[1])),
+        ])
+
+        codes = [item.get("code") for item in result["items"]]
+        assert codes == [None, "invalid_user_id", "user_not_found", "already_registered", "event_not_found"]
+        assert all("errmsg" not in (item.get("error") or "") for item in result["items"])
+
+        event = await db.events.find_one({}, {"attendees_count": 1})
+        assert event["attendees_count"] == 1
+        assert await db.event_attendees.count_documents({"event_id": event_id}) == 1
+
+        result = await bulk_register_attendees(db, [
+            AttendeeRegistration(event_id=event_id, user_id=str(users[1])),
+            AttendeeRegistration(event_id=event_id, user_id=str(users[2])),
+        ])
+        assert [item.get("code") for item in result["items"]] == [None, "event_full"]
+
+    run_db(scenario)
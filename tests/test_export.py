@@ -0,0 +1,105 @@
+import asyncio
+import tracemalloc
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("motor")
+
+from bson import ObjectId  # noqa: E402
+
+from app.crud import export  # noqa: E402
+from app.crud.export import (  # noqa: E402
+    EVENT_COLUMNS,
+    REVIEW_COLUMNS,
+    RowEncoder,
+    export_events,
+    export_reviews,
+    review_row,
+    stream_export,
+    with_id,
+)
+
+EXPORT_ROWS = 1_000_000
+
+
+class Documents:
+    """Generates event-shaped documents on the fly and records whether it was closed."""
+
+    def __init__(self, count):
+        self.count = count
+        self.closed = False
+
+    def __aiter__(self):
+        return self._generate()
+
+    async def _generate(self):
+        created_at = datetime(2024, 1, 1)
+        for i in range(self.count):
+            yield {"_id": ObjectId(), "title": f"Event {i}", "status": "published", "created_at": created_at}
+
+    async def aclose(self):
+        self.closed = True
+
+
+async def drain(stream):
+    size = 0
+    async for chunk in stream:
+        size += len(chunk)
+    return size
+
+
+def test_export_memory_stays_flat_over_a_million_rows():
+    documents = Documents(EXPORT_ROWS)
+
+    async def scenario():
+        tracemalloc.start()
+        try:
+            size = await drain(stream_export(documents, with_id, RowEncoder(EVENT_COLUMNS, "csv")))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return size, peak
+
+    size, peak = asyncio.run(scenario())
+    assert size > 50 * 1024 * 1024
+    assert peak < 2 * 1024 * 1024
+    assert documents.closed
+
+
+def test_budget_is_checked_on_every_document(monkeypatch):
+    monkeypatch.setattr(export.settings, "EXPORT_TIME_BUDGET_SECONDS", 0)
+    documents = Documents(10)
+
+    async def scenario():
+        return [chunk async for chunk in stream_export(documents, with_id, RowEncoder(EVENT_COLUMNS, "ndjson"))]
+
+    body = b"".join(asyncio.run(scenario())).splitlines()
+    assert len(body) == 2
+    assert body[1].startswith(b'{"next_cursor":')
+    assert documents.closed
+
+
+def test_export_cursors_are_closed_and_reviews_use_embedded_author(run_db):
+    async def scenario(db):
+        author = {"id": str(ObjectId()), "username": "critic"}
+        await db.reviews.insert_many([{"event_id": "e1", "author": author, "rating": i % 5 + 1} for i in range(30)])
+        await db.events.insert_many([{"organizer_id": "o1", "title": f"Event {i}"} for i in range(30)])
+
+        reviews = export_reviews(db, "e1", None)
+        body = await drain(stream_export(reviews, review_row, RowEncoder(REVIEW_COLUMNS, "csv")))
+        assert body > 0 and reviews.alive is False
+
+        rows = []
+        async for document in export_reviews(db, "e1", None):
+            rows.append(review_row(document))
+        assert rows[0]["author_id"] == author["id"] and rows[0]["author_username"] == "critic"
+
+        events = export_events(db, "o1", None)
+        stream = stream_export(events, with_id, RowEncoder(EVENT_COLUMNS, "ndjson"))
+        await stream.__anext__()
+        await stream.aclose()
+        assert events.alive is False
+
+    run_db(scenario)
@@ -0,0 +1,39 @@
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("motor")
+
+from bson import ObjectId  # noqa: E402
+
+from app.crud.geo import _page, _venue_coordinates, bucket_radius, haversine_meters, snap_to_cell  # noqa: E402
+
+
+def venue(lng, lat):
+    return {"_id": ObjectId(), "name": f"{lng},{lat}", "location": {"type": "Point", "coordinates": [lng, lat]}}
+
+
+def test_radius_buckets_cover_the_request():
+    assert bucket_radius(1) == 250
+    assert bucket_radius(1200) == 2000
+    assert bucket_radius(2000) == 2000
+
+
+def test_distances_are_measured_from_the_real_point():
+    lng, lat = 37.61749, 55.75581
+    assert snap_to_cell(lng, lat) != (lng, lat)
+    candidates = [venue(37.6175, 55.7558), venue(37.6300, 55.7600), venue(37.7000, 55.8000)]
+
+    page = _page(candidates, lng, lat, 1000, 10, None, _venue_coordinates)
+
+    assert [item["name"] for item in page["items"]] == ["37.6175,55.7558", "37.63,55.76"]
+    for item, candidate in zip(page["items"], candidates):
+        assert item["distance"] == pytest.approx(haversine_meters(lng, lat, *candidate["location"]["coordinates"]))
+    assert "distance" not in candidates[0]
+
+
+def test_page_cursor_continues_after_last_item():
+    candidates = [venue(37.6 + i * 0.001, 55.75) for i in range(5)]
+    first = _page(candidates, 37.6, 55.75, 5000, 2, None, _venue_coordinates)
+    second = _page(candidates, 37.6, 55.75, 5000, 2, first["next_cursor"], _venue_coordinates)
+    names = [item["name"] for item in first["items"] + second["items"]]
+    assert names == [candidate["name"] for candidate in candidates[:4]]
@@ -0,0 +1,62 @@
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("motor")
+
+from fastapi import Request, Response  # noqa: E402
+
+from app.core.http_cache import conditional_response, document_etag, http_date, list_etag  # noqa: E402
+from app.crud.attendee import register_attendee, unregister_attendee  # noqa: E402
+from app.crud.event import get_event  # noqa: E402
+from app.db.read_model import stamp_revision  # noqa: E402
+
+UPDATED_AT = datetime(2024, 1, 1)
+
+
+def conditional_request(**headers):
+    raw = [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw})
+
+
+def test_stamp_revision_keeps_the_original_operators():
+    update = stamp_revision({"$inc": {"attendees_count": 1}, "$set": {"status": "published"}})
+    assert update["$inc"] == {"attendees_count": 1, "version": 1}
+    assert update["$set"]["status"] == "published"
+    assert isinstance(update["$set"]["updated_at"], datetime)
+
+
+def test_list_etag_follows_item_versions():
+    items = [{"id": "1", "updated_at": UPDATED_AT, "version": 1}]
+    assert list_etag(items) != list_etag([{**items[0], "version": 2}])
+
+
+def test_lists_without_last_modified_ignore_if_modified_since():
+    request = conditional_request(if_modified_since=http_date(datetime(2030, 1, 1)))
+    response = Response()
+    result = conditional_response(request, response, list, [], list_etag([]))
+    assert not isinstance(result, Response)
+    assert "etag" in response.headers and "last-modified" not in response.headers
+
+
+def test_seat_changes_move_the_event_validators(run_db):
+    async def scenario(db):
+        event_id = str((await db.events.insert_one({
+            "title": "Gig",
+            "status": "published",
+            "max_attendees": 5,
+            "attendees_count": 0,
+            "updated_at": UPDATED_AT,
+        })).inserted_id)
+
+        before = document_etag(await get_event(db, event_id))
+        await register_attendee(db, event_id, "u1")
+        registered = await get_event(db, event_id)
+        assert document_etag(registered) != before
+        assert registered["updated_at"] > UPDATED_AT
+
+        await unregister_attendee(db, event_id, "u1")
+        assert document_etag(await get_event(db, event_id)) != document_etag(registered)
+
+    run_db(scenario)
@@ -0,0 +1,43 @@
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("motor")
+
+from app.db.indexes import (  # noqa: E402
+    create_required_indexes,
+    missing_required_indexes,
+    plan_indexes,
+    reconcile_indexes,
+)
+
+
+def test_index_with_same_name_but_other_options_is_not_accepted(run_db):
+    async def scenario(db):
+        await db.users.create_index("email", name="email_1")
+        await db.events.create_index([("title", "text")], name="events_text")
+
+        plan = await plan_indexes(db)
+        assert [name for _, name in plan["users"]["conflicting"]] == ["email_1"]
+        assert [name for _, name in plan["events"]["conflicting"]] == ["events_text"]
+        assert "users.email_1 (options differ from manifest)" in await missing_required_indexes(db)
+
+        report = await reconcile_indexes(db)
+        assert report["users"]["conflicting"] == ["email_1"]
+
+        await reconcile_indexes(db, rebuild_conflicting=True)
+        assert await missing_required_indexes(db) == []
+        info = await db.users.index_information()
+        assert info["email_1"]["unique"] is True
+
+    run_db(scenario)
+
+
+def test_required_indexes_are_created_on_a_fresh_database(run_db):
+    async def scenario(db):
+        assert await missing_required_indexes(db)
+        created = await create_required_indexes(db)
+        assert "users.email_1" in created
+        assert "events.events_text" in created
+        assert await missing_required_indexes(db) == []
+
+    run_db(scenario)
@@ -0,0 +1,89 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("motor")
+
+from bson import ObjectId  # noqa: E402
+from pymongo import monitoring  # noqa: E402
+
+from app.crud.attendee import get_event_attendees_page  # noqa: E402
+from app.crud.loader import UserLoader, attach_users  # noqa: E402
+
+
+class FindCounter(monitoring.CommandListener):
+    def __init__(self):
+        self.finds = 0
+
+    def started(self, event):
+        if event.command_name == "find" and event.command.get("find") == "users":
+            self.finds += 1
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+
+def test_attaching_users_to_n_rows_issues_one_find(run_db):
+    counter = FindCounter()
+
+    async def scenario(db):
+        users = await db.users.insert_many([{"username": f"user{i}", "full_name": f"User {i}"} for i in range(50)])
+        rows = [{"user_id": str(users.inserted_ids[i % 50])} for i in range(500)]
+        rows += [{"user_id": None}, {}, {"user_id": "not-an-id"}, {"user_id": str(ObjectId())}]
+
+        loader = UserLoader(db)
+        await attach_users(loader, rows, "user_id", "user")
+
+        assert counter.finds == 1 and loader.queries == 1
+        assert rows[0]["user"]["username"] == "user0"
+        assert [row["user"] for row in rows[-4:]] == [None, None, None, None]
+
+        await attach_users(loader, rows[:10], "user_id", "user")
+        assert counter.finds == 1
+
+    run_db(scenario, event_listeners=[counter])
+
+
+def test_attendee_page_resolves_users_with_one_find(run_db):
+    counter = FindCounter()
+
+    async def scenario(db):
+        users = await db.users.insert_many([{"username": f"user{i}"} for i in range(30)])
+        await db.event_attendees.insert_many([
+            {"event_id": "e1", "user_id": str(user_id), "registered_at": datetime(2024, 1, 1)}
+            for user_id in users.inserted_ids
+        ])
+        await db.users.delete_one({"_id": users.inserted_ids[0]})
+
+        page = await get_event_attendees_page(db, "e1", UserLoader(db), limit=20, total_mode="exact")
+        assert counter.finds == 1
+        assert page["total"] == 30 and page["has_more"]
+        assert [attendee["username"] for attendee in page["items"]] == [f"user{i}" for i in range(1, 20)]
+
+    run_db(scenario, event_listeners=[counter])
+
+
+class FailingLoader(UserLoader):
+    async def _fetch(self, user_ids):
+        raise RuntimeError("users unavailable")
+
+
+def test_failed_batch_reaches_every_waiter():
+    async def scenario():
+        loader = FailingLoader(None)
+        results = await asyncio.gather(
+            loader.load(str(ObjectId())),
+            loader.load(str(ObjectId())),
+            return_exceptions=True
+        )
+        await asyncio.sleep(0)
+        return loader, results
+
+    loader, results = asyncio.run(scenario())
+    assert [type(result) for result in results] == [RuntimeError, RuntimeError]
+    assert loader._dispatch_task is None
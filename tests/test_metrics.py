@@ -0,0 +1,43 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("motor")
+
+from fastapi import HTTPException, Request  # noqa: E402
+
+from app.core import ratelimit  # noqa: E402
+from app.core.deps import settings, verify_metrics_access  # noqa: E402
+from app.core.ratelimit import AdmissionControlMiddleware, MemoryRateLimitBackend  # noqa: E402
+
+
+def metrics_request(authorization=None):
+    headers = [(b"authorization", authorization.encode())] if authorization else []
+    return Request({"type": "http", "method": "GET", "path": "/metrics", "headers": headers})
+
+
+def test_metrics_require_the_scrape_token(monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "scrape-secret")
+
+    asyncio.run(verify_metrics_access(metrics_request("Bearer scrape-secret"), None))
+    for authorization in (None, "Bearer wrong", "Basic scrape-secret"):
+        with pytest.raises(HTTPException) as error:
+            asyncio.run(verify_metrics_access(metrics_request(authorization), None))
+        assert error.value.status_code == 401
+
+
+def test_metrics_bypass_admission_control(monkeypatch):
+    monkeypatch.setattr(ratelimit.settings, "MAX_IN_FLIGHT_REQUESTS", 1)
+    statuses = []
+
+    async def app(scope, receive, send):
+        statuses.append(scope["path"])
+
+    async def scenario():
+        middleware = AdmissionControlMiddleware(app, MemoryRateLimitBackend())
+        middleware.in_flight = 1
+        await middleware({"type": "http", "method": "GET", "path": "/metrics", "headers": []}, None, None)
+
+    asyncio.run(scenario())
+    assert statuses == ["/metrics"]
@@ -0,0 +1,141 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("motor")
+
+from bson import ObjectId  # noqa: E402
+from fastapi import HTTPException  # noqa: E402
+
+from app.crud.event import get_user_events_page  # noqa: E402
+from app.crud.pagination import (  # noqa: E402
+    EVENT_SORT,
+    USER_SORT,
+    cursor_for,
+    decode_cursor,
+    fetch_page,
+    fetch_page_with_total,
+)
+from app.crud.search import fetch_search_page_with_total, text_search_filter  # noqa: E402
+from app.db.indexes import reconcile_indexes  # noqa: E402
+
+
+def test_cursor_round_trip_keeps_types():
+    document = {"_id": ObjectId(), "start_date": datetime(2024, 5, 1, 10, 30)}
+    values = decode_cursor(cursor_for(document, EVENT_SORT), EVENT_SORT)
+    assert values == [document["start_date"], document["_id"]]
+
+
+def test_malformed_cursor_is_rejected():
+    with pytest.raises(HTTPException) as error:
+        decode_cursor("not-a-cursor", EVENT_SORT)
+    assert error.value.status_code == 400
+
+
+def test_cursor_does_not_match_other_sort():
+    cursor = cursor_for({"_id": ObjectId(), "start_date": datetime(2024, 5, 1)}, EVENT_SORT)
+    with pytest.raises(HTTPException):
+        decode_cursor(cursor, USER_SORT)
+
+
+def test_cursor_pages_are_stable_across_inserts(run_db):
+    async def scenario(db):
+        start = datetime(2024, 1, 1)
+        original = [{"_id": ObjectId(), "start_date": start + timedelta(hours=i % 7)} for i in range(25)]
+        await db.events.insert_many(original)
+
+        seen = []
+        documents, cursor = await fetch_page(db.events, {}, EVENT_SORT, 10)
+        seen.extend(documents)
+        while cursor:
+            # Rows landing before and after the cursor position between pages
+            # must neither shift the next page nor repeat earlier rows.
+            await db.events.insert_many([
+                {"_id": ObjectId(), "start_date": start - timedelta(days=1)},
+                {"_id": ObjectId(), "start_date": start + timedelta(days=30)},
+            ])
+            documents, cursor = await fetch_page(db.events, {}, EVENT_SORT, 10, cursor=cursor)
+            seen.extend(documents)
+
+        ids = [document["_id"] for document in seen]
+        assert len(ids) == len(set(ids))
+        expected = sorted(original, key=lambda document: (document["start_date"], document["_id"]))
+        assert [document["_id"] for document in seen if document["start_date"] < start + timedelta(days=1)] == [
+            document["_id"] for document in expected
+        ]
+
+    run_db(scenario)
+
+
+def test_page_with_total_is_a_bounded_find(run_db):
+    commands = []
+
+    async def scenario(db):
+        await db.events.insert_many([
+            {"_id": ObjectId(), "status": "published", "start_date": datetime(2024, 1, 1) + timedelta(hours=i)}
+            for i in range(30)
+        ])
+        query = {"status": "published"}
+        first = await fetch_page_with_total(db.events, query, EVENT_SORT, 10, total_mode="exact")
+        commands.clear()
+        second = await fetch_page_with_total(db.events, query, EVENT_SORT, 10, cursor=first["next_cursor"])
+
+        assert first["total"] == second["total"] == 30
+        assert second["items"][0]["start_date"] == datetime(2024, 1, 1, 10)
+        # The cached total means the second page is a single find with no aggregate.
+        assert commands == ["find"]
+
+    from pymongo import monitoring
+
+    class Listener(monitoring.CommandListener):
+        def started(self, event):
+            if event.command_name in ("find", "aggregate", "count"):
+                commands.append(event.command_name)
+
+        def succeeded(self, event):
+            pass
+
+        def failed(self, event):
+            pass
+
+    run_db(scenario, event_listeners=[Listener()])
+
+
+def test_search_rejects_keyset_cursors():
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(fetch_search_page_with_total(None, {"$text": text_search_filter("jazz")}, EVENT_SORT, 10, cursor="abc"))
+    assert error.value.status_code == 400
+
+
+def test_search_pages_report_has_more_and_total(run_db):
+    async def scenario(db):
+        await reconcile_indexes(db)
+        await db.events.insert_many([
+            {"title": f"Jazz night {i}", "description": "Live", "start_date": datetime(2024, 1, 1)} for i in range(12)
+        ])
+        query = {"$text": text_search_filter("jazz")}
+
+        first = await fetch_search_page_with_total(db.events, query, EVENT_SORT, 10, total_mode="exact")
+        assert len(first["items"]) == 10 and first["has_more"] and first["total"] == 12
+        last = await fetch_search_page_with_total(db.events, query, EVENT_SORT, 10, offset=10)
+        assert len(last["items"]) == 2 and not last["has_more"] and last["total"] is None
+
+    run_db(scenario)
+
+
+def test_user_events_page_uses_the_shared_paginator(run_db):
+    async def scenario(db):
+        await db.events.insert_many([
+            {"organizer_id": "o1", "title": f"Event {i}", "start_date": datetime(2024, 1, 1) + timedelta(hours=i)}
+            for i in range(15)
+        ])
+
+        first = await get_user_events_page(db, "o1", limit=10, as_organizer=True)
+        assert first["total"] == 15 and first["has_more"]
+        second = await get_user_events_page(db, "o1", limit=10, cursor=first["next_cursor"], as_organizer=True)
+        assert [event["title"] for event in second["items"]] == [f"Event {i}" for i in range(10, 15)]
+        assert second["next_cursor"] is None
+
+    run_db(scenario)
@@ -0,0 +1,75 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("motor")
+
+from app.core import ratelimit  # noqa: E402
+from app.core.ratelimit import AdmissionControlMiddleware, MemoryRateLimitBackend, MongoRateLimitBackend  # noqa: E402
+
+
+def http_scope(path="/api/v1/users"):
+    return {"type": "http", "method": "GET", "path": path, "headers": [], "query_string": b"", "client": ("10.0.0.1", 1)}
+
+
+async def call(middleware, scope):
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        messages.append(message)
+
+    await middleware(scope, receive, send)
+    return messages[0]["status"]
+
+
+def test_mongo_backend_allows_capacity_then_limits(run_db):
+    async def scenario(db):
+        backend = MongoRateLimitBackend()
+        waits = [await backend.acquire("default:ip:1", 3, 0.01) for _ in range(4)]
+        assert waits[:3] == [0.0, 0.0, 0.0]
+        assert waits[3] > 0
+
+        bucket = await db.rate_limits.find_one({"_id": "default:ip:1"})
+        assert bucket["expires_at"] > bucket["updated_at"]
+
+    run_db(scenario)
+
+
+def test_mongo_backend_retries_racing_first_upserts(run_db):
+    async def scenario(db):
+        backend = MongoRateLimitBackend()
+        waits = await asyncio.gather(*(backend.acquire("auth:ip:2", 5, 0.01) for _ in range(20)))
+        assert sum(1 for wait in waits if wait == 0.0) == 5
+        assert await db.rate_limits.count_documents({}) == 1
+
+    run_db(scenario)
+
+
+def test_requests_waiting_on_the_limiter_hold_an_in_flight_slot(monkeypatch):
+    monkeypatch.setattr(ratelimit.settings, "RATE_LIMIT_ENABLED", True)
+    monkeypatch.setattr(ratelimit.settings, "MAX_IN_FLIGHT_REQUESTS", 1)
+    monkeypatch.setattr(ratelimit.settings, "RATE_LIMIT_RULES", {"default": (1, 0.001)})
+
+    class SlowBackend(MemoryRateLimitBackend):
+        async def acquire(self, *args, **kwargs):
+            await asyncio.sleep(0.01)
+            return await super().acquire(*args, **kwargs)
+
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    async def scenario():
+        middleware = AdmissionControlMiddleware(app, SlowBackend())
+        statuses = await asyncio.gather(call(middleware, http_scope()), call(middleware, http_scope()))
+        assert sorted(statuses) == [200, 503]
+        assert middleware.in_flight == 0
+
+        assert await call(middleware, http_scope()) == 429
+        assert middleware.in_flight == 0
+
+    asyncio.run(scenario())
@@ -0,0 +1,76 @@
+import asyncio
+import random
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("motor")
+
+from app.crud.rating import (  # noqa: E402
+    compute_rating_summaries,
+    get_rating_summary,
+    recompute_rating_summaries,
+)
+from app.crud.review import create_review, delete_review, update_review  # noqa: E402
+from app.models.review import ReviewCreate, ReviewUpdate  # noqa: E402
+
+AUTHOR = {"id": "u1", "username": "critic"}
+
+
+async def write_review(db, event_id, rating):
+    review = await create_review(db, AUTHOR, ReviewCreate(event_id=event_id, rating=rating))
+    return review["id"]
+
+
+async def rewrite_review(db, review_id, rating):
+    await update_review(db, review_id, ReviewUpdate(rating=rating))
+
+
+def test_concurrent_review_writes_keep_summary_consistent(run_db):
+    async def scenario(db):
+        event_id = str((await db.events.insert_one({"title": "Rated"})).inserted_id)
+        rng = random.Random(15)
+
+        ratings = [rng.randint(1, 5) for _ in range(200)]
+        review_ids = await asyncio.gather(*(write_review(db, event_id, rating) for rating in ratings))
+
+        changes = []
+        for review_id in review_ids[:100]:
+            # Several concurrent edits of the same review must each subtract
+            # the rating they actually replaced.
+            changes.extend(rewrite_review(db, review_id, rng.randint(1, 5)) for _ in range(3))
+        for review_id in review_ids[100:150]:
+            changes.extend(delete_review(db, review_id) for _ in range(2))
+        await asyncio.gather(*changes)
+
+        expected = (await compute_rating_summaries(db, [event_id]))[event_id]
+        summary = await get_rating_summary(db, event_id)
+        assert summary["ratings_count"] == expected["count"] == 150
+        assert summary["ratings_distribution"] == expected["distribution"]
+        assert summary["average_rating"] == round(expected["sum"] / expected["count"], 2)
+
+        report = await recompute_rating_summaries(db)
+        assert report["inconsistent"] == 0
+
+    run_db(scenario)
+
+
+def test_recompute_repairs_a_drifted_summary(run_db):
+    async def scenario(db):
+        event_id = str((await db.events.insert_one({"title": "Rated"})).inserted_id)
+        for rating in (5, 4, 4):
+            await write_review(db, event_id, rating)
+        await db.events.update_one({}, {"$inc": {"rating_summary.count": 3}})
+
+        assert (await recompute_rating_summaries(db))["inconsistent"] == 1
+        assert (await recompute_rating_summaries(db, repair=True))["repaired"] == 1
+        assert (await recompute_rating_summaries(db))["inconsistent"] == 0
+
+        summary = await get_rating_summary(db, event_id)
+        assert summary == {
+            "average_rating": 4.33,
+            "ratings_count": 3,
+            "ratings_distribution": {"1": 0, "2": 0, "3": 0, "4": 2, "5": 1},
+        }
+
+    run_db(scenario)
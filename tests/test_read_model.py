@@ -0,0 +1,92 @@
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("motor")
+
+from app.crud.category import update_category  # noqa: E402
+from app.crud.event import get_event, get_events_page  # noqa: E402
+from app.crud.user import update_user  # noqa: E402
+from app.db.read_model import check_read_model, wait_for_propagation  # noqa: E402
+from app.models.event import CategoryUpdate  # noqa: E402
+from app.models.user import UserUpdate  # noqa: E402
+
+
+async def seed(db):
+    now = datetime.utcnow()
+    user = await db.users.insert_one({"username": "organizer", "email": "o@example.com", "role": "organizer"})
+    venue = await db.venues.insert_one({"name": "Hall", "address": "Main 1", "city": "Paris"})
+    category = await db.categories.insert_one({"name": "Music"})
+    organizer_id, venue_id, category_id = str(user.inserted_id), str(venue.inserted_id), str(category.inserted_id)
+    event = await db.events.insert_one({
+        "title": "Concert",
+        "start_date": now,
+        "organizer_id": organizer_id,
+        "organizer": {"id": organizer_id, "username": "organizer", "full_name": None},
+        "venue_id": venue_id,
+        "venue": {"id": venue_id, "name": "Hall", "address": "Main 1", "city": "Paris"},
+        "category_id": category_id,
+        "category": {"id": category_id, "name": "Music"},
+        "created_at": now,
+        "updated_at": now,
+    })
+    return organizer_id, venue.inserted_id, str(event.inserted_id)
+
+
+def test_user_rename_reaches_event_reads(run_db):
+    async def scenario(db):
+        organizer_id, _, event_id = await seed(db)
+
+        await update_user(db, organizer_id, UserUpdate(full_name="Renamed Organizer"))
+        await wait_for_propagation()
+
+        event = await get_event(db, event_id)
+        assert event["organizer"]["full_name"] == "Renamed Organizer"
+        page = await get_events_page(db, {}, limit=10)
+        assert [item["id"] for item in page["items"]] == [event_id]
+        assert page["items"][0]["venue"]["name"] == "Hall"
+
+    run_db(scenario)
+
+
+def test_category_rename_reaches_event_reads(run_db):
+    async def scenario(db):
+        _, _, event_id = await seed(db)
+        category_id = str((await db.categories.find_one({}))["_id"])
+
+        await update_category(db, category_id, CategoryUpdate(name="Live Music"))
+        await wait_for_propagation()
+
+        event = await get_event(db, event_id)
+        assert event["category"] == {"id": category_id, "name": "Live Music"}
+        assert (await check_read_model(db))["inconsistent"] == 0
+
+    run_db(scenario)
+
+
+def test_events_without_embedded_refs_are_filled_on_read(run_db):
+    async def scenario(db):
+        _, _, event_id = await seed(db)
+        await db.events.update_many({}, {"$unset": {"venue": "", "category": ""}})
+
+        event = await get_event(db, event_id)
+        assert event["venue"]["city"] == "Paris"
+        assert event["category"]["name"] == "Music"
+
+    run_db(scenario)
+
+
+def test_repair_keeps_embedded_copy_of_deleted_reference(run_db):
+    async def scenario(db):
+        _, venue_oid, event_id = await seed(db)
+        await db.venues.delete_one({"_id": venue_oid})
+
+        report = await check_read_model(db, repair=True)
+        assert report["dangling"] == 1
+        assert report["inconsistent"] == 0
+
+        event = await get_event(db, event_id)
+        assert event["venue"]["name"] == "Hall"
+
+    run_db(scenario)
@@ -0,0 +1,89 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("motor")
+
+from pymongo.errors import OperationFailure, ServerSelectionTimeoutError  # noqa: E402
+
+from app import server  # noqa: E402
+from app.core import profiler, ratelimit  # noqa: E402
+from app.core.ratelimit import AdmissionControlMiddleware, MemoryRateLimitBackend  # noqa: E402
+from app.db import mongodb  # noqa: E402
+
+
+def test_warm_up_retries_operation_failures_and_preloads_references(monkeypatch):
+    monkeypatch.setattr(mongodb, "readiness", dict(mongodb.readiness, warm=False, indexes=False, reference=False))
+    monkeypatch.setattr(mongodb.settings, "READINESS_RECHECK_SECONDS", 0)
+    attempts = []
+
+    async def warm_up_pool():
+        attempts.append("pool")
+        if len(attempts) == 1:
+            raise OperationFailure("Authentication failed.", code=18)
+        mongodb.readiness["warm"] = True
+
+    async def check_required_indexes():
+        mongodb.readiness["indexes"] = True
+
+    async def preload_reference_caches():
+        assert mongodb.readiness["warm"] and mongodb.readiness["indexes"]
+        mongodb.readiness["reference"] = True
+
+    monkeypatch.setattr(mongodb, "warm_up_pool", warm_up_pool)
+    monkeypatch.setattr(mongodb, "check_required_indexes", check_required_indexes)
+    monkeypatch.setattr(mongodb, "preload_reference_caches", preload_reference_caches)
+
+    asyncio.run(mongodb._warm_up_until_ready())
+    assert attempts == ["pool", "pool"]
+    assert mongodb.is_ready()
+
+
+def test_health_checks_bypass_admission_control(monkeypatch):
+    monkeypatch.setattr(ratelimit.settings, "MAX_IN_FLIGHT_REQUESTS", 1)
+    paths = []
+
+    async def app(scope, receive, send):
+        paths.append(scope["path"])
+
+    async def scenario():
+        middleware = AdmissionControlMiddleware(app, MemoryRateLimitBackend())
+        middleware.in_flight = 1
+        for path in ("/health/live", "/health/ready"):
+            await middleware({"type": "http", "method": "GET", "path": path, "headers": []}, None, None)
+
+    asyncio.run(scenario())
+    assert paths == ["/health/live", "/health/ready"]
+
+
+def test_default_workers_ignores_invalid_web_concurrency(monkeypatch):
+    monkeypatch.setattr(server, "available_cpus", lambda: 3)
+    monkeypatch.setenv("WEB_CONCURRENCY", "auto")
+    assert server.default_workers(8) == 3
+    monkeypatch.setenv("WEB_CONCURRENCY", "5")
+    assert server.default_workers(8) == 5
+
+
+def test_profiler_starts_without_reaching_mongo(monkeypatch):
+    monkeypatch.setattr(profiler.settings, "PROFILER_ENABLED", True)
+    refreshes = []
+
+    async def unreachable(db):
+        refreshes.append(db)
+        raise ServerSelectionTimeoutError("no servers")
+
+    async def flush(db):
+        pass
+
+    monkeypatch.setattr(profiler, "refresh_profiling_control", unreachable)
+    monkeypatch.setattr(profiler, "flush_profiles", flush)
+
+    async def scenario():
+        await profiler.start_profiler()
+        assert refreshes == []
+        await asyncio.sleep(0)
+        assert len(refreshes) == 1
+        await profiler.stop_profiler()
+
+    asyncio.run(scenario())
@@ -0,0 +1,86 @@
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("motor")
+
+from pymongo import monitoring  # noqa: E402
+
+from app.crud import reference  # noqa: E402
+from app.crud.reference import ReferenceCache, reference_changed, refresh_reference_caches  # noqa: E402
+from app.crud.venue import create_venue  # noqa: E402
+from app.models.venue import VenueCreate  # noqa: E402
+
+
+class FindFilters(monitoring.CommandListener):
+    def __init__(self):
+        self.filters = []
+
+    def started(self, event):
+        if event.command_name == "find" and event.command.get("find") == "venues":
+            self.filters.append(event.command.get("filter", {}))
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+
+def fresh_venue_cache(monkeypatch):
+    cache = ReferenceCache("venues", ("name", "address", "city"))
+    monkeypatch.setitem(reference.reference_caches, "venues", cache)
+    return cache
+
+
+def test_name_lookup_misses_are_case_insensitive(run_db, monkeypatch):
+    async def scenario(db):
+        cache = fresh_venue_cache(monkeypatch)
+        await db.venues.insert_one({"name": "Grand Hall", "name_normalized": "grand hall", "city": "Paris"})
+
+        venue = await cache.get_by_name(db, "GRAND  hall")
+        assert venue["name"] == "Grand Hall"
+        assert cache.misses == 1
+        assert (await cache.get_by_name(db, "grand hall"))["id"] == venue["id"]
+        assert cache.hits == 1
+
+    run_db(scenario)
+
+
+def test_other_workers_changes_reload_only_changed_documents(run_db, monkeypatch):
+    listener = FindFilters()
+
+    async def scenario(db):
+        cache = fresh_venue_cache(monkeypatch)
+        venues = [await create_venue(db, VenueCreate(name=f"Venue {i}", address="Main", city="Paris")) for i in range(5)]
+        await refresh_reference_caches(db)
+        assert len(cache.by_id) == 5
+
+        # Another worker renames one venue and deletes another.
+        fresh_venue_cache(monkeypatch)
+        await db.venues.update_one({"name": "Venue 0"}, {"$set": {"name": "Renamed", "name_normalized": "renamed"}})
+        await reference_changed(db, "venues", [venues[0]["id"]])
+        await db.venues.delete_one({"name": "Venue 1"})
+        await reference_changed(db, "venues", [venues[1]["id"]])
+        monkeypatch.setitem(reference.reference_caches, "venues", cache)
+
+        listener.filters.clear()
+        await refresh_reference_caches(db)
+
+        assert listener.filters and all("_id" in query for query in listener.filters)
+        assert cache.by_id[venues[0]["id"]]["name"] == "Renamed"
+        assert venues[1]["id"] not in cache.by_id
+        assert "venue 0" not in cache.by_name and "renamed" in cache.by_name
+
+    run_db(scenario, event_listeners=[listener])
+
+
+def test_stop_waits_for_the_poller(run_db, monkeypatch):
+    async def scenario(db):
+        monkeypatch.setattr(reference.settings, "REFERENCE_CACHE_ENABLED", True)
+        fresh_venue_cache(monkeypatch)
+        await reference.start_reference_cache()
+        task = reference._poll_task
+        await reference.stop_reference_cache()
+        assert task.done() and reference._poll_task is None
+
+    run_db(scenario)
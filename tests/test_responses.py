@@ -0,0 +1,47 @@
+from datetime import datetime, timezone
+from typing import List, Union
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("orjson")
+
+import orjson  # noqa: E402
+from bson import ObjectId  # noqa: E402
+from pydantic import ValidationError  # noqa: E402
+
+from app.core import responses  # noqa: E402
+from app.core.responses import ORJSONResponse, compile_serializer, model_response  # noqa: E402
+from app.models.user import UserPublic  # noqa: E402
+
+CREATED_AT = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def fast_serialization(monkeypatch):
+    monkeypatch.setattr(responses.settings, "FAST_SERIALIZATION", True)
+
+
+def test_missing_required_field_fails_validation(fast_serialization):
+    document = {"id": "1", "username": "alice", "created_at": CREATED_AT}
+    with pytest.raises(ValidationError):
+        model_response(List[UserPublic], [document])
+
+
+def test_complete_documents_use_the_compiled_serializer(fast_serialization):
+    document = {"id": "1", "username": "alice", "role": "user", "created_at": CREATED_AT}
+    response = model_response(List[UserPublic], [document], headers={"X-Total-Count": "1"})
+    assert response.headers["x-total-count"] == "1"
+    assert orjson.loads(response.body)[0]["full_name"] is None
+
+
+def test_object_ids_are_rendered_as_strings():
+    object_id = ObjectId()
+    body = ORJSONResponse({"id": object_id, "tags": {"a"}}).body
+    assert orjson.loads(body) == {"id": str(object_id), "tags": ["a"]}
+
+
+def test_multi_member_unions_are_validated_by_pydantic():
+    assert compile_serializer(Union[int, str])("7") == "7"
+    with pytest.raises(ValidationError):
+        compile_serializer(Union[int, List[int]])("x")
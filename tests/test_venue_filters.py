@@ -0,0 +1,52 @@
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("motor")
+
+from app.core.deps import venue_filter_params  # noqa: E402
+from app.crud.venue import create_venue, update_venue  # noqa: E402
+from app.db.indexes import reconcile_indexes  # noqa: E402
+from app.models.venue import VenueCreate, VenueUpdate  # noqa: E402
+
+
+def plan_stages(plan):
+    if isinstance(plan, dict):
+        stages = [plan["stage"]] if "stage" in plan else []
+        for value in plan.values():
+            stages.extend(plan_stages(value))
+        return stages
+    if isinstance(plan, list):
+        return [stage for item in plan for stage in plan_stages(item)]
+    return []
+
+
+async def filter_venues(db, **params):
+    defaults = {"city": None, "country": None, "min_capacity": None, "search": None, "location_match": "contains"}
+    query = await venue_filter_params(**{**defaults, **params})
+    names = sorted([venue["name"] async for venue in db.venues.find(query)])
+    explain = await db.venues.find(query).explain()
+    return names, plan_stages(explain["queryPlanner"]["winningPlan"])
+
+
+def test_venue_filters_use_lookup_indexes(run_db):
+    async def scenario(db):
+        await reconcile_indexes(db)
+        await create_venue(db, VenueCreate(name="Arena", address="Main 1", city="Санкт-Петербург", country="Россия"))
+        await create_venue(db, VenueCreate(name="Olympia", address="Rue 2", city="Paris", country="France"))
+        moved = await create_venue(db, VenueCreate(name="Club", address="Side 3", city="Moscow", country="Россия"))
+        await update_venue(db, moved["id"], VenueUpdate(city="Café Paris"))
+
+        cases = [
+            ({"city": "петербург"}, ["Arena"]),
+            ({"city": "paris"}, ["Club", "Olympia"]),
+            ({"city": "CAFE", "location_match": "prefix"}, ["Club"]),
+            ({"country": "россия", "location_match": "exact"}, ["Arena", "Club"]),
+            ({"country": "France", "city": "par", "location_match": "prefix"}, ["Olympia"]),
+        ]
+        for params, expected in cases:
+            names, stages = await filter_venues(db, **params)
+            assert names == expected, params
+            assert "COLLSCAN" not in stages, params
+            assert "IXSCAN" in stages, params
+
+    run_db(scenario)